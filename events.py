@@ -3,46 +3,33 @@
 from lib.lightbox_functionality import my_lightbox
 
 # Sets variables
-my_lightbox.max_button_count = 5
+my_lightbox.max_button_count = 6
 # Make your own functiones!
 
+# What should the matrix do? One event per button count, every event runs until the button is pressed
+EVENTS = {
+    1: lambda: my_lightbox.show_clock((255,255,255)),
+    2: lambda: my_lightbox.show_info(),
+    3: lambda: my_lightbox.show_rainbow_effects(10), # Playlist of effects, 10 seconds each
+    4: lambda: my_lightbox.show_smileys(10),
+    5: lambda: my_lightbox.show_images_ppm("/images", 5), # Displays the uploaded images
+    6: lambda: my_lightbox.show_weather_clock((255,255,255)), # The clock on top of the weather icon
+}
+
 def event_loop():
     # sycles through the event loop indeffinently
     button_count = my_lightbox.button_count
-        
-    
-    # What should the matrix do?
-    if button_count == 1:
-        print(f"Button count is: {button_count}")
-        my_lightbox.run = True
-        my_lightbox.show_clock((255,255,255))
 
-    elif button_count == 2:
-        print(f"Button count is: {button_count}")
-        my_lightbox.run = True
-        my_lightbox.show_info()
-         
-    elif button_count == 3:
-        print(f"Button count is: {button_count}")
+    # Enters when in sleep mode, the next button press stops the wait in start_event_loop
+    if button_count == 0:
         my_lightbox.run = True
-        my_lightbox.show_rainbow_effects(10)
+        return
 
-    elif button_count == 4:
-        print(f"Button count is: {button_count}")
-        my_lightbox.run = True
-        my_lightbox.show_smileys(10)
-         
-    # Displays the different PPM P3 images
-    elif button_count == 5:
-        print(f"Button count is: {button_count}")
-        my_lightbox.run = True
-        my_lightbox.show_images_ppm("/images", 5)
-        
-    # Enters when in sleep mode
-    elif button_count == 0:
-         pass
-    
     # Error handling
-    else:
+    if button_count not in EVENTS:
         print("error. button_count out of range")
-        return "button_count_error"    
\ No newline at end of file
+        return "button_count_error"
+
+    print(f"Button count is: {button_count}")
+    my_lightbox.run = True
+    EVENTS[button_count]()
@@ -1,30 +1,12 @@
-import machine
 import ntptime
+import time_service
 from lib.pico_system import get_json_data
 
-def add_timezone_offset(timezone_offset: int) -> None:
-    """ Add time offset to the RTC """
-
-    # Get the current time from the RTC
-    rtc = machine.RTC()
-    year, month, day, weekday, hours, minutes, seconds, subseconds = rtc.datetime()
-
-    # Apply timezone offset
-    hours += timezone_offset // 3600
-    minutes += (timezone_offset % 3600) // 60
-
-    if minutes >= 60:
-        minutes -= 60
-        hours += 1
-    if hours >= 24:
-        hours -= 24
-        day += 1
-
-    # Set the adjusted time back to the RTC
-    rtc.datetime((year, month, day, weekday, hours, minutes, seconds, subseconds))
-
 def set_time() -> None:
-    """ Sets the realtime clock to the time of the current position """
+    """
+    Sets the realtime clock to UTC and the time service to the timezone of the current position.
+    The RTC is left at UTC, time_service.localtime() adds the offset.
+    """
     
     # Get timezone offset
     json_data = get_json_data("data/setup.json")
@@ -35,6 +17,7 @@ def set_time() -> None:
 
     # Synchronize time with an NTP server
     ntptime.settime()
-    
-    # Set the RTC
-    add_timezone_offset(delta)
\ No newline at end of file
+
+    # Count from the new UTC time
+    time_service.sync()
+    time_service.set_offset(delta)
\ No newline at end of file
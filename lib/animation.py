@@ -0,0 +1,110 @@
+"""
+Animation engine for the effects on the matrix.
+
+An effect is a generator that draws a frame to the matrix buffer and yields:
+- yield           -> show the frame, the next one comes after one frame time (1 / fps)
+- yield 250       -> show the frame and keep it for 250 ms
+
+The Animator shows the frames on fixed deadlines (ticks_us), so the speed of an effect does not depend
+on how long a frame takes to draw. It sleeps on matrix.stop_event, so a button press (matrix.run set to
+False) stops the effect within a few milliseconds, the generator is closed so it can clean up in a finally block.
+
+A Playlist plays effects after each other, every effect for a set time.
+"""
+
+import utime as time
+
+class Animator:
+    """
+    Runs effect generators on a matrix.
+
+    Atributes:
+    - matrix: the Matrix_fun to show the frames on.
+    - fps: default frame rate cap, 0 for as fast as possible.
+    - drop_frames: if the effect is late, skip show() for up to max_drop frames to catch up.
+    - frames_shown, frames_dropped: counters for all effects played.
+    """
+
+    def __init__(self, matrix, fps:int=60, drop_frames:bool=True, max_drop:int=2) -> None:
+        self.matrix = matrix
+        self.fps = fps
+        self.drop_frames = drop_frames
+        self.max_drop = max_drop
+        self.frames_shown = 0
+        self.frames_dropped = 0
+
+    def sleep_until(self, deadline:int) -> bool:
+        """ Sleeps until a ticks_us deadline, returns False as soon as the event is stopped (matrix.run False) """
+        return not self.matrix.stop_event.wait_until(deadline)
+
+    def play(self, effect, duration:float=None, frames:int=None, fps:int=None) -> bool:
+        """
+        Plays an effect generator until it ends, for duration seconds or for a number of frames.
+        Returns False if it was stopped (matrix.run set to False), True if the effect ended or the
+        duration or number of frames is over.
+        """
+        fps = self.fps if fps is None else fps
+        frame_us = 1_000_000 // fps if fps else 0
+        start = time.ticks_us()
+        end = time.ticks_add(start, int(duration * 1_000_000)) if duration is not None else None
+        deadline = start
+        count = 0
+        dropped = 0
+
+        try:
+            for hold in effect:
+                if not self.matrix.run:
+                    return False
+
+                # Show the frame, unless it is late and can be dropped (frames that are held are always shown)
+                now = time.ticks_us()
+                if (hold is None and self.drop_frames and frame_us and dropped < self.max_drop
+                        and time.ticks_diff(now, deadline) > frame_us):
+                    dropped += 1
+                    self.frames_dropped += 1
+                else:
+                    self.matrix.show()
+                    dropped = 0
+                    self.frames_shown += 1
+
+                # Fixed timestep, if the effect is far behind it continues from now instead of catching up
+                deadline = time.ticks_add(deadline, frame_us if hold is None else int(hold) * 1000)
+                if time.ticks_diff(now, deadline) > frame_us * (self.max_drop + 1):
+                    deadline = now
+
+                count += 1
+                if end is not None and time.ticks_diff(deadline, end) >= 0:
+                    return self.sleep_until(end)
+                if not self.sleep_until(deadline):
+                    return False
+                if frames is not None and count >= frames:
+                    return True
+            return True
+        finally:
+            effect.close()
+
+class Playlist:
+    """
+    Effects played after each other, over and over while matrix.run is True.
+
+    items: list of (effect, seconds, fps). effect is a function that returns a new generator, it is
+    started again if it ends before its time is up. fps None uses the animator default.
+    """
+
+    def __init__(self, items:list) -> None:
+        self.items = items
+
+    def play(self, animator, loop:bool=True) -> None:
+        matrix = animator.matrix
+        while matrix.run:
+            for effect, seconds, fps in self.items:
+                matrix.clear()
+                start = time.ticks_ms()
+                while matrix.run:
+                    remaining = seconds - time.ticks_diff(time.ticks_ms(), start) / 1000
+                    if remaining <= 0 or not animator.play(effect(), remaining, fps=fps):
+                        break
+                if not matrix.run:
+                    return
+            if not loop:
+                return
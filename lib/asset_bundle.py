@@ -0,0 +1,93 @@
+"""
+Asset bundle (.lbb file, made by tools/make_bundle.py): all the figures in one file.
+
+Opening a file on the flash file system costs much more than reading from a file that is already
+open, so the bundle is opened once and an image is one seek() and one readinto() into its buffer.
+Only the index is kept in RAM.
+
+Assets are named by their path in figures/ without the extension, "weather_icons/sun", "thermostat".
+
+File format, little endian:
+- header: b"LBB1", number of assets (u16), reserved (u16, 0)
+- index: one entry per asset sorted by name: data offset from the start of the file (u32), width (u8),
+  height (u8), length of the name (u8), then the name (UTF-8)
+- data: the pixels of every image, like in a .lbi file (u32 buffer values, row by row from the top row)
+"""
+
+import struct
+from image_file import Image
+
+FIGURE_DIR = "/figures"
+BUNDLE_PATH = "/figures/figures.lbb"
+
+HEADER = "<4sHH"
+HEADER_SIZE = 8
+ENTRY = "<IBBB"
+ENTRY_SIZE = 7
+
+_bundles = {} # path: Asset_bundle, or None if there is no such file
+
+class Asset_bundle:
+    """
+    An open bundle file.
+
+    Atributes:
+    - path: the bundle file.
+    - count: number of assets.
+    """
+
+    def __init__(self, path:str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        magic, self.count, _ = struct.unpack(HEADER, self._file.read(HEADER_SIZE))
+        if magic != b"LBB1":
+            self._file.close()
+            raise ValueError(f"not an asset bundle: {path}")
+
+        # Name: (offset, width, height), read once
+        self._index = {}
+        for _ in range(self.count):
+            offset, width, height, length = struct.unpack(ENTRY, self._file.read(ENTRY_SIZE))
+            self._index[self._file.read(length).decode()] = (offset, width, height)
+
+    def __contains__(self, name:str) -> bool:
+        return name in self._index
+
+    def names(self, prefix:str="") -> list:
+        """ Names of the assets starting with prefix (a folder is "emojis/"), sorted """
+        return sorted(name for name in self._index if name.startswith(prefix))
+
+    def image(self, name:str, image:Image=None) -> Image:
+        """
+        Reads an image. Give image to load into its buffer instead of allocating a new one.
+        Raises KeyError if the bundle does not have it.
+        """
+        offset, width, height = self._index[name]
+        if image is not None and len(image.words) >= width * height:
+            image.width, image.height = width, height
+        else:
+            image = Image(width, height)
+        self._file.seek(offset)
+        self._file.readinto(memoryview(image.words)[:width * height])
+        return image
+
+    def close(self) -> None:
+        self._file.close()
+
+def open_bundle(path:str=None):
+    """ Returns the bundle file at path (BUNDLE_PATH by default), it is opened the first time. None if there is no bundle """
+    if path is None:
+        path = BUNDLE_PATH
+    if path not in _bundles:
+        try:
+            _bundles[path] = Asset_bundle(path)
+        except OSError:
+            _bundles[path] = None
+    return _bundles[path]
+
+def close_bundles() -> None:
+    """ Closes the open bundles, the next open_bundle() opens the file again (after it is rebuilt) """
+    for bundle in _bundles.values():
+        if bundle is not None:
+            bundle.close()
+    _bundles.clear()
@@ -0,0 +1,183 @@
+"""
+Binary bitmap fonts (.lbf files, made by tools/make_font.py).
+
+A font is opened when it is first used, and only its index is kept in RAM. Glyphs are read from the
+file when they are drawn and kept in a small LRU cache.
+
+File format, little endian:
+- header: b"LBF1", height (u8), number of glyphs (u16), flags (u8, bit 0: columns are 2 bytes)
+- index: one entry per glyph sorted by code point: code point (u16), data offset (u16), width (u8)
+- data: the columns of every glyph, one mask per column, bit 0 is the bottom row
+
+Code points are Unicode, so any character of a (UTF-8 decoded) string can be looked up. Several
+index entries can point to the same data, the generator uses that for upper case letters.
+
+A font can also be the bytes of a .lbf file frozen into the firmware (see frozen_assets.py), then the
+glyphs are used where they are instead of being read.
+"""
+
+import struct
+import array
+import frozen_assets
+
+FONT_DIR = "/fonts"
+
+HEADER = "<4sBHB"
+HEADER_SIZE = 8
+ENTRY = "<HHB"
+ENTRY_SIZE = 5
+WIDE = 1
+
+_fonts = {} # height: Bitmap_font
+
+class Bitmap_font:
+    """
+    A font file with glyphs loaded on demand, or the bytes of a font file (data).
+
+    Atributes:
+    - height: rows of the glyphs (accents may use the rows above).
+    - count: number of glyphs in the file.
+    - wide: True if the column masks are array("H"), False if they are bytearrays.
+    """
+
+    def __init__(self, path:str=None, cache_size:int=16, data=None) -> None:
+        self._file = None
+        self._data = None
+        if data is not None:
+            self._data = memoryview(data)
+            header = self._data[:HEADER_SIZE]
+        else:
+            self._file = open(path, "rb")
+            header = self._file.read(HEADER_SIZE)
+        magic, self.height, self.count, flags = struct.unpack(HEADER, header)
+        if magic != b"LBF1":
+            self.close()
+            raise ValueError(f"not a font file: {path}")
+
+        self.wide = bool(flags & WIDE)
+        self._data_start = HEADER_SIZE + self.count * ENTRY_SIZE
+        if self._data is not None:
+            self._index = self._data[HEADER_SIZE:self._data_start]
+        else:
+            self._index = self._file.read(self.count * ENTRY_SIZE)
+
+        # LRU cache, the most recently used code point is last in _order
+        self.cache_size = cache_size
+        self._cache = {}
+        self._order = []
+
+    def _find(self, code:int) -> int:
+        """ Binary search in the index, returns the entry number or -1 """
+        low, high = 0, self.count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            found = struct.unpack_from("<H", self._index, middle * ENTRY_SIZE)[0]
+            if found == code:
+                return middle
+            if found < code:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return -1
+
+    def glyph(self, char):
+        """ Returns the column masks of a character (str or code point), None if the font does not have it """
+        code = char if isinstance(char, int) else ord(char)
+        masks = self._cache.get(code)
+        if masks is not None:
+            if self._order[-1] != code:
+                self._order.remove(code)
+                self._order.append(code)
+            return masks
+
+        entry = self._find(code)
+        if entry < 0:
+            return None
+
+        _, offset, width = struct.unpack_from(ENTRY, self._index, entry * ENTRY_SIZE)
+        if self._data is not None:
+            # Narrow columns are used in place, wide ones are copied to an array("H")
+            start = self._data_start + offset
+            if self.wide:
+                masks = array.array("H", bytes(self._data[start:start + width * 2]))
+            else:
+                masks = self._data[start:start + width]
+        else:
+            masks = array.array("H", bytes(width * 2)) if self.wide else bytearray(width)
+            self._file.seek(self._data_start + offset)
+            self._file.readinto(masks)
+
+        # Store, drop the least recently used glyph if the cache is full
+        if len(self._order) >= self.cache_size:
+            del self._cache[self._order.pop(0)]
+        self._cache[code] = masks
+        self._order.append(code)
+        return masks
+
+    def text_width(self, text:str) -> int:
+        """ Width of a text drawn proportionally, one empty column between the glyphs """
+        width = 0
+        for char in text:
+            masks = self.glyph(char)
+            width += (len(masks) if masks is not None else self.height // 2) + 1
+        return max(width - 1, 0)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._cache = {}
+        self._order = []
+
+def load_font(height:int=5) -> Bitmap_font:
+    """ Returns the font with glyphs of this height, it is opened the first time. A frozen font is used if there is one """
+    font = _fonts.get(height)
+    if font is None:
+        data = frozen_assets.FONTS.get(height)
+        if data is not None:
+            font = Bitmap_font(data=data)
+        else:
+            font = Bitmap_font(f"{FONT_DIR}/font_{height}.lbf")
+        _fonts[height] = font
+    return font
+
+class Text_strip:
+    """
+    A text rendered once to column masks, for scrolling. Drawing it costs the same for any text length.
+
+    spacing: columns per character, like show_text has always placed them (5). None places the glyphs
+    proportionally with one empty column between them.
+
+    Atributes:
+    - masks: one mask per column, bit 0 is the bottom row (bytearray, or array("H") for wide fonts).
+    - width: number of columns.
+    """
+
+    def __init__(self, text:str, spacing:int=5, font:Bitmap_font=None) -> None:
+        if font is None:
+            font = load_font()
+
+        # Place the glyphs first, then copy them to the strip
+        glyphs = []
+        x = 0
+        for char in text:
+            masks = font.glyph(char)
+            glyphs.append((x, masks))
+            if spacing is not None:
+                x += spacing
+            else:
+                x += (len(masks) if masks is not None else font.height // 2) + 1 # Unknown characters are a space
+        self.width = x if spacing is not None else max(x - 1, 0)
+
+        self.masks = array.array("H", bytes(self.width * 2)) if font.wide else bytearray(self.width)
+        for x, masks in glyphs:
+            if masks is None:
+                continue
+            for c in range(min(len(masks), self.width - x)):
+                self.masks[x + c] |= masks[c]
+
+    def draw(self, matrix_obj, x:int, y:int, color) -> None:
+        """ Draws the part of the strip that is on the matrix, x is the screen column of the first strip column """
+        first = max(0, -x)
+        count = min(self.width, matrix_obj.MATRIX_WIDTH - x) - first
+        if count > 0:
+            matrix_obj.blit_mask(x + first, y, self.masks, first, count, color)
@@ -0,0 +1,79 @@
+"""
+Framebuf canvas for the LED matrix: draw with the C functions of framebuf.FrameBuffer, then
+convert the result to the matrix buffer in show(). On a computer framebuf_shim.py stands in for framebuf.
+"""
+
+import array
+
+try:
+    import framebuf
+except ImportError:
+    # Not running on MicroPython
+    import framebuf_shim as framebuf
+
+RGB565 = framebuf.RGB565
+GS8 = framebuf.GS8
+
+class Canvas:
+    """
+    Drawing surface for the LED matrix backed by a framebuf.FrameBuffer, so lines, rectangles,
+    text and blits run in C. Attach it with Matrix_fun.use_canvas(), the content is converted to
+    the matrix buffer once every show().
+
+    Framebuf coordinates: (0, 0) is the top left corner, y grows downwards.
+
+    Atributes:
+    - fb: the FrameBuffer to draw on.
+    - format: RGB565 or GS8. GS8 pixels are indexes into palette.
+    - palette: array("I") with 256 buffer values (GRB) for GS8.
+    """
+
+    def __init__(self, width:int, height:int, format:int=RGB565, palette=None) -> None:
+        self.width = width
+        self.height = height
+        self.format = format
+        self.buffer = bytearray(width * height * (2 if format == RGB565 else 1))
+        self.fb = framebuf.FrameBuffer(self.buffer, width, height, format)
+
+        if format == GS8:
+            self.palette = palette if palette is not None else array.array("I", [0 for _ in range(256)])
+        else:
+            self.palette = None
+
+        # RGB565 is stored low byte first: GGGBBBBB RRRRRGGG. The 8 bit channels of
+        # each byte do not overlap, so every byte has its own 256 entry table.
+        if format == RGB565:
+            self._low = array.array("I", [((i >> 5) << 18) | ((i & 31) << 3) | ((i & 31) >> 2) for i in range(256)])
+            self._high = array.array("I", [((i & 7) << 21) | (((i & 7) >> 1) << 16) | ((i >> 3) << 11) | ((i >> 5) << 8) for i in range(256)])
+
+    def color(self, color) -> int:
+        """ Returns the RGB565 value of an RGB tuple """
+        r, g, b = color
+        return ((int(r) & 0xf8) << 8) | ((int(g) & 0xfc) << 3) | (int(b) >> 3)
+
+    def set_palette(self, index:int, color) -> None:
+        """ Sets a GS8 palette entry to an RGB tuple """
+        r, g, b = color
+        self.palette[index] = (int(r) << 8) | (int(g) << 16) | int(b)
+
+    def render(self, matrix) -> None:
+        """ Converts the canvas to the matrix buffer, top row of the canvas is the top row of the matrix """
+        np = matrix.np
+        xy = matrix._xy
+        buffer = self.buffer
+        width = min(self.width, matrix.MATRIX_WIDTH)
+        height = min(self.height, matrix.MATRIX_HEIGHT)
+
+        for y in range(height):
+            row = (matrix.MATRIX_HEIGHT - 1 - y) * matrix.MATRIX_WIDTH
+            i = y * self.width
+            if self.format == RGB565:
+                low, high = self._low, self._high
+                j = i * 2
+                for x in range(width):
+                    np[xy[row + x]] = low[buffer[j]] | high[buffer[j + 1]]
+                    j += 2
+            else:
+                palette = self.palette
+                for x in range(width):
+                    np[xy[row + x]] = palette[buffer[i + x]]
@@ -0,0 +1,43 @@
+"""
+Lookup tables for the rainbow effects, built the first time they are needed and shared after that.
+
+- wheel(): the color wheel, 256 positions
+- wheel_words(): the color wheel as buffer values (GRB), 512 entries (the 256 colors twice) so a run
+  starting at any phase can be read without wrapping
+- degree_tables(): cos and sin of every whole degree * 1000, the integer math of the rainbow spiral
+"""
+
+import array
+from math import cos as _cos, sin as _sin, radians as _radians
+
+_wheel = None
+_degrees = None
+
+def wheel(pos):
+    """Generate rainbow colors across 0-255 positions"""
+    if pos < 85:
+        return (pos * 3, 255 - pos * 3, 0)
+    elif pos < 170:
+        pos -= 85
+        return (255 - pos * 3, 0, pos * 3)
+    else:
+        pos -= 170
+        return (0, pos * 3, 255 - pos * 3)
+
+def wheel_words():
+    """ Returns the color wheel of wheel() as an array("I") of 512 buffer values """
+    global _wheel
+    if _wheel is None:
+        _wheel = array.array("I", bytes(512 * 4))
+        for pos in range(256):
+            r, g, b = wheel(pos)
+            _wheel[pos] = _wheel[pos + 256] = (g << 16) | (r << 8) | b
+    return _wheel
+
+def degree_tables():
+    """ Returns (cos, sin), two array("h") with int(1000 * cos(angle)) and int(1000 * sin(angle)) for 0-359 degrees """
+    global _degrees
+    if _degrees is None:
+        _degrees = (array.array("h", [int(1000 * _cos(_radians(angle))) for angle in range(360)]),
+                    array.array("h", [int(1000 * _sin(_radians(angle))) for angle in range(360)]))
+    return _degrees
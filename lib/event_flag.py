@@ -0,0 +1,61 @@
+"""
+Event flag shared between the two cores.
+
+Core0 (server, button interrupts) sets the flag to stop what core1 is showing, core1 sleeps on it with
+wait() instead of polling a variable in a loop. The flag is a _thread lock, so setting and clearing it is
+atomic on both cores, and set() never blocks, it can be called from an interrupt handler.
+
+The lock of MicroPython has no timeout, so wait() sleeps in short slices of POLL_US and checks the flag
+between them. A set() is seen within one slice, which is much shorter than a frame.
+"""
+
+import _thread
+import utime as time
+
+POLL_US = 5_000 # Longest sleep before the flag is checked again
+
+class Event_flag:
+    """
+    Flag that one core sets and the other waits for, like threading.Event.
+
+    Atributes:
+    - wakeups: number of waits that ended because the flag was set.
+    """
+
+    def __init__(self) -> None:
+        self._lock = _thread.allocate_lock() # Locked = set
+        self.wakeups = 0
+
+    def set(self) -> None:
+        """ Sets the flag, never blocks """
+        self._lock.acquire(0)
+
+    def clear(self) -> None:
+        """ Clears the flag """
+        try:
+            self._lock.release()
+        except RuntimeError:
+            pass # Was not set
+
+    def is_set(self) -> bool:
+        return self._lock.locked()
+
+    def wait_until(self, deadline:int) -> bool:
+        """ Sleeps until a ticks_us deadline. Returns True as soon as the flag is set, False at the deadline """
+        lock = self._lock
+        while not lock.locked():
+            remaining = time.ticks_diff(deadline, time.ticks_us())
+            if remaining <= 0:
+                return False
+            time.sleep_us(min(remaining, POLL_US))
+        self.wakeups += 1
+        return True
+
+    def wait(self, timeout_ms:int=None) -> bool:
+        """ Sleeps for up to timeout_ms (forever if None). Returns True as soon as the flag is set """
+        if timeout_ms is None:
+            while not self._lock.locked():
+                time.sleep_us(POLL_US)
+            self.wakeups += 1
+            return True
+        return self.wait_until(time.ticks_add(time.ticks_us(), int(timeout_ms * 1000)))
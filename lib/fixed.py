@@ -0,0 +1,53 @@
+"""
+Integer math for the effects. The Pico has no floating point unit, so floats are slow there.
+
+- Angles are in 1/256 of a turn (0-255, wraps around), as the particle directions use them.
+- Q8 values have 256 as 1.0: sin() and cos() return -256 to 256, a factor of 128 is one half.
+- Colors are buffer values (GRB words, see Matrix.pack_color()) or (r, g, b) tuples.
+
+The table is computed once when the module is imported, the functions only use integers.
+Accuracy against math is shown by tools/benchmark.py fixed.
+"""
+
+import array
+from math import sin as _sin, pi
+
+ONE = 256 # 1.0 in Q8
+
+# sin of the angles 0 to 64 (a quarter turn), Q8
+_SIN = array.array("h", [int(_sin(i * pi / 128) * ONE + 0.5) for i in range(65)])
+
+def sin(angle:int) -> int:
+    """ sin of an angle in 1/256 turns, Q8 """
+    angle &= 0xff
+    if angle < 64:
+        return _SIN[angle]
+    if angle < 128:
+        return _SIN[128 - angle]
+    if angle < 192:
+        return -_SIN[angle - 128]
+    return -_SIN[256 - angle]
+
+def cos(angle:int) -> int:
+    """ cos of an angle in 1/256 turns, Q8 """
+    return sin(angle + 64)
+
+def scale(value:int, factor:int) -> int:
+    """ value * factor / 256, a factor of 256 keeps the value """
+    return value * factor >> 8
+
+def scale_rgb(color, factor:int) -> tuple:
+    """ An (r, g, b) color with every channel scaled by a Q8 factor """
+    r, g, b = color
+    return (int(r) * factor >> 8, int(g) * factor >> 8, int(b) * factor >> 8)
+
+def scale_word(word:int, factor:int) -> int:
+    """ A buffer value with every channel scaled by a Q8 factor (0-256) """
+    return ((((word >> 16) & 0xff) * factor >> 8) << 16) | ((((word >> 8) & 0xff) * factor >> 8) << 8) | ((word & 0xff) * factor >> 8)
+
+def blend_word(top:int, below:int, alpha:int) -> int:
+    """ Mixes two buffer values, alpha 256 gives top, 0 gives below """
+    inverse = 256 - alpha
+    return (((((top >> 16) & 0xff) * alpha + ((below >> 16) & 0xff) * inverse) >> 8) << 16
+            | ((((top >> 8) & 0xff) * alpha + ((below >> 8) & 0xff) * inverse) >> 8) << 8
+            | ((top & 0xff) * alpha + (below & 0xff) * inverse) >> 8)
@@ -0,0 +1,142 @@
+"""
+Recorded effects (.lfr files), made with record() or on the computer with tools/record_effect.py.
+
+Playing a recorded effect costs one file read and one kernels.xor_delta() per frame, however heavy
+the effect was to compute. Frames are read one by one into a buffer of the size of the largest frame.
+
+File format, little endian:
+- header: b"LFR1", width (u8), height (u8), number of frames (u16), largest frame in bytes (u16),
+  offset of the frame table (u32)
+- frames: one delta per frame, in order (see kernels.py for the runs). A keyframe is a delta from a
+  black frame, the other frames are deltas from the frame before, so only the changed pixels are stored
+- frame table: one entry per frame: data offset (u32), length (u16, bit 15 set for keyframes),
+  time to show the frame in ms (u16)
+
+The first frame is always a keyframe, so the effect can be looped.
+"""
+
+import struct
+import array
+import kernels
+
+HEADER = "<4sBBHHI"
+HEADER_SIZE = 14
+ENTRY = "<IHH"
+ENTRY_SIZE = 8
+KEYFRAME = 0x8000
+
+def encode_delta(frame, previous=None) -> bytearray:
+    """ Delta from previous to frame (words in LED order), from a black frame if previous is None """
+    delta = bytearray()
+    count = len(frame)
+    i = 0
+    while i < count:
+        # Unchanged words, skipped in runs of up to 128
+        start = i
+        while i < count and frame[i] == (previous[i] if previous is not None else 0):
+            i += 1
+        if i == count:
+            break
+        while i - start > 0:
+            run = min(i - start, 128)
+            delta.append(run - 1)
+            start += run
+
+        # Changed words in runs of up to 128, each XORed with the same word of the previous frame
+        start = i
+        while i < count and i - start < 128 and frame[i] != (previous[i] if previous is not None else 0):
+            i += 1
+        delta.append(0x80 + i - start - 1)
+        for j in range(start, i):
+            value = frame[j] ^ (previous[j] if previous is not None else 0)
+            delta.append((value >> 16) & 0xff)
+            delta.append((value >> 8) & 0xff)
+            delta.append(value & 0xff)
+    return delta
+
+def record(matrix, effect, path:str, frames:int=None, fps:int=30, keyframe_every:int=64) -> int:
+    """
+    Records an effect generator (see animation.py) to a frame file, returns the number of frames.
+    The effect runs as fast as it can, held frames keep their time, the others get 1 / fps.
+    Stops after frames frames, or when the effect ends.
+    """
+    frame_ms = 1000 // fps
+    previous = None
+    table = bytearray()
+    count = largest = 0
+    offset = HEADER_SIZE
+
+    with open(path, "wb") as file:
+        file.write(bytes(HEADER_SIZE))
+        try:
+            for hold in effect:
+                delta = encode_delta(matrix.np)
+                length = len(delta) | KEYFRAME
+                if count % keyframe_every and previous is not None:
+                    changes = encode_delta(matrix.np, previous)
+                    if len(changes) < len(delta): # A keyframe if the delta would not be smaller
+                        delta, length = changes, len(changes)
+
+                file.write(delta)
+                table += struct.pack(ENTRY, offset, length, frame_ms if hold is None else int(hold))
+                offset += len(delta)
+                largest = max(largest, len(delta))
+                previous = array.array("I", matrix.np)
+
+                count += 1
+                if frames is not None and count >= frames:
+                    break
+        finally:
+            effect.close()
+
+        file.write(table)
+        file.seek(0)
+        file.write(struct.pack(HEADER, b"LFR1", matrix.MATRIX_WIDTH, matrix.MATRIX_HEIGHT, count, largest, offset))
+    return count
+
+class Frame_file:
+    """
+    A recorded effect, played with the effect() generator.
+
+    Atributes:
+    - width, height: matrix size it was recorded on.
+    - count: number of frames.
+    - duration_ms: time of one run through all the frames.
+    """
+
+    def __init__(self, path:str) -> None:
+        self._file = open(path, "rb")
+        magic, self.width, self.height, self.count, largest, table = struct.unpack(HEADER, self._file.read(HEADER_SIZE))
+        if magic != b"LFR1":
+            self._file.close()
+            raise ValueError(f"not a frame file: {path}")
+
+        self._file.seek(table)
+        self._table = self._file.read(self.count * ENTRY_SIZE)
+        self._buffer = bytearray(largest)
+        self._params = array.array("i", [0])
+        self.duration_ms = sum(struct.unpack_from(ENTRY, self._table, i * ENTRY_SIZE)[2] for i in range(self.count))
+
+    def effect(self, matrix, loop:bool=True):
+        """ Effect generator showing the frames on the matrix, over and over if loop is True """
+        if (self.width, self.height) != (matrix.MATRIX_WIDTH, matrix.MATRIX_HEIGHT):
+            raise ValueError(f"recorded on a {self.width}x{self.height} matrix")
+
+        buffer = memoryview(self._buffer)
+        while True:
+            self._file.seek(HEADER_SIZE) # The frames are stored in order, no seek until the next loop
+            for i in range(self.count):
+                _, length, hold = struct.unpack_from(ENTRY, self._table, i * ENTRY_SIZE)
+                if length & KEYFRAME:
+                    length &= ~KEYFRAME
+                    kernels.fill_words(matrix.np, 0, 0, matrix.numpix)
+
+                self._file.readinto(buffer[:length])
+                self._params[0] = length
+                kernels.xor_delta(matrix.np, buffer, self._params)
+                yield hold
+            if not loop:
+                return
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,127 @@
+"""
+Pure Python version of the parts of MicroPython's framebuf module used by canvas.py.
+Lets the same drawing code run on a computer, on the Pico the built-in (C) module is used.
+
+Supports the RGB565 and GS8 formats. text() draws with the Lightbox font (bitmap_font.py) instead of
+the built-in 8x8 font, the characters are 8 pixels apart like there but only 5 rows high.
+"""
+
+from bitmap_font import load_font
+
+# Same values as MicroPython
+MONO_VLSB = 0
+RGB565 = 1
+GS8 = 6
+
+class FrameBuffer:
+    """ Drawing on a buffer, (0, 0) is the top left corner """
+
+    def __init__(self, buffer, width:int, height:int, format:int, stride:int=None) -> None:
+        if format not in (RGB565, GS8):
+            raise ValueError("invalid format")
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+        self._bytes = 2 if format == RGB565 else 1
+
+    def _get(self, x:int, y:int) -> int:
+        i = (y * self.stride + x) * self._bytes
+        if self._bytes == 2:
+            return self.buffer[i] | (self.buffer[i + 1] << 8)
+        return self.buffer[i]
+
+    def _set(self, x:int, y:int, c:int) -> None:
+        i = (y * self.stride + x) * self._bytes
+        if self._bytes == 2:
+            self.buffer[i] = c & 0xff
+            self.buffer[i + 1] = (c >> 8) & 0xff
+        else:
+            self.buffer[i] = c & 0xff
+
+    def pixel(self, x:int, y:int, c:int=None):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            if c is None:
+                return self._get(x, y)
+            self._set(x, y, c)
+
+    def fill(self, c:int) -> None:
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def fill_rect(self, x:int, y:int, w:int, h:int, c:int) -> None:
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.width), min(y + h, self.height)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def hline(self, x:int, y:int, w:int, c:int) -> None:
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x:int, y:int, h:int, c:int) -> None:
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x:int, y:int, w:int, h:int, c:int, f:bool=False) -> None:
+        if f:
+            self.fill_rect(x, y, w, h, c)
+        else:
+            self.hline(x, y, w, c)
+            self.hline(x, y + h - 1, w, c)
+            self.vline(x, y, h, c)
+            self.vline(x + w - 1, y, h, c)
+
+    def line(self, x1:int, y1:int, x2:int, y2:int, c:int) -> None:
+        # Bresenham
+        dx, dy = abs(x2 - x1), -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        error = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                return
+            e2 = 2 * error
+            if e2 >= dy:
+                error += dy
+                x1 += sx
+            if e2 <= dx:
+                error += dx
+                y1 += sy
+
+    def blit(self, fbuf, x:int, y:int, key:int=-1, palette=None) -> None:
+        for yy in range(fbuf.height):
+            for xx in range(fbuf.width):
+                c = fbuf._get(xx, yy)
+                if c == key:
+                    continue
+                if palette is not None:
+                    c = palette._get(c, 0)
+                self.pixel(x + xx, y + yy, c)
+
+    def scroll(self, xstep:int, ystep:int) -> None:
+        # Like framebuf, the uncovered area keeps its old content
+        xs = range(self.width - 1, -1, -1) if xstep > 0 else range(self.width)
+        ys = range(self.height - 1, -1, -1) if ystep > 0 else range(self.height)
+        for y in ys:
+            for x in xs:
+                sx, sy = x - xstep, y - ystep
+                if 0 <= sx < self.width and 0 <= sy < self.height:
+                    self._set(x, y, self._get(sx, sy))
+
+    def text(self, s:str, x:int, y:int, c:int=1) -> None:
+        # (x, y) is the top left corner of the first character, a column mask has the bottom row in bit 0
+        font = load_font()
+        bottom = y + font.height - 1
+        for char in s:
+            masks = font.glyph(char)
+            if masks is not None:
+                for column in range(len(masks)):
+                    mask = masks[column]
+                    row = 0
+                    while mask:
+                        if mask & 1:
+                            self.pixel(x + column, bottom - row, c)
+                        mask >>= 1
+                        row += 1
+            x += 8
@@ -0,0 +1,54 @@
+"""
+Figures and fonts compiled into Python modules by tools/make_frozen.py, to be frozen into the firmware.
+
+The generated modules hold one bytes constant per figure and per font:
+- frozen_figures.py: FIGURES = {name: (width, height, pixels)}, names like in asset_bundle.py
+  ("weather_icons/sun"), pixels like in a .lbi file.
+- frozen_fonts.py: FONTS = {height: the content of the .lbf file}
+
+Bytes constants of a frozen module stay in flash, the images and glyphs are drawn from there and
+nothing is copied to RAM. Without the modules FIGURES and FONTS are empty, and the figures and fonts
+are read from their files as before.
+"""
+
+import array
+import kernels
+from image_file import Image
+
+try:
+    from frozen_figures import FIGURES
+except ImportError:
+    FIGURES = {}
+
+try:
+    from frozen_fonts import FONTS
+except ImportError:
+    FONTS = {}
+
+_images = {} # name: Image, made the first time a figure is used
+
+def words(data):
+    """
+    The buffer values in bytes data, without a copy where possible. On CPython a memoryview cast to
+    words. On the Pico the compiled kernels read the bytes themselves when they are word aligned,
+    the Python kernels need an array("I") copy.
+    """
+    try:
+        return memoryview(data).cast("I")
+    except AttributeError:
+        import uctypes
+        if kernels.FAST and uctypes.addressof(data) & 3 == 0:
+            return data
+        return array.array("I", data)
+
+def image(name:str) -> Image:
+    """ Returns a frozen figure by name, None if there is no such figure. The image is shared, do not change it """
+    found = _images.get(name)
+    if found is None:
+        entry = FIGURES.get(name)
+        if entry is None:
+            return None
+        width, height, data = entry
+        found = Image(width, height, words(data))
+        _images[name] = found
+    return found
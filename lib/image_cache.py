@@ -0,0 +1,113 @@
+"""
+Cache of loaded images, so icons and emojis that are shown again are not read from flash again.
+
+Images are kept up to a byte budget, the least recently used image is dropped first. When an image is
+loaded or found while the free memory (gc.mem_free()) is below a watermark, images are dropped until it
+is above it again or the cache is empty, so the cache does not keep memory the rest of the program needs.
+
+Entries are keyed by path and modification time, assets of a bundle (see asset_bundle.py) by their name
+and the modification time of the bundle. The time is read when the image is loaded, a hit does
+not touch the file system. Call invalidate() after writing or removing a file (the web server does it
+for the uploaded images), or set recheck to True to compare the modification time on every hit.
+
+The cached images are shared, draw them but do not change them.
+"""
+
+import gc
+import uos
+from image_file import load_image
+from asset_bundle import open_bundle
+
+class Image_cache:
+    """
+    Loaded images by path.
+
+    Atributes:
+    - budget: most bytes of pixels kept.
+    - low_memory: drop images while gc.mem_free() is below this.
+    - recheck: compare the modification time of the file on every hit.
+    - size: bytes of pixels kept now.
+    - hits, misses, evictions: counters since the cache was made.
+    """
+
+    def __init__(self, budget:int=16 * 1024, low_memory:int=30_000, recheck:bool=False) -> None:
+        self.budget = budget
+        self.low_memory = low_memory
+        self.recheck = recheck
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # LRU, the most recently used path is last in _order
+        self._entries = {} # path: (modification time, image)
+        self._order = []
+
+    def _mtime(self, path:str) -> int:
+        return uos.stat(path)[8]
+
+    def get(self, path:str, name:str=None):
+        """
+        Returns the image of a file, or of the asset name in the bundle file path, loaded if it is not in
+        the cache. Raises the errors of load_image(), and KeyError if the bundle does not have the asset.
+        """
+        key = path if name is None else name
+        entry = self._entries.get(key)
+        if entry is not None and (not self.recheck or entry[0] == self._mtime(path)):
+            self.hits += 1
+            if self._order[-1] != key:
+                self._order.remove(key)
+                self._order.append(key)
+            if gc.mem_free() < self.low_memory:
+                self.trim()
+            return entry[1]
+
+        self.misses += 1
+        if entry is not None:
+            self.invalidate(key) # The file has changed
+
+        mtime = self._mtime(path)
+        image = load_image(path) if name is None else open_bundle(path).image(name)
+        size = len(image.words) * 4
+        if size <= self.budget:
+            self._entries[key] = (mtime, image)
+            self._order.append(key)
+            self.size += size
+            self.trim()
+        return image
+
+    def trim(self) -> None:
+        """ Drops the least recently used images until the cache is within its budget and memory is not low """
+        while self._order and self.size > self.budget:
+            self._drop(self._order[0])
+
+        if self._order and gc.mem_free() < self.low_memory:
+            gc.collect()
+            while self._order and gc.mem_free() < self.low_memory:
+                self._drop(self._order[0])
+                gc.collect()
+
+    def _drop(self, path:str) -> None:
+        _, image = self._entries.pop(path)
+        self._order.remove(path)
+        self.size -= len(image.words) * 4
+        self.evictions += 1
+
+    def invalidate(self, path:str) -> None:
+        """ Forgets the image of a file (or the name of an asset), the next get() reads it again """
+        if path in self._entries:
+            _, image = self._entries.pop(path)
+            self._order.remove(path)
+            self.size -= len(image.words) * 4
+
+    def clear(self) -> None:
+        self._entries = {}
+        self._order = []
+        self.size = 0
+
+    def stats(self) -> dict:
+        """ Counters and size, for printing or the web page """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "images": len(self._order), "bytes": self.size, "budget": self.budget}
+
+cache = Image_cache()
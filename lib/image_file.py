@@ -0,0 +1,127 @@
+"""
+Binary images (.lbi files), made from PPM P3 files by convert_ppm() or tools/convert_images.py.
+
+A .lbi file holds the buffer values of the image, so loading it is one readinto() and drawing it is
+a copy with Matrix.blit(), nothing is parsed or converted on the way.
+
+File format, little endian:
+- header: b"LBI1", width (u8), height (u8), reserved (u16, 0)
+- pixels: width * height buffer values (u32, green << 16 | red << 8 | blue), row by row from the top row
+
+PPM P3 files can still be loaded, they are converted while they are read. The figures are kept as
+PPM P3 files too, tools/convert_images.py makes the .lbi files from them.
+"""
+
+import struct
+import array
+import uos
+
+HEADER = "<4sBBH"
+HEADER_SIZE = 8
+EXTENSION = ".lbi"
+
+class Image:
+    """
+    An image in buffer values, ready for Matrix.blit().
+
+    Atributes:
+    - width, height: size of the image.
+    - words: array("I") with the pixels row by row from the top row, may be longer than width * height
+      when the image is loaded into a buffer of an earlier image.
+    """
+
+    def __init__(self, width:int, height:int, words=None) -> None:
+        self.width = width
+        self.height = height
+        self.words = words if words is not None else array.array("I", bytes(width * height * 4))
+
+def _buffer(width:int, height:int, image:Image=None) -> Image:
+    """ The image to load into, image is reused if its buffer is large enough """
+    if image is not None and len(image.words) >= width * height:
+        image.width, image.height = width, height
+        return image
+    return Image(width, height)
+
+def read_ppm(file, image:Image=None) -> Image:
+    """ Reads a PPM P3 file (opened in text mode) into an image, missing pixels are black """
+    values = [] # Header: P3, width, height, max value
+    words = None
+    count = 0 # Color values read
+    total = 0
+    rgb = [0, 0, 0]
+
+    for line in file:
+        line = line.split("#", 1)[0]
+        for value in line.split():
+            if words is None:
+                values.append(value)
+                if len(values) == 4:
+                    if values[0] != "P3":
+                        raise ValueError("not a PPM P3 file")
+                    image = _buffer(int(values[1]), int(values[2]), image)
+                    words = image.words
+                    total = image.width * image.height * 3
+                    max_value = int(values[3])
+                continue
+
+            if count >= total:
+                break # Anything after the pixels is ignored
+            channel = int(value)
+            if max_value != 255:
+                channel = channel * 255 // max_value
+            rgb[count % 3] = channel
+            count += 1
+            if count % 3 == 0:
+                words[count // 3 - 1] = (rgb[1] << 16) | (rgb[0] << 8) | rgb[2]
+        if words is not None and count >= total:
+            break
+
+    if words is None:
+        raise ValueError("not a PPM P3 file")
+    for i in range(count // 3, image.width * image.height):
+        words[i] = 0
+    return image
+
+def ppm_text(image:Image) -> str:
+    """ An image as PPM P3 text, one pixel per line, as the web page reads it """
+    lines = ["P3", f"{image.width} {image.height}", "255"]
+    words = image.words
+    for i in range(image.width * image.height):
+        word = words[i]
+        lines.append(f"{(word >> 8) & 0xff} {(word >> 16) & 0xff} {word & 0xff}")
+    return "\n".join(lines)
+
+def load_image(path:str, image:Image=None) -> Image:
+    """
+    Loads a .lbi or PPM P3 file. Give image to load into its buffer instead of allocating a new one.
+    Raises OSError if the file can not be opened and ValueError if it is not an image.
+    """
+    with open(path, "rb") as file:
+        header = file.read(HEADER_SIZE)
+        if header[:4] == b"LBI1":
+            _, width, height, _ = struct.unpack(HEADER, header)
+            image = _buffer(width, height, image)
+            file.readinto(memoryview(image.words)[:width * height])
+            return image
+
+    with open(path, "r") as file:
+        return read_ppm(file, image)
+
+def save_image(path:str, image:Image) -> None:
+    """ Writes an image to a .lbi file """
+    with open(path, "wb") as file:
+        file.write(struct.pack(HEADER, b"LBI1", image.width, image.height, 0))
+        file.write(memoryview(image.words)[:image.width * image.height])
+
+def convert_ppm(path:str, remove:bool=True) -> str:
+    """ Converts a PPM P3 file to a .lbi file next to it, returns the new path. The PPM file is removed """
+    image = load_image(path)
+    new_path = (path[:-4] if path.endswith(".ppm") else path) + EXTENSION
+    save_image(new_path, image)
+    if remove:
+        uos.remove(path)
+    return new_path
+
+def list_images(folder_path:str) -> list:
+    """ Names of the image files (.lbi and .ppm) in a folder, sorted """
+    return sorted(name for name in uos.listdir(folder_path) if name.endswith(EXTENSION) or name.endswith(".ppm"))
@@ -1,6 +1,7 @@
 import network
 import usocket as socket
-from time import sleep, localtime
+from time import sleep
+import time_service
 import uos
 import ujson as json
 import urequests as requests
@@ -8,6 +9,8 @@ import lib.pico_system as pSys
 from lib.lightbox_functionality import my_lightbox
 from encryption import Simple_Encryption
 import weather as wd
+import image_file
+import image_cache
 import gc
 
 def get_weather_data():
@@ -48,10 +51,7 @@ def get_weather_data():
         return "ERROR, fetch error"
     
     # Current time in ISO 8601 format
-    iso8601_time = "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(
-        localtime()[0], localtime()[1], localtime()[2],
-        localtime()[3], localtime()[4], localtime()[5]
-    )
+    iso8601_time = time_service.iso_utc()
 
     # Save to dictionary
     weather_data = {
@@ -441,6 +441,7 @@ class Server_functiones(Pico_internet):
             
             if "timezone_offset" in request_data:
                 setup_data["manual_time_zone"] = int(request_data["timezone_offset"])
+                time_service.set_offset(setup_data["manual_time_zone"])
             if "brightness" in request_data:
                 my_lightbox.change_brightness(int(request_data["brightness"]))
             self._handle_options(client_socket) # Allow Access-Control-Allow-Origin
@@ -466,7 +467,13 @@ class Server_functiones(Pico_internet):
         # If user want image data
         elif request_data["type"] == "data":
             if request_data["filename"] in file_names:
-                image_data = pSys.get_data(f"{image_folder_path}/{request_data['filename']}")
+                # The images are stored as .lbi files, the page reads PPM P3 text
+                try:
+                    image_data = image_file.ppm_text(image_file.load_image(f"{image_folder_path}/{request_data['filename']}"))
+                except (OSError, ValueError) as e:
+                    print(f"ERR, could not read {request_data['filename']}: {e}")
+                    client_socket.send(NOT_FOUND_404.encode('utf-8'))
+                    return
                 # Send header
                 headers = self.construct_headers("200 OK", "image/x-portable-pixmap",len(image_data))
                 client_socket.send(headers.encode('utf-8'))
@@ -482,6 +489,7 @@ class Server_functiones(Pico_internet):
         elif request_data["type"] == "del":
             if request_data["filename"] in file_names:
                 pSys.delete_file(f"/images/{request_data['filename']}")
+                image_cache.cache.invalidate(f"/images/{request_data['filename']}") # A new upload can get the same name
                 self._handle_options(client_socket) # Allow Access-Control-Allow-Origin and status code OK
             else: # If file not found
                 print("Warning, file not found")
@@ -544,8 +552,8 @@ class Server_functiones(Pico_internet):
                 filepath += filename
                 temp_filepath = filepath
                 number = 1
-                # Make unique file name
-                while pSys.file_exists(temp_filepath):
+                # Make unique file name, also against the converted images
+                while pSys.file_exists(temp_filepath) or pSys.file_exists(temp_filepath[:-4] + image_file.EXTENSION):
                     temp_filepath = filepath[:-4] + f"({number})" + filepath[-4:] # Add number to filename
                     number += 1
                 filepath = temp_filepath
@@ -618,7 +626,7 @@ class Server_functiones(Pico_internet):
                     #print("POST request registerd")
                     request_type = 'POST'
                     # Check if we have too many images
-                    if len(pSys.get_files(filepath_save_post, ".ppm")) >= self.max_image_files:
+                    if len(image_file.list_images(filepath_save_post)) >= self.max_image_files:
                         print("Warning, too many files saved on device")
                         # Send status headers to client
                         self._handle_options(client_socket, "507 Insufficient Storage")
@@ -641,6 +649,13 @@ class Server_functiones(Pico_internet):
                     filepath_save_post = handler[1] # Change filepath
                 elif handler == "done":
                     break # If we are done, break out of loop
+
+        # Store an uploaded image as a binary image, drawing it does not need to parse the text every time
+        if request_type == 'POST' and filepath_save_post.endswith(".ppm"):
+            try:
+                image_cache.cache.invalidate(image_file.convert_ppm(filepath_save_post))
+            except (OSError, ValueError) as e:
+                print(f"ERR, could not convert {filepath_save_post}: {e}")
                 
     def close_server(self):
         """ Method is used to close the server """
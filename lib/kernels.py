@@ -0,0 +1,207 @@
+"""
+Inner loops of the drawing code.
+
+The functions below are plain Python and run anywhere. On the Pico the same functions are
+imported from kernels_viper.py, compiled to machine code with @micropython.viper. That module only
+compiles on MicroPython with the native emitter, elsewhere the import fails and the Python
+versions are kept. FAST tells which ones are in use.
+
+Buffers: words are array("I") with GRB values (green << 16 | red << 8 | blue), bytes are bytearray-like.
+"""
+
+import array
+import utime as time
+
+def py_pack_rgb(src, dst, n:int) -> None:
+    """ Packs n RGB byte triples from src into GRB words in dst """
+    j = 0
+    for i in range(n):
+        dst[i] = (src[j + 1] << 16) | (src[j] << 8) | src[j + 2]
+        j += 3
+
+def py_unpack_rgb(src, dst, n:int) -> None:
+    """ Unpacks n GRB words from src into RGB byte triples in dst """
+    j = 0
+    for i in range(n):
+        value = src[i]
+        dst[j] = (value >> 8) & 0xff
+        dst[j + 1] = (value >> 16) & 0xff
+        dst[j + 2] = value & 0xff
+        j += 3
+
+def py_scale_buffer(src, dst, lut, n:int) -> None:
+    """
+    Writes n GRB words from src to dst as output words for the PIO program, 4 bytes each: 0, blue, red, green.
+    Every channel goes through the 256 entry lut (brightness and gamma).
+    """
+    j = 0
+    for i in range(n):
+        value = src[i]
+        dst[j + 1] = lut[value & 0xff]
+        dst[j + 2] = lut[(value >> 8) & 0xff]
+        dst[j + 3] = lut[(value >> 16) & 0xff]
+        j += 4
+
+def py_fill_words(buf, value:int, start:int, count:int) -> None:
+    """ Sets count words from start to value """
+    if count <= 16:
+        for i in range(start, start + count):
+            buf[i] = value
+        return
+
+    # Set the first 16 and copy them, doubling the copied part every time
+    for i in range(start, start + 16):
+        buf[i] = value
+    view = memoryview(buf)
+    done = 16
+    while done < count:
+        part = min(done, count - done)
+        view[start + done:start + done + part] = view[start:start + part]
+        done += part
+
+def py_blit_row(dst, index, src, params) -> None:
+    """
+    Copies a run of words from src to dst through an index table (the matrix coordinate table).
+    params: array("i") with [first index entry, first src word, count, transparent value or -1]
+    """
+    start, source, count, key = params[0], params[1], params[2], params[3]
+    for i in range(count):
+        value = src[source + i]
+        if value != key:
+            dst[index[start + i]] = value
+
+def py_blit_mask(dst, index, masks, params) -> None:
+    """
+    Sets the pixels of a run of column bitmasks (bit 0 is the bottom row) to one value, clipped to the matrix.
+    masks: array("H") or bytearray, params: array("i") with
+    [x, y, number of columns, first mask, matrix width, matrix height, value, 1 if masks is array("H") else 0]
+    """
+    x, y, count, start = params[0], params[1], params[2], params[3]
+    width, height, value = params[4], params[5], params[6]
+    for c in range(count):
+        column = x + c
+        if 0 <= column < width:
+            mask = masks[start + c]
+            row = y
+            while mask:
+                if mask & 1 and 0 <= row < height:
+                    dst[index[row * width + column]] = value
+                mask >>= 1
+                row += 1
+
+def py_xor_delta(dst, src, params) -> None:
+    """
+    Applies a delta frame (see frame_file.py) to the words in dst.
+    The delta is a list of runs, each starting with a byte t: t < 128 skips t + 1 words, else the
+    (t & 0x7f) + 1 words after it (3 bytes each, green, red, blue) are XORed into dst.
+    src: bytes-like, params: array("i") with [delta length in bytes]
+    """
+    length = params[0]
+    i = 0
+    word = 0
+    while i < length:
+        t = src[i]
+        i += 1
+        if t < 0x80:
+            word += t + 1
+        else:
+            for _ in range((t & 0x7f) + 1):
+                dst[word] ^= (src[i] << 16) | (src[i + 1] << 8) | src[i + 2]
+                word += 1
+                i += 3
+
+def py_gather_row(dst, index, src, params) -> None:
+    """
+    The opposite of blit_row: copies a run of words from src through an index table to dst.
+    params: array("i") with [first index entry, first dst word, count]
+    """
+    start, target, count = params[0], params[1], params[2]
+    for i in range(count):
+        dst[target + i] = src[index[start + i]]
+
+def py_blend_words(dst, top, below, params) -> None:
+    """
+    Mixes two runs of words channel by channel: alpha 256 gives top, 0 gives below.
+    params: array("i") with [alpha, count]
+    """
+    alpha, count = params[0], params[1]
+    inverse = 256 - alpha
+    for i in range(count):
+        a = top[i]
+        b = below[i]
+        dst[i] = (((((a >> 16) & 0xff) * alpha + ((b >> 16) & 0xff) * inverse) >> 8) << 16
+                  | ((((a >> 8) & 0xff) * alpha + ((b >> 8) & 0xff) * inverse) >> 8) << 8
+                  | ((a & 0xff) * alpha + (b & 0xff) * inverse) >> 8)
+
+pack_rgb = py_pack_rgb
+unpack_rgb = py_unpack_rgb
+scale_buffer = py_scale_buffer
+fill_words = py_fill_words
+blit_row = py_blit_row
+blit_mask = py_blit_mask
+xor_delta = py_xor_delta
+gather_row = py_gather_row
+blend_words = py_blend_words
+
+# Use the compiled versions if they are available
+try:
+    from kernels_viper import pack_rgb, unpack_rgb, scale_buffer, fill_words, blit_row, blit_mask, xor_delta, gather_row, \
+        blend_words
+    FAST = True
+except (ImportError, SyntaxError):
+    FAST = False
+
+def benchmark(runs:int=100, numpix:int=256) -> None:
+    """
+    Times every kernel against its Python version and checks that they give the same result.
+    Raises AssertionError naming the kernels that do not. Run on the Pico with: import kernels; kernels.benchmark()
+    """
+    words = array.array("I", [(i * 2654435761) & 0xffffff for i in range(numpix)])
+    index = array.array("H", [numpix - 1 - i for i in range(numpix)])
+    lut = bytearray([i * 40 // 100 for i in range(256)])
+    rgb = bytearray(numpix * 3)
+    params = array.array("i", [0, 0, numpix, -1])
+    masks = array.array("H", [(i * 40503) & 0xffff for i in range(16)])
+    mask_params = array.array("i", [-2, -3, 16, 0, 16, numpix // 16, 0x123456, 1])
+    delta = bytearray()
+    for start in range(0, numpix - 8, 24):
+        delta += bytes([7, 0x80 + 7]) + bytes((start * 7 + j) & 0xff for j in range(24))
+    delta_params = array.array("i", [len(delta)])
+    blend_params = array.array("i", [100, numpix])
+    inverted = array.array("I", [value ^ 0xffffff for value in words])
+
+    def timed(call, function, out):
+        start = time.ticks_us()
+        for _ in range(runs):
+            call(function, out)
+        return time.ticks_diff(time.ticks_us(), start) / runs
+
+    mismatches = [] # Kernels that give another result than their Python version
+
+    def compare(name, fast, slow, call, make_output):
+        # call(kernel, output buffer) runs the kernel with the test data
+        fast_out, slow_out = make_output(), make_output()
+        call(fast, fast_out)
+        call(slow, slow_out)
+        same = fast_out == slow_out
+        if not same:
+            mismatches.append(name)
+        print(f"  {name:<14} fast {timed(call, fast, fast_out):8.1f} us   python {timed(call, slow, slow_out):8.1f} us   "
+              f"same result: {same}")
+
+    new_words = lambda: array.array("I", [0 for _ in range(numpix)])
+    py_unpack_rgb(words, rgb, numpix)
+
+    print(f"kernels, compiled versions in use: {FAST}")
+    compare("pack_rgb", pack_rgb, py_pack_rgb, lambda f, out: f(rgb, out, numpix), new_words)
+    compare("unpack_rgb", unpack_rgb, py_unpack_rgb, lambda f, out: f(words, out, numpix), lambda: bytearray(numpix * 3))
+    compare("scale_buffer", scale_buffer, py_scale_buffer, lambda f, out: f(words, out, lut, numpix), lambda: bytearray(numpix * 4))
+    compare("fill_words", fill_words, py_fill_words, lambda f, out: f(out, 0x123456, 0, numpix), new_words)
+    compare("blit_row", blit_row, py_blit_row, lambda f, out: f(out, index, words, params), new_words)
+    compare("blit_mask", blit_mask, py_blit_mask, lambda f, out: f(out, index, masks, mask_params), new_words)
+    compare("xor_delta", xor_delta, py_xor_delta, lambda f, out: f(out, delta, delta_params), new_words)
+    compare("gather_row", gather_row, py_gather_row, lambda f, out: f(out, index, words, params), new_words)
+    compare("blend_words", blend_words, py_blend_words, lambda f, out: f(out, words, inverted, blend_params), new_words)
+
+    if mismatches:
+        raise AssertionError(f"kernels differ from their Python versions: {', '.join(mismatches)}")
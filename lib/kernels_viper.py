@@ -0,0 +1,111 @@
+"""
+Compiled versions of the kernels in kernels.py, see that file for what they do.
+Only imported on MicroPython, the @micropython.viper decorator is a syntax error elsewhere.
+"""
+
+import micropython
+
+@micropython.viper
+def pack_rgb(src: ptr8, dst: ptr32, n: int):
+    j = 0
+    for i in range(n):
+        dst[i] = (src[j + 1] << 16) | (src[j] << 8) | src[j + 2]
+        j += 3
+
+@micropython.viper
+def unpack_rgb(src: ptr32, dst: ptr8, n: int):
+    j = 0
+    for i in range(n):
+        value = src[i]
+        dst[j] = (value >> 8) & 0xff
+        dst[j + 1] = (value >> 16) & 0xff
+        dst[j + 2] = value & 0xff
+        j += 3
+
+@micropython.viper
+def scale_buffer(src: ptr32, dst: ptr8, lut: ptr8, n: int):
+    j = 0
+    for i in range(n):
+        value = src[i]
+        dst[j + 1] = lut[value & 0xff]
+        dst[j + 2] = lut[(value >> 8) & 0xff]
+        dst[j + 3] = lut[(value >> 16) & 0xff]
+        j += 4
+
+@micropython.viper
+def fill_words(buf: ptr32, value: int, start: int, count: int):
+    for i in range(start, start + count):
+        buf[i] = value
+
+@micropython.viper
+def blit_row(dst: ptr32, index: ptr16, src: ptr32, params: ptr32):
+    start = params[0]
+    source = params[1]
+    count = params[2]
+    key = params[3]
+    for i in range(count):
+        value = src[source + i]
+        if value != key:
+            dst[index[start + i]] = value
+
+@micropython.viper
+def blit_mask(dst: ptr32, index: ptr16, masks: ptr8, params: ptr32):
+    x = params[0]
+    y = params[1]
+    count = params[2]
+    start = params[3]
+    width = params[4]
+    height = params[5]
+    value = params[6]
+    wide = params[7]
+    for c in range(count):
+        column = x + c
+        if column >= 0 and column < width:
+            if wide:
+                mask = masks[(start + c) * 2] | (masks[(start + c) * 2 + 1] << 8)
+            else:
+                mask = masks[start + c]
+            row = y
+            while mask:
+                if (mask & 1) and row >= 0 and row < height:
+                    dst[index[row * width + column]] = value
+                mask >>= 1
+                row += 1
+
+@micropython.viper
+def xor_delta(dst: ptr32, src: ptr8, params: ptr32):
+    length = params[0]
+    i = 0
+    word = 0
+    while i < length:
+        t = src[i]
+        i += 1
+        if t < 0x80:
+            word += t + 1
+        else:
+            n = (t & 0x7f) + 1
+            while n > 0:
+                dst[word] = dst[word] ^ ((src[i] << 16) | (src[i + 1] << 8) | src[i + 2])
+                word += 1
+                i += 3
+                n -= 1
+
+@micropython.viper
+def gather_row(dst: ptr32, index: ptr16, src: ptr32, params: ptr32):
+    start = params[0]
+    target = params[1]
+    count = params[2]
+    for i in range(count):
+        dst[target + i] = src[index[start + i]]
+
+@micropython.viper
+def blend_words(dst: ptr32, top: ptr32, below: ptr32, params: ptr32):
+    alpha = params[0]
+    count = params[1]
+    inverse = 256 - alpha
+    for i in range(count):
+        a = top[i]
+        b = below[i]
+        dst[i] = (((((a >> 16) & 0xff) * alpha + ((b >> 16) & 0xff) * inverse) >> 8) << 16) \
+                 | (((((a >> 8) & 0xff) * alpha + ((b >> 8) & 0xff) * inverse) >> 8) << 8) \
+                 | ((((a & 0xff) * alpha + (b & 0xff) * inverse) >> 8))
@@ -0,0 +1,210 @@
+"""
+Output stages for the WS2812B LEDs.
+
+Every output owns two buffers with pixel words that are ready for the PIO program (GRB shifted
+up 8 bits). Matrix.show() writes the next frame into the back buffer and calls swap(), which
+waits for the previous transfer only if it is still running and then starts sending the new frame.
+
+- Dma_output: the front buffer is streamed to the PIO state machine by DMA, show() returns at once
+- Pio_output: software fallback, blocking sm.put() with interrupts disabled
+- Stub_output: no hardware, counts frames and transfers so the swap logic can be tested on a computer
+"""
+
+import array
+import utime as time
+
+try:
+    import rp2
+    from machine import Pin
+    import machine
+except ImportError:
+    # Not running on a RP2040, only the stub output is available
+    rp2 = None
+
+LATCH_US = 300 # Idle time the LEDs need between two frames (WS2812B needs at least 280us)
+BIT_US = 1.25 # Time to send one bit at 800kHz
+
+if rp2 is not None:
+    @rp2.asm_pio(sideset_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_LEFT, autopull=True, pull_thresh=24)
+    def ws2812():
+       # Define timing constants for the WS2812 protocol
+        T1 = 2  # Number of cycles for a logic 1
+        T2 = 5  # Number of cycles for the total bit duration
+        T3 = 3  # Number of cycles for a logic 0
+
+        # Define the start of the program
+        wrap_target()
+
+        # Loop over each bit to send out the data
+        label("bitloop")
+
+        # Output a bit from the shift register (x) and set the side-set pin low
+        out(x, 1)               .side(0)    [T3 - 1]
+
+        # If the bit is 0, jump to the "do_zero" label, otherwise continue
+        jmp(not_x, "do_zero")   .side(1)    [T1 - 1]
+
+        # Loop back to process the next bit
+        jmp("bitloop")          .side(1)    [T2 - 1]
+
+        # Handle the case for sending a logic 0
+        label("do_zero")
+        nop().side(0)                       [T2 - 1]
+
+        # Define the end of the program
+        wrap()
+
+def byte_view(words):
+    """ Returns a writable bytearray view of an array("I"), without copying it """
+    try:
+        import uctypes
+        return uctypes.bytearray_at(uctypes.addressof(words), len(words) * 4)
+    except ImportError:
+        return memoryview(words).cast("B")
+
+class Ws2812_output:
+    """
+    Double buffer shared by the outputs. It is a base class, create_output() returns one of the outputs below.
+
+    An output implements:
+    - _send(words): start sending an array("I") of pixel words to the LEDs. It may return before the
+      frame is sent, the words are not changed until the next swap() has waited for it.
+    - busy(): True while the frame of the last _send() is still being sent (the base is never busy).
+
+    Atributes:
+    - numpix: Number of LEDs in the chain.
+    - frames: Number of frames sent.
+    - waits: Number of swaps that had to wait for the previous transfer.
+    """
+
+    def __init__(self, numpix:int) -> None:
+        if type(self) is Ws2812_output:
+            raise TypeError("Ws2812_output is a base class, use create_output()")
+        self.numpix = numpix
+        self.frames = 0
+        self.waits = 0
+
+        # Two buffers, the front is being sent while the next frame is drawn into the back
+        self._buffers = (array.array("I", [0 for _ in range(numpix)]), array.array("I", [0 for _ in range(numpix)]))
+        self._bytes = (byte_view(self._buffers[0]), byte_view(self._buffers[1]))
+        self._back = 0
+
+    def back_buffer(self):
+        """ Returns a byte view of the back buffer. Every pixel is 4 bytes: 0, blue, red, green """
+        return self._bytes[self._back]
+
+    def front_buffer(self):
+        """ Returns the pixel words of the frame that was sent last """
+        return self._buffers[self._back ^ 1]
+
+    def busy(self) -> bool:
+        """ True while the previous frame is still being sent """
+        return False
+
+    def wait(self) -> None:
+        """ Blocks until the previous frame has been sent """
+        if self.busy():
+            self.waits += 1
+            while self.busy():
+                pass
+
+    def swap(self) -> None:
+        """ Sends the back buffer, waiting only if the previous transfer is still running """
+        self.wait()
+        words = self._buffers[self._back]
+        self._back ^= 1
+        self.frames += 1
+        self._send(words)
+
+    def _send(self, words) -> None:
+        """ Starts sending a frame, every output implements it (see the class docstring) """
+        raise NotImplementedError(f"{type(self).__name__} does not implement _send()")
+
+class Pio_output(Ws2812_output):
+    """ Blocking output, pushes the frame to the state machine with the CPU """
+
+    def __init__(self, sm, numpix:int) -> None:
+        super().__init__(numpix)
+        self.sm = sm
+
+    def _send(self, words) -> None:
+        irq_state = machine.disable_irq()  # Disable interrupts
+        self.sm.put(words)
+        machine.enable_irq(irq_state)  # Enable interrupts
+
+class Dma_output(Ws2812_output):
+    """ Non-blocking output, a DMA channel feeds the state machine TX FIFO """
+
+    def __init__(self, sm, sm_id:int, numpix:int) -> None:
+        super().__init__(numpix)
+        self.sm = sm
+        pio, index = sm_id // 4, sm_id % 4
+
+        # TX FIFO register and DREQ of the state machine
+        self._fifo = 0x50200010 + pio * 0x100000 + index * 4
+        self.dma = rp2.DMA()
+        self._ctrl = self.dma.pack_ctrl(size=2, inc_write=False, treq_sel=pio * 8 + index)
+
+        # The FIFO and the LED latch keep the line busy a while after the DMA has finished
+        self._frame_us = int(numpix * 24 * BIT_US) + LATCH_US
+        self._ready_at = time.ticks_us()
+
+    def busy(self) -> bool:
+        return self.dma.active() or time.ticks_diff(self._ready_at, time.ticks_us()) > 0
+
+    def _send(self, words) -> None:
+        self._ready_at = time.ticks_add(time.ticks_us(), self._frame_us)
+        self.dma.config(read=words, write=self._fifo, count=len(words), ctrl=self._ctrl, trigger=True)
+
+class Stub_output(Ws2812_output):
+    """
+    Output without hardware. A transfer stays "running" until complete() is called,
+    or for transfer_us microseconds if that is set.
+    """
+
+    def __init__(self, numpix:int, transfer_us:int=0) -> None:
+        super().__init__(numpix)
+        self.transfer_us = transfer_us
+        self.sent = None # Copy of the last frame that was sent
+        self._running = False
+        self._done_at = 0
+
+    def complete(self) -> None:
+        """ Finish the running transfer """
+        self._running = False
+
+    def busy(self) -> bool:
+        if self._running and self.transfer_us and time.ticks_diff(time.ticks_us(), self._done_at) >= 0:
+            self._running = False
+        return self._running
+
+    def wait(self) -> None:
+        if self.busy():
+            self.waits += 1
+            # Nothing else will finish the transfer
+            if not self.transfer_us:
+                self.complete()
+            while self.busy():
+                pass
+
+    def _send(self, words) -> None:
+        self.sent = array.array("I", words)
+        self._running = True
+        self._done_at = time.ticks_add(time.ticks_us(), self.transfer_us)
+
+def create_output(gpio_pin:int, numpix:int, sm_id:int=0):
+    """ Returns the best output available: DMA, then blocking PIO, then the stub """
+    if rp2 is None:
+        return Stub_output(numpix)
+
+    # Create the state machine
+    sm = rp2.StateMachine(sm_id, ws2812, freq=8_000_000, sideset_base=Pin(gpio_pin))
+    sm.active(1)
+
+    if hasattr(rp2, "DMA"):
+        try:
+            return Dma_output(sm, sm_id, numpix)
+        except OSError:
+            # All DMA channels are in use
+            pass
+    return Pio_output(sm, numpix)
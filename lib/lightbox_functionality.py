@@ -5,8 +5,8 @@ class Lightbox_object(Matrix_fun):
     This class includes all the nececarry functionalety for controlling the Lightbox
     """
 
-    def __init__(self, width: int, height: int, gpio_pin: int) -> None:
-        super().__init__(width, height, gpio_pin)
+    def __init__(self, width: int, height: int, gpio_pin: int, output=None) -> None:
+        super().__init__(width, height, gpio_pin, output)
         self.button_count = 1
         self.max_button_count = 6
     
@@ -29,8 +29,7 @@ class Lightbox_object(Matrix_fun):
         self.run = False
     
     def change_brightness(self, brightness_percent:int) -> None:
-        """ Updates brightness """
-        self.run = False
+        """ Updates brightness, the running event keeps going and is dimmed from its next frame """
         self.set_brightness(brightness_percent)
 
 my_lightbox = Lightbox_object(16,16,1)
@@ -0,0 +1,132 @@
+"""
+Particle system for the effects (fireworks, balls, rain, snow).
+
+The state of every particle is kept in arrays, one array per value, so a step allocates nothing.
+Positions and velocities are Q8 fixed point: 256 is one pixel, a velocity is pixels per step * 256.
+A position is on the pixel x >> 8, y >> 8, (0, 0) is the bottom left corner like set_pixel_color().
+
+step() moves every particle, applies gravity, the edges and the fading, and draws it in the same pass.
+"""
+
+import array
+import fixed
+
+ONE = fixed.ONE # One pixel in Q8
+FOREVER = -1 # Life of a particle that never dies
+
+# Directions around a circle, DIRECTIONS_X[i], DIRECTIONS_Y[i] is the unit vector at i * 360 / 16 degrees, Q8
+DIRECTIONS_X = array.array("h", [fixed.cos(i * 16) for i in range(16)])
+DIRECTIONS_Y = array.array("h", [fixed.sin(i * 16) for i in range(16)])
+
+class Particles:
+    """
+    Up to capacity particles drawn on a matrix.
+
+    Atributes:
+    - gravity: added to the y velocity every step (negative pulls down), Q8.
+    - bounce: None -> a particle dies when it leaves the matrix, else it bounces off the edges and keeps
+      bounce / 256 of its speed (256 bounces without losing speed).
+    - decay: the color is multiplied with decay / 256 every step, a particle dies when it is black.
+    - count: number of living particles, they are the first count entries of the arrays.
+    - x, y, vx, vy, life (array("h")), color (array("I")): the particle state.
+    """
+
+    def __init__(self, matrix, capacity:int=64, gravity:int=0, bounce:int=None, decay:int=256) -> None:
+        self.matrix = matrix
+        self.capacity = capacity
+        self.gravity = gravity
+        self.bounce = bounce
+        self.decay = decay
+        self.count = 0
+
+        self.x = array.array("h", bytes(capacity * 2))
+        self.y = array.array("h", bytes(capacity * 2))
+        self.vx = array.array("h", bytes(capacity * 2))
+        self.vy = array.array("h", bytes(capacity * 2))
+        self.life = array.array("h", bytes(capacity * 2))
+        self.color = array.array("I", bytes(capacity * 4))
+
+    def spawn(self, x:int, y:int, vx:int, vy:int, color:int, life:int=FOREVER) -> bool:
+        """
+        Adds a particle at x, y (Q8) moving vx, vy per step (Q8), color is a buffer value (see pack_color()).
+        life: steps until it dies. Returns False if the system is full.
+        """
+        i = self.count
+        if i >= self.capacity:
+            return False
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.color[i] = color
+        self.life[i] = life
+        self.count = i + 1
+        return True
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def _remove(self, i:int) -> None:
+        """ Removes particle i by moving the last one into its place """
+        last = self.count - 1
+        self.x[i] = self.x[last]
+        self.y[i] = self.y[last]
+        self.vx[i] = self.vx[last]
+        self.vy[i] = self.vy[last]
+        self.color[i] = self.color[last]
+        self.life[i] = self.life[last]
+        self.count = last
+
+    def step(self) -> None:
+        """ Moves all the particles one step and draws them to the buffer """
+        matrix = self.matrix
+        width, np, xy = matrix.MATRIX_WIDTH, matrix.np, matrix._xy
+        max_x, max_y = (width << 8) - 1, (matrix.MATRIX_HEIGHT << 8) - 1
+        xs, ys, vxs, vys, lives, colors = self.x, self.y, self.vx, self.vy, self.life, self.color
+        gravity, bounce, decay = self.gravity, self.bounce, self.decay
+
+        i = 0
+        while i < self.count:
+            life = lives[i]
+            if life == 0:
+                self._remove(i)
+                continue
+            if life > 0:
+                lives[i] = life - 1
+
+            vx = vxs[i]
+            vy = vys[i] + gravity
+            x = xs[i] + vx
+            y = ys[i] + vy
+
+            # Edges
+            if x < 0 or x > max_x or y < 0 or y > max_y:
+                if bounce is None:
+                    self._remove(i)
+                    continue
+                if x < 0:
+                    x, vx = -x, -vx * bounce >> 8
+                elif x > max_x:
+                    x, vx = 2 * max_x - x, -vx * bounce >> 8
+                if y < 0:
+                    y, vy = -y, -vy * bounce >> 8
+                elif y > max_y:
+                    y, vy = 2 * max_y - y, -vy * bounce >> 8
+                x = min(max(x, 0), max_x)
+                y = min(max(y, 0), max_y)
+                vxs[i] = vx
+
+            xs[i] = x
+            ys[i] = y
+            vys[i] = vy
+
+            color = colors[i]
+            if decay != 256:
+                color = fixed.scale_word(color, decay)
+                if color == 0:
+                    self._remove(i)
+                    continue
+                colors[i] = color
+
+            np[xy[(y >> 8) * width + (x >> 8)]] = color
+            i += 1
@@ -1,242 +1,199 @@
-from machine import Pin
 import weather as wd
 import random
 import utime as time
 import array
-import rp2
-from math import cos, sin, radians, sqrt
-from pico_system import get_files
-import machine
-from font import *
+from led_output import create_output
+import kernels
+import effect_tables
+import fixed
+from animation import Animator, Playlist
+from frame_file import Frame_file
+from image_file import load_image, list_images, EXTENSION
+import image_cache
+import asset_bundle
+import frozen_assets
+from particles import Particles, ONE, DIRECTIONS_X, DIRECTIONS_Y
+from transitions import Transition, UP
+from bitmap_font import load_font, Text_strip
+from ticker import Ticker
+from event_flag import Event_flag
+import time_service
+
+# Weather icon (figures/weather_icons/) of the symbol codes in weather.py
+# Icons: https://openweathermap.org/weather-conditions#Weather-Condition-Codes-2
+WEATHER_ICONS = {
+    "01d": "sun",
+    "02d": "sun_and_cloudy",
+    "03d": "cloud",
+    "04d": "broken_clouds",
+    "09d": "rain",
+    "10d": "sun_and_rain",
+    "11d": "thunder",
+    "13d": "snow",
+    "50d": "foggy",
+    "-00": "sun_red",
+
+    "01n": "sun",
+    "02n": "sun_and_cloudy",
+    "03n": "cloud",
+    "04n": "broken_clouds",
+    "09n": "rain",
+    "10n": "sun_and_rain",
+    "11n": "thunder",
+    "13n": "snow",
+    "50n": "foggy"
+}
 
 #
 # Some rainbow effects
 #
-def wheel(pos):
-    """Generate rainbow colors across 0-255 positions"""
-    if pos < 85:
-        return (pos * 3, 255 - pos * 3, 0)
-    elif pos < 170:
-        pos -= 85
-        return (255 - pos * 3, 0, pos * 3)
-    else:
-        pos -= 170
-        return (0, pos * 3, 255 - pos * 3)
+wheel = effect_tables.wheel # The color wheel is in effect_tables.py, with its table
+
+def rainbow_spiral_effect(matrix_obj: object, turn:int = 10):
+    """
+    Rainbow spiral drawn ray by ray around the center, one ray of 11 pixels per frame (360 frames a run).
+    Every run starts turn degrees further, so the colors rotate.
+    """
+    cos_table, sin_table = effect_tables.degree_tables()
+    wheel_words = effect_tables.wheel_words()
+    width, height = matrix_obj.MATRIX_WIDTH, matrix_obj.MATRIX_HEIGHT
+    center_x, center_y = width // 2, height // 2
+    np, xy = matrix_obj.np, matrix_obj._xy
+    angle_offset = 0
+
+    while True:
+        for angle in range(360):
+            rotated = (angle + angle_offset) % 360
+            c, s = cos_table[rotated], sin_table[rotated]
+            for radius in range(11):
+                x = center_x + (radius * c) // 1000
+                y = center_y + (radius * s) // 1000
+                if 0 <= x < width and 0 <= y < height:
+                    np[xy[y * width + x]] = wheel_words[(angle + radius * 10) & 0xff]
+            yield
+        angle_offset += turn
 
 def rainbow_spiral(matrix_obj: object, max_runs: int):
-        center_x = 8
-        center_y = 8
-        max_radius = 11
-
-        angle_offset = 0
-        runs = 0
-
-        cos_table = [int(1000 * cos(radians(angle))) for angle in range(360)]
-        sin_table = [int(1000 * sin(radians(angle))) for angle in range(360)]
-
-        while matrix_obj.run and runs <= max_runs:
-            for angle in range(360):
-                for radius in range(max_radius):
-                    x = center_x + (radius * cos_table[(angle + angle_offset) % 360]) // 1000
-                    y = center_y + (radius * sin_table[(angle + angle_offset) % 360]) // 1000
-                    color = wheel((angle + radius * 10) % 256)
-                    matrix_obj.set_pixel_color(x, y, color)
-
-                    # Break out if necessary
-                    if not matrix_obj.run:
-                        return
-                    # self.strip.set_pixel(self.coordinates_to_number(x, y), color)
-                matrix_obj.show()
-                # time.sleep(wait)
-            angle_offset += 10  # Increase the angle offset to make the spiral rotate
-            runs += 1
+    """ Shows the rainbow spiral for max_runs + 1 runs """
+    matrix_obj.animator.play(rainbow_spiral_effect(matrix_obj), frames=(max_runs + 1) * 360, fps=0)
 
-def rainbow_wave(matrix_obj: object, times:int = -1):
+def rainbow_wave_effect(matrix_obj: object):
+    """ Rainbow moving sideways, one color per column """
+    wheel_words = effect_tables.wheel_words()
     phase = 0
     while True:
-        for x in range(16):
-            for y in range(16):
-                color = wheel((x + phase) % 256)
-                #matrix_obj.strip.set_pixel(matrix_obj.coordinates_to_number(x, y), color)
-                matrix_obj.set_pixel_color(x,y,color)
-
-                # Break out if necesary
-                if matrix_obj.run == False:
-                    return
-
-        matrix_obj.show()
-        #time.sleep(duration)
-        phase += 1  # Increment phase for horizontal movement
-        if times > 0:
-            times -= 1
-        if times == 0:
-            break
+        # Every column has one color, draw the bottom row from the wheel and copy it up
+        matrix_obj.blit(0, 0, matrix_obj.MATRIX_WIDTH, 1, wheel_words, start=phase)
+        for y in range(1, matrix_obj.MATRIX_HEIGHT):
+            matrix_obj.copy_rows(0, y, 1)
+        yield
+        phase = (phase + 1) % 256  # Increment phase for horizontal movement
 
-def randomRGB(matrix_obj: object, runtime:float):
-    delay = 0.4
-    dot_count = 50
-    start_time = time.time()
+def rainbow_wave(matrix_obj: object, times:int = -1):
+    """ Shows the rainbow wave for a number of frames, times = -1 -> until matrix_obj.run is False """
+    matrix_obj.animator.play(rainbow_wave_effect(matrix_obj), frames=times if times > 0 else None, fps=0)
 
-    while matrix_obj.run == True:
-        current_time = time.time()
-        elapsed_time = current_time - start_time
+def random_rgb_effect(matrix_obj: object, dot_count:int = 50, delay:float = 0.8):
+    """ Random dots in random colors, a new set every delay seconds """
+    while True:
+        matrix_obj.clear()
         for _ in range(dot_count):
             matrix_obj.set_np(random.randint(0, matrix_obj.numpix-1), Matrix_fun.colors_rgb[random.randint(0, len(Matrix_fun.colors_rgb)-1)])
-            #matrix_obj.np[random.randint(0, matrix_obj.numpix-1)] = Matrix_fun.colors_rgb[random.randint(0, len(Matrix_fun.colors_rgb)-1)]
-        matrix_obj.show()
-        time.sleep(delay)
-        matrix_obj.wait(delay)
-        matrix_obj.clear()
-
-        if elapsed_time > runtime:
-            return
-
-def firework_animation(matrix):
-    def shoot_firework(start_x, start_y, end_y, color):
-        for y in range(start_y, end_y + 1):
-            matrix.set_pixel_color(start_x, y, color)
-            if y != start_y:
-                matrix.set_pixel_color(start_x, y - 1, (0, 0, 0))
-            matrix.show()
-            time.sleep(0.05)
-
-            if matrix.run != True:
-                return
-
-    def explode_firework(center_x, center_y, colors):
-        for radius in range(1, 5):  # Expanding radius
-            color = random.choice(colors)
-            for angle in range(0, 360, 30):  # Firework spread
-                rad = radians(angle)  # Convert to radians
-                x = int(center_x + radius * random.uniform(0.8, 1.2) * cos(rad))
-                y = int(center_y + radius * random.uniform(0.8, 1.2) * sin(rad))
-                if 0 <= x < matrix.MATRIX_WIDTH and 0 <= y < matrix.MATRIX_HEIGHT:
-                    matrix.set_pixel_color(x, y, color)
+        yield int(delay * 1000)
 
-                if matrix.run != True:
-                    return
-
-            matrix.show()
-            time.sleep(0.1)
+def randomRGB(matrix_obj: object, runtime:float):
+    matrix_obj.animator.play(random_rgb_effect(matrix_obj), runtime)
 
+def firework_effect(matrix, count:int = 5):
+    """ Fireworks shot up from the bottom, one after another """
+    colors = [matrix.pack_color(color) for color in matrix.colors_rgb]  # Various colors
+    sparks = Particles(matrix, 16, gravity=-3, decay=215)
     matrix.clear()
-    colors = matrix.colors_rgb  # Various colors
 
-    for _ in range(5):  # 5 fireworks
-        #start_x = center_x
+    for _ in range(count):
         start_x =  random.randint(0, matrix.MATRIX_WIDTH - 1)
-        start_y = 0
         end_y = random.randint(matrix.MATRIX_HEIGHT // 2, matrix.MATRIX_HEIGHT - 1)  # Random height for explosion
-        shoot_color = (255, 255, 255)  # White for shooting effect
 
-        shoot_firework(start_x, start_y, end_y, shoot_color)
-        explode_firework(start_x, end_y, colors)
-        matrix.clear()
-        matrix.wait(0.1)
+        # Shoot, white dot moving up
+        for y in range(end_y + 1):
+            matrix.clear()
+            sparks.step()
+            matrix.set_pixel_color(start_x, y, (255, 255, 255))
+            yield 50
+
+        # Explode, sparks in every direction at about half a pixel per step
+        color = random.choice(colors)
+        for direction in range(16):
+            speed = random.randint(100, 154)
+            sparks.spawn((start_x << 8) + 128, (end_y << 8) + 128,
+                         DIRECTIONS_X[direction] * speed >> 8, DIRECTIONS_Y[direction] * speed >> 8, color, 12)
+
+        while sparks.count:
+            matrix.clear()
+            sparks.step()
+            yield 50
 
-        if matrix.run != True:
-            return
+        yield 100
 
-def balls_bouncing_animation(matrix, num_balls, runtime):
-    def distance(ball1, ball2):
-        # Calculate Euclidean distance between two balls
-        return sqrt((ball1[0] - ball2[0]) ** 2 + (ball1[1] - ball2[1]) ** 2)
+def firework_animation(matrix):
+    matrix.animator.play(firework_effect(matrix))
 
-    balls = []
+def balls_effect(matrix, num_balls:int = 4):
+    """ Balls bouncing off the edges and each other """
+    balls = Particles(matrix, num_balls, bounce=256)
     for _ in range(num_balls):
-        ball_color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-        ball_x, ball_y = random.randint(0, 15), random.randint(0, 15)
-        velocity_x, velocity_y = random.choice([-1, 1]), random.choice([-1, 1])
-        balls.append((ball_x, ball_y, velocity_x, velocity_y, ball_color))
-
-        # Break out if necessary
-        if not matrix.run:
-            return
+        ball_color = matrix.pack_color((random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)))
+        balls.spawn(random.randint(0, 15) << 8, random.randint(0, 15) << 8,
+                    random.choice([-ONE, ONE]), random.choice([-ONE, ONE]), ball_color)
+    xs, ys, vxs, vys = balls.x, balls.y, balls.vx, balls.vy
 
-    start_time = time.time()
     while True:
-        current_time = time.time()
-        elapsed_time = current_time - start_time
-
-        if elapsed_time < runtime:
-            for i in range(len(balls)):
-                ball_x, ball_y, velocity_x, velocity_y, ball_color = balls[i]
-
-                # Update ball position
-                ball_x += velocity_x
-                ball_y += velocity_y
-
-                # Check for collisions with the boundaries
-                if ball_x >= matrix.MATRIX_WIDTH:
-                    ball_x = matrix.MATRIX_WIDTH - 1
-                    velocity_x *= -1  # Reverse x velocity
-                elif ball_x < 0:
-                    ball_x = 0
-                    velocity_x *= -1  # Reverse x velocity
-
-                if ball_y >= matrix.MATRIX_HEIGHT:
-                    ball_y = matrix.MATRIX_HEIGHT - 1
-                    velocity_y *= -1  # Reverse y velocity
-                elif ball_y < 0:
-                    ball_y = 0
-                    velocity_y *= -1  # Reverse y velocity
-
-                # Check for collisions between balls
-                for j in range(len(balls)):
-                    if i != j:
-                        other_ball_x, other_ball_y, _, _, _ = balls[j]
-                        if distance((ball_x, ball_y), (other_ball_x, other_ball_y)) <= 1:
-                            # Balls collide, reverse velocities
-                            velocity_x *= -1
-                            velocity_y *= -1
-                            break
-
-                    # Break out if necessary
-                    if not matrix.run:
-                        return
-
-                balls[i] = (ball_x, ball_y, velocity_x, velocity_y, ball_color)
-
-            matrix.clear()
-            for ball_x, ball_y, _, _, ball_color in balls:
-                matrix.set_pixel_color(ball_x, ball_y, ball_color)
-            matrix.show()
-            time.sleep(0.1)
-
-            # Break out if necessary
-            if not matrix.run:
-                return
-        else:
-            return
-
-@rp2.asm_pio(sideset_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_LEFT, autopull=True, pull_thresh=24)
-def ws2812():
-   # Define timing constants for the WS2812 protocol
-    T1 = 2  # Number of cycles for a logic 1
-    T2 = 5  # Number of cycles for the total bit duration
-    T3 = 3  # Number of cycles for a logic 0
-
-    # Define the start of the program
-    wrap_target()
-
-    # Loop over each bit to send out the data
-    label("bitloop")
-
-    # Output a bit from the shift register (x) and set the side-set pin low
-    out(x, 1)               .side(0)    [T3 - 1]
+        matrix.clear()
+        balls.step()
+
+        # Balls next to each other bounce back
+        for i in range(num_balls):
+            for j in range(i + 1, num_balls):
+                if abs((xs[i] >> 8) - (xs[j] >> 8)) + abs((ys[i] >> 8) - (ys[j] >> 8)) <= 1:
+                    vxs[i] = -vxs[i]
+                    vys[i] = -vys[i]
+                    vxs[j] = -vxs[j]
+                    vys[j] = -vys[j]
+        yield 100
+
+def rain_effect(matrix, drops:int = 24):
+    """ Rain drops falling from the top, play it at about 30 fps """
+    rain = Particles(matrix, drops, gravity=-2)
+    colors = [matrix.pack_color((0, 40, 255)), matrix.pack_color((0, 90, 200)), matrix.pack_color((60, 60, 255))]
+    top = (matrix.MATRIX_HEIGHT << 8) - 1
+    while True:
+        if random.randint(0, 2) == 0:
+            rain.spawn(random.randint(0, matrix.MATRIX_WIDTH - 1) << 8, top, 0, -random.randint(40, 110), random.choice(colors))
+        matrix.clear()
+        rain.step()
+        yield
 
-    # If the bit is 0, jump to the "do_zero" label, otherwise continue
-    jmp(not_x, "do_zero")   .side(1)    [T1 - 1]
+def snow_effect(matrix, flakes:int = 40):
+    """ Snow flakes drifting down, play it at about 20 fps """
+    snow = Particles(matrix, flakes)
+    top = (matrix.MATRIX_HEIGHT << 8) - 1
+    while True:
+        if random.randint(0, 3) == 0:
+            gray = random.randint(120, 255)
+            snow.spawn(random.randint(0, (matrix.MATRIX_WIDTH << 8) - 1), top, random.randint(-12, 12),
+                       -random.randint(12, 30), matrix.pack_color((gray, gray, gray)))
 
-    # Loop back to process the next bit
-    jmp("bitloop")          .side(1)    [T2 - 1]
+        # Wind, the flakes change their drift now and then
+        flake = random.randint(0, flakes - 1)
+        if flake < snow.count:
+            snow.vx[flake] = random.randint(-12, 12)
 
-    # Handle the case for sending a logic 0
-    label("do_zero")
-    nop().side(0)                       [T2 - 1]
+        matrix.clear()
+        snow.step()
+        yield
 
-    # Define the end of the program
-    wrap()
+def balls_bouncing_animation(matrix, num_balls, runtime):
+    matrix.animator.play(balls_effect(matrix, num_balls), runtime)
 
 class Matrix:
     """
@@ -246,29 +203,46 @@ class Matrix:
     - width: Number of pixels in the x-direction.
     - height: Number of pixels in the y-direction.
     - gpio_pin: GPIO pin to which the matrix is connected.
+    - output: Output stage for the LEDs, see led_output.py. Picked automatically if not given.
     """
 
-    def __init__(self, width:int, height:int, gpio_pin:int) -> None:
+    def __init__(self, width:int, height:int, gpio_pin:int, output=None) -> None:
         self.numpix = width * height # Total number of pixels
         self.MATRIX_WIDTH = width
         self.MATRIX_HEIGHT = height
         self.brightness = 100 # Brightness percentage (0-100)
+        self.gamma = 1.0 # Gamma correction applied together with the brightness
 
-        # Create the state machine
-        self.sm = rp2.StateMachine(0, ws2812, freq=8_000_000, sideset_base=Pin(gpio_pin))
-        #self.sm = rp2.StateMachine(0, ws2812, freq=4_000_000, sideset_base=Pin(gpio_pin))
-        self.sm.active(1)
+        # Double buffered output to the PIO state machine
+        self.output = output if output is not None else create_output(gpio_pin, self.numpix)
 
         # Initialize the pixel array
         self.np = array.array("I", [0 for _ in range(self.numpix)])
 
+        # Lookup table from (x, y) to LED number, index with y * width + x
+        self._xy = array.array("H", [self.coordinates_to_number(i % width, i // width) for i in range(self.numpix)])
+        self._blit_params = array.array("i", [0, 0, 0, 0])
+        self._mask_params = array.array("i", [0, 0, 0, 0, width, height, 0, 0])
+        self._image_words = array.array("I", bytes(self.numpix * 4)) # push_image converts into this, grown for larger images
+
+        # Copy of the last frame that was sent, show() skips frames that did not change
+        self._shown = array.array("I", [0 for _ in range(self.numpix)])
+        self._output_stale = True # Set when the output must be refreshed even if the buffer is unchanged
+        self.frames_pushed = 0
+        self.frames_skipped = 0
+
+        # The pixel array holds full intensity colors, brightness is applied to the output buffer in show()
+        self._brightness_lut = bytearray(256)
+        self._build_brightness_lut()
+
     def get_buffer_data(self) -> list:
         """
         Returns the buffer data as a list of RGB values.
         """
 
-        #return [pixel for pixel in self.np]
-        return [[(self.np[i] >> 8) & 0xff, (self.np[i] >> 16) & 0xff, self.np[i] & 0xff] for i in range(self.numpix)]
+        rgb = bytearray(self.numpix * 3)
+        kernels.unpack_rgb(self.np, rgb, self.numpix)
+        return [rgb[i:i + 3] for i in range(0, self.numpix * 3, 3)]
 
     def set_brightness(self, brightness_percent:int):
         """
@@ -281,6 +255,26 @@ class Matrix:
         elif brightness_percent < 0:
             brightness_percent = 0
         self.brightness = brightness_percent
+        self._build_brightness_lut()
+
+    def set_gamma(self, gamma:float):
+        """
+        Sets the gamma correction of the LEDs, 1.0 turns it off. Values around 2.2 make fades look more even.
+        """
+        self.gamma = gamma
+        self._build_brightness_lut()
+
+    def _build_brightness_lut(self):
+        """ Precomputes the output value of every color channel value for the current brightness and gamma """
+        lut = self._brightness_lut
+        for value in range(256):
+            if self.gamma == 1.0:
+                lut[value] = int(value * self.brightness // 100)
+            else:
+                lut[value] = int(255 * (value / 255) ** self.gamma * self.brightness / 100 + 0.5)
+
+        # The LEDs must be updated even if the buffer has not changed
+        self._output_stale = True
 
     def adjust_brightness(self, color, brightness) -> tuple:
         """
@@ -293,22 +287,31 @@ class Matrix:
         Returns:
         - Adjusted color tuple
         """
-        r, g, b = color
-        r = int(r * brightness)
-        g = int(g * brightness)
-        b = int(b * brightness)
-        return (r, g, b)
+        return fixed.scale_rgb(color, int(brightness * fixed.ONE))
 
     def clear(self):
         """ Clearing buffer """
-        for i in range(self.numpix):
-            self.np[i] = 0
+        self.fill((0, 0, 0))
 
-    def show(self):
-        """ Display data stored in buffer """
-        irq_state = machine.disable_irq()  # Disable interrupts
-        self.sm.put(self.np, 8)
-        machine.enable_irq(irq_state)  # Enable interrupts
+    def show(self, force:bool=False):
+        """
+        Display data stored in buffer. The frame is copied to the back buffer of the output with brightness
+        and gamma applied, and sent while the next frame is drawn. Only waits if the last frame is still being sent.
+
+        Frames identical to the last one sent are skipped unless force is True,
+        frames_pushed and frames_skipped count how often each happens.
+        """
+        # Comparing the arrays is a memcmp, much cheaper than sending the frame
+        if not force and not self._output_stale and self.np == self._shown:
+            self.frames_skipped += 1
+            return
+        self._shown[:] = self.np
+        self._output_stale = False
+        self.frames_pushed += 1
+
+        # Output words are GRB shifted up 8 bits, written byte by byte: 0, blue, red, green
+        kernels.scale_buffer(self.np, self.output.back_buffer(), self._brightness_lut, self.numpix)
+        self.output.swap()
 
     def coordinates_to_number(self, x, y):
         """ Translate coordinates to the correct LED number """
@@ -321,16 +324,10 @@ class Matrix:
 
     def set_np(self, num, color):
         """
-        Set color of selected neopixel
+        Set color of selected neopixel, brightness is applied when the buffer is shown
         """
-        if self.brightness == 100:
-            r, g, b = color
-            r, g, b = int(r), int(g), int(b)
-        else:
-            r, g, b = self.adjust_brightness(color, self.brightness / 100)
-
-
-        self.np[num] = (r << 8) | (g << 16) | b
+        r, g, b = color
+        self.np[num] = (int(r) << 8) | (int(g) << 16) | int(b)
 
     def set_pixel_color(self, x:int, y:int, color) -> None:
         """
@@ -342,8 +339,8 @@ class Matrix:
         - color: color to set the pixel to, should be tuple (R, G, B)
         """
         # check that the pixel is not out of range
-        if x < self.MATRIX_WIDTH and x >= 0 and y < self.MATRIX_HEIGHT and y >= 0:
-            self.set_np(self.coordinates_to_number(x, y), color)
+        if 0 <= x < self.MATRIX_WIDTH and 0 <= y < self.MATRIX_HEIGHT:
+            self.set_np(self._xy[y * self.MATRIX_WIDTH + x], color)
 
     # x and y are the leftmost starting point
     def set_horr_seg(self, x, y, color, length, show_on_matrix=True):
@@ -357,13 +354,7 @@ class Matrix:
         - length: Length of the segment.
         - show_on_matrix: Whether to display immediately or just update buffer.
         """
-
-        # Set pixels in buffer
-        for i in range(length):
-            x_coordinate = x + i
-            if x_coordinate < self.MATRIX_WIDTH and y < self.MATRIX_HEIGHT and x_coordinate >= 0 and y >= 0:
-                #self.strip.set_pixel(self.coordinates_to_number(x+i, y),color)
-                self.set_pixel_color(x+i,y,color)
+        self.hline(x, y, length, color)
 
         # Display the image
         if show_on_matrix == True:
@@ -380,32 +371,487 @@ class Matrix:
         - length: Length of the segment.
         - show_on_matrix: Whether to display immediately or just update buffer.
         """
-
-        # Set pixels in buffer
-        for i in range(length):
-            y_coordinate = y + 1
-            if y_coordinate < self.MATRIX_HEIGHT and x < self.MATRIX_WIDTH and y_coordinate >= 0 and x >= 0:
-                #self.strip.set_pixel(self.coordinates_to_number(x, y+i),color)
-                self.set_pixel_color(x,y+i,color)
+        self.vline(x, y, length, color)
 
         # Display the image
         if show_on_matrix == True:
             self.show()
 
+    #
+    # Bulk drawing. Each method clips once and writes runs of the buffer directly.
+    # Every row of the matrix is a continuous run of LEDs, left to right or right to left.
+    #
+    def pack_color(self, color) -> int:
+        """ Returns the buffer value (GRB) of an RGB tuple """
+        r, g, b = color
+        return (int(r) << 8) | (int(g) << 16) | int(b)
+
+    def fill(self, color):
+        """ Sets every pixel in the buffer to the selected color """
+        kernels.fill_words(self.np, self.pack_color(color), 0, self.numpix)
+
+    def fill_rect(self, x:int, y:int, width:int, height:int, color):
+        """
+        Fills a rectangle with the selected color.
+
+        Parameters:
+        - x, y: bottom leftmost corner
+        - width, height: size of the rectangle
+        - color: RGB tuple (R, G, B)
+        """
+        # Clip to the matrix
+        x1, y1 = x + width, y + height
+        if x < 0:
+            x = 0
+        if y < 0:
+            y = 0
+        if x1 > self.MATRIX_WIDTH:
+            x1 = self.MATRIX_WIDTH
+        if y1 > self.MATRIX_HEIGHT:
+            y1 = self.MATRIX_HEIGHT
+        if x >= x1 or y >= y1:
+            return
+
+        r, g, b = color
+        value = (int(r) << 8) | (int(g) << 16) | int(b)
+        np = self.np
+        xy = self._xy
+        run = x1 - x
+        width = self.MATRIX_WIDTH
+        row = y * width
+        end_row = y1 * width
+        while row < end_row:
+            start = xy[row + x]
+            end = xy[row + x1 - 1]
+            if end < start:
+                start = end
+            kernels.fill_words(np, value, start, run)
+            row += width
+
+    def hline(self, x:int, y:int, length:int, color):
+        """ Horizontal line from (x, y) to the right """
+        # Clip to the matrix
+        x1 = x + length
+        if x < 0:
+            x = 0
+        if x1 > self.MATRIX_WIDTH:
+            x1 = self.MATRIX_WIDTH
+        if x >= x1 or y < 0 or y >= self.MATRIX_HEIGHT:
+            return
+
+        r, g, b = color
+        value = (int(r) << 8) | (int(g) << 16) | int(b)
+        np = self.np
+        row = y * self.MATRIX_WIDTH
+        start = self._xy[row + x]
+        end = self._xy[row + x1 - 1]
+        if end < start:
+            start = end
+        kernels.fill_words(np, value, start, x1 - x)
+
+    def vline(self, x:int, y:int, length:int, color):
+        """ Vertical line from (x, y) and up """
+        # Clip to the matrix
+        y1 = y + length
+        if y < 0:
+            y = 0
+        if y1 > self.MATRIX_HEIGHT:
+            y1 = self.MATRIX_HEIGHT
+        if y >= y1 or x < 0 or x >= self.MATRIX_WIDTH:
+            return
+
+        r, g, b = color
+        value = (int(r) << 8) | (int(g) << 16) | int(b)
+        np = self.np
+        xy = self._xy
+        width = self.MATRIX_WIDTH
+        i = y * width + x
+        end = y1 * width
+        while i < end:
+            np[xy[i]] = value
+            i += width
+
+    def blit(self, x:int, y:int, width:int, height:int, data, key=None, start:int=0):
+        """
+        Copies an image to the buffer.
+
+        Parameters:
+        - x, y: bottom leftmost corner
+        - width, height: size of the image
+        - data: array("I") with buffer values (GRB, see pack_color), row by row from the top row
+        - key: buffer value that is transparent, None to copy every pixel
+        - start: index of the first value of the image in data
+        """
+        # Clip to the matrix
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.MATRIX_WIDTH), min(y + height, self.MATRIX_HEIGHT)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        # Row parameters for the kernel: first coordinate, first data word, count, key
+        params = self._blit_params
+        params[2] = x1 - x0
+        params[3] = -1 if key is None else key
+        for y_coordinate in range(y0, y1):
+            params[0] = y_coordinate * self.MATRIX_WIDTH + x0
+            params[1] = start + (y + height - 1 - y_coordinate) * width + x0 - x # Data starts with the top row
+            kernels.blit_row(self.np, self._xy, data, params)
+
+    def blit_mask(self, x:int, y:int, masks, start:int, count:int, color):
+        """
+        Sets the pixels of column bitmasks to a color, as used by the font glyphs (bitmap_font.py).
+
+        Parameters:
+        - x, y: bottom leftmost corner
+        - masks: array("H"), or bytearray (or a memoryview of bytes) with one mask per column, bit 0 is the bottom row
+        - start, count: the columns of masks to draw
+        """
+        r, g, b = color
+        params = self._mask_params
+        params[0] = x
+        params[1] = y
+        params[2] = count
+        params[3] = start
+        params[6] = (int(r) << 8) | (int(g) << 16) | int(b)
+        params[7] = 1 if isinstance(masks, array.array) else 0
+        kernels.blit_mask(self.np, self._xy, masks, params)
+
+    def copy_rows(self, source_y:int, destination_y:int, count:int):
+        """ Copies count rows starting at source_y to destination_y, the areas may overlap """
+        # Copy in the direction that does not overwrite rows before they are read
+        if destination_y > source_y:
+            i = count - 1
+            while i >= 0:
+                self._copy_row(source_y + i, destination_y + i)
+                i -= 1
+        else:
+            for i in range(count):
+                self._copy_row(source_y + i, destination_y + i)
+
+    def _copy_row(self, source_y:int, destination_y:int):
+        """ Copies one row, rows outside the matrix are skipped """
+        if 0 <= source_y < self.MATRIX_HEIGHT and 0 <= destination_y < self.MATRIX_HEIGHT:
+            np = self.np
+            xy = self._xy
+            source = source_y * self.MATRIX_WIDTH
+            destination = destination_y * self.MATRIX_WIDTH
+            for x in range(self.MATRIX_WIDTH):
+                np[xy[destination + x]] = np[xy[source + x]]
+
+    #
+    # Scrolling and rotation, done in place in the buffer
+    #
+    def _reverse_row(self, row:int, start:int, end:int):
+        """ Reverses the pixels start to end-1 (x-coordinates) of a row, row is y * width """
+        np = self.np
+        xy = self._xy
+        start += row
+        end += row - 1
+        while start < end:
+            i, j = xy[start], xy[end]
+            np[i], np[j] = np[j], np[i]
+            start += 1
+            end -= 1
+
+    def _reverse_rows(self, start:int, end:int):
+        """ Reverses the order of the rows start to end-1 """
+        np = self.np
+        xy = self._xy
+        width = self.MATRIX_WIDTH
+        end -= 1
+        while start < end:
+            top, bottom = end * width, start * width
+            for x in range(width):
+                i, j = xy[bottom + x], xy[top + x]
+                np[i], np[j] = np[j], np[i]
+            start += 1
+            end -= 1
+
+    def scroll(self, dx:int, dy:int, wrap:bool=False, color=(0, 0, 0)):
+        """
+        Moves the image in the buffer dx pixels to the right and dy pixels up.
+
+        Parameters:
+        - dx, dy: number of pixels to move, negative values move left and down
+        - wrap: pixels moved out on one side come in on the other side
+        - color: color of the uncovered pixels when wrap is False
+        """
+        width, height = self.MATRIX_WIDTH, self.MATRIX_HEIGHT
+
+        if dx:
+            if wrap:
+                # Rotate every row by reversing the two parts and then the whole row
+                shift = dx % width
+                row = 0
+                while row < self.numpix:
+                    self._reverse_row(row, 0, width - shift)
+                    self._reverse_row(row, width - shift, width)
+                    self._reverse_row(row, 0, width)
+                    row += width
+            else:
+                np = self.np
+                xy = self._xy
+                row = 0
+                while row < self.numpix:
+                    if dx > 0:
+                        x = width - 1
+                        while x >= dx:
+                            np[xy[row + x]] = np[xy[row + x - dx]]
+                            x -= 1
+                    else:
+                        for x in range(width + dx):
+                            np[xy[row + x]] = np[xy[row + x - dx]]
+                    row += width
+                if dx > 0:
+                    self.fill_rect(0, 0, dx, height, color)
+                else:
+                    self.fill_rect(width + dx, 0, -dx, height, color)
+
+        if dy:
+            if wrap:
+                shift = dy % height
+                self._reverse_rows(0, height - shift)
+                self._reverse_rows(height - shift, height)
+                self._reverse_rows(0, height)
+            else:
+                if dy > 0:
+                    self.copy_rows(0, dy, height - dy)
+                    self.fill_rect(0, 0, width, dy, color)
+                else:
+                    self.copy_rows(-dy, 0, height + dy)
+                    self.fill_rect(0, height + dy, width, -dy, color)
+
     def rotate_left(self, num_of_pixels=1):
         """
-        Rotate the pixels to the left
+        Rotate the pixels to the left, along the LED chain. Done in place
         """
-        self.np = self.np[num_of_pixels:] + self.np[:num_of_pixels]
+        np = self.np
+        numpix = self.numpix
+        num_of_pixels %= numpix
+
+        # Move every value once, following the cycles i <- i + num_of_pixels
+        moved = 0
+        start = 0
+        while moved < numpix and num_of_pixels:
+            first = np[start]
+            i = start
+            j = i + num_of_pixels
+            while True:
+                if j >= numpix:
+                    j -= numpix
+                if j == start:
+                    break
+                np[i] = np[j]
+                i = j
+                j += num_of_pixels
+                moved += 1
+            np[i] = first
+            moved += 1
+            start += 1
         self.show()
 
     def rotate_right(self, num_of_pixels=1):
         """
-        Rotate the pixels to the right
+        Rotate the pixels to the right, along the LED chain. Done in place
         """
-        num_of_pixels = -num_of_pixels
-        self.np = self.np[num_of_pixels:] + self.np[:num_of_pixels]
-        self.show()
+        self.rotate_left(self.numpix - num_of_pixels % self.numpix)
+
+class Layer:
+    """
+    Image layer for the Compositor. Has the same drawing methods as the matrix for pixels, lines,
+    rectangles, images (blit) and glyphs (blit_mask), so the clock and the digits can be drawn on it
+    (see the target of set_num() and update_clock()). Bottom left corner is (0,0).
+
+    Atributes:
+    - width, height: size of the layer
+    - x, y: position of the bottom left corner on the matrix
+    - visible: hidden layers are not drawn
+    - alpha: opacity 0-255
+    - key: buffer value (GRB) that is transparent, None if every pixel is drawn
+    """
+
+    def __init__(self, width:int, height:int, x:int=0, y:int=0, alpha:int=255, key=0) -> None:
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self.visible = True
+        self.alpha = alpha
+        self.key = key
+        self.buffer = array.array("I", [0 for _ in range(width * height)])
+        self.changed = True # Set by every change, cleared by the compositor
+
+        # The buffer is row by row from the bottom, so the index table of the kernels is 0, 1, 2...
+        self._index = array.array("H", range(width * height))
+        self._blit_params = array.array("i", [0, 0, 0, 0])
+        self._mask_params = array.array("i", [0, 0, 0, 0, width, height, 0, 0])
+
+    def move(self, x:int, y:int) -> None:
+        """ Moves the layer to a new position """
+        if x != self.x or y != self.y:
+            self.x, self.y = x, y
+            self.changed = True
+
+    def set_visible(self, visible:bool) -> None:
+        if visible != self.visible:
+            self.visible = visible
+            self.changed = True
+
+    def set_alpha(self, alpha:int) -> None:
+        """ Sets the opacity, 0-255 """
+        alpha = max(0, min(255, alpha))
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self.changed = True
+
+    def set_pixel_color(self, x:int, y:int, color) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            r, g, b = color
+            self.buffer[y * self.width + x] = (int(r) << 8) | (int(g) << 16) | int(b)
+            self.changed = True
+
+    def fill_rect(self, x:int, y:int, width:int, height:int, color) -> None:
+        r, g, b = color
+        value = (int(r) << 8) | (int(g) << 16) | int(b)
+        x0, x1 = max(x, 0), min(x + width, self.width)
+        if x0 < x1:
+            for row in range(max(y, 0), min(y + height, self.height)):
+                kernels.fill_words(self.buffer, value, row * self.width + x0, x1 - x0)
+        self.changed = True
+
+    def hline(self, x:int, y:int, length:int, color) -> None:
+        self.fill_rect(x, y, length, 1, color)
+
+    def vline(self, x:int, y:int, length:int, color) -> None:
+        self.fill_rect(x, y, 1, length, color)
+
+    def fill(self, color) -> None:
+        self.fill_rect(0, 0, self.width, self.height, color)
+
+    def blit(self, x:int, y:int, width:int, height:int, data, key=None, start:int=0) -> None:
+        """ Copies an image to the layer, like Matrix.blit() """
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, self.width), min(y + height, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        params = self._blit_params
+        params[2] = x1 - x0
+        params[3] = -1 if key is None else key
+        for y_coordinate in range(y0, y1):
+            params[0] = y_coordinate * self.width + x0
+            params[1] = start + (y + height - 1 - y_coordinate) * width + x0 - x # Data starts with the top row
+            kernels.blit_row(self.buffer, self._index, data, params)
+        self.changed = True
+
+    def blit_mask(self, x:int, y:int, masks, start:int, count:int, color) -> None:
+        """ Sets the pixels of column bitmasks to a color, like Matrix.blit_mask() """
+        r, g, b = color
+        params = self._mask_params
+        params[0] = x
+        params[1] = y
+        params[2] = count
+        params[3] = start
+        params[6] = (int(r) << 8) | (int(g) << 16) | int(b)
+        params[7] = 1 if isinstance(masks, array.array) else 0
+        kernels.blit_mask(self.buffer, self._index, masks, params)
+        self.changed = True
+
+    def clear(self) -> None:
+        self.fill((0, 0, 0))
+
+class Compositor:
+    """
+    Stacks layers on top of each other and flattens them into the matrix buffer.
+
+    The result after each layer is kept, so when a layer changes only that layer and the ones
+    above it are drawn again. A static background is drawn once.
+
+    - add_layer(): put a layer on top
+    - show(): flatten the changed layers and display the result
+    """
+
+    def __init__(self, matrix, max_layers:int=4) -> None:
+        self.matrix = matrix
+        self.max_layers = max_layers
+        self.layers = []
+        self._results = [] # Buffer contents after each layer, same layout as matrix.np
+        self._restack = True
+
+    def add_layer(self, layer):
+        """ Adds a layer on top of the others and returns it """
+        if len(self.layers) >= self.max_layers:
+            raise ValueError("Too many layers")
+        self.layers.append(layer)
+        self._results.append(array.array("I", [0 for _ in range(self.matrix.numpix)]))
+        self._restack = True
+        return layer
+
+    def remove_layer(self, layer) -> None:
+        index = self.layers.index(layer)
+        self.layers.pop(index)
+        self._results.pop(index)
+        self._restack = True
+
+    def compose(self) -> bool:
+        """ Flattens the layers into the matrix buffer. Returns False if nothing had changed """
+        # Find the lowest layer that changed
+        start = 0 if self._restack else len(self.layers)
+        for i in range(start):
+            if self.layers[i].changed:
+                start = i
+                break
+        if start == len(self.layers):
+            return False
+        self._restack = False
+
+        for i in range(start, len(self.layers)):
+            result = self._results[i]
+            if i == 0:
+                kernels.fill_words(result, 0, 0, len(result))
+            else:
+                result[:] = self._results[i - 1]
+
+            layer = self.layers[i]
+            if layer.visible and layer.alpha > 0:
+                self._draw_layer(layer, result)
+            layer.changed = False
+
+        if self.layers:
+            self.matrix.np[:] = self._results[-1]
+        else:
+            self.matrix.clear()
+        return True
+
+    def show(self) -> None:
+        """ Flattens the changed layers and displays the result """
+        self.compose()
+        self.matrix.show()
+
+    def _draw_layer(self, layer, result) -> None:
+        """ Draws a layer on top of result """
+        matrix = self.matrix
+        xy = matrix._xy
+        buffer = layer.buffer
+        key = layer.key
+        alpha = layer.alpha
+
+        # Clip to the matrix
+        x0, y0 = max(layer.x, 0), max(layer.y, 0)
+        x1 = min(layer.x + layer.width, matrix.MATRIX_WIDTH)
+        y1 = min(layer.y + layer.height, matrix.MATRIX_HEIGHT)
+
+        for y in range(y0, y1):
+            row = y * matrix.MATRIX_WIDTH
+            source = (y - layer.y) * layer.width - layer.x
+            for x in range(x0, x1):
+                value = buffer[source + x]
+                if value == key:
+                    continue
+                led = xy[row + x]
+                if alpha < 255:
+                    value = fixed.blend_word(value, result[led], alpha) # Blend with the result below
+                result[led] = value
 
 class Matrix_fun(Matrix):
     """
@@ -421,291 +867,295 @@ class Matrix_fun(Matrix):
     pink = (255,20,147)
     colors_rgb = [red, orange, yellow, green, blue, indigo, violet]
 
-    def __init__(self, width: int, height: int, gpio_pin: int) -> None:
-        super().__init__(width, height, gpio_pin)
-        # Required in some methodes
+    def __init__(self, width: int, height: int, gpio_pin: int, output=None) -> None:
+        super().__init__(width, height, gpio_pin, output)
+        # Set to stop the running event, see the run property
+        self.stop_event = Event_flag()
         self.run = False
         # Required in the setClock method
         self.minute = 0
-
-    def wait(self, wait_time: float) -> None:
-        """ Stops the program for x-amount of time """
-        last_display_time = time.time()
-
-        while self.run:
-            current_time = time.time()
-            elapsed_time = current_time - last_display_time
-
-            if elapsed_time > wait_time:
-                return
-
-    def set_num(self, num:int, x:int, y:int, color, size:int=0, show:bool=True):
-        """ Shows selected number on LED matrix (only one digit 0-9) """
-        if num == 0:
-            set_0(self,x, y, color, size, show)
-        elif num == 1:
-            set_1(self,x, y, color, size, show)
-        elif num == 2:
-            set_2(self,x, y, color, size, show)
-        elif num == 3:
-            set_3(self,x, y, color, size, show)
-        elif num == 4:
-            set_4(self,x, y, color, size, show)
-        elif num == 5:
-            set_5(self,x, y, color, size, show)
-        elif num == 6:
-            set_6(self,x, y, color, size, show)
-        elif num == 7:
-            set_7(self,x, y, color, size, show)
-        elif num == 8:
-            set_8(self,x, y, color, size, show)
-        elif num == 9:
-            set_9(self,x, y, color, size, show)
+        # Ticker of the running clock, has the wake up count and CPU time per minute
+        self.clock_ticker = None
+        # Framebuf drawing surface, see use_canvas()
+        self.canvas = None
+        # Plays the effects, see animation.py
+        self.animator = Animator(self)
+        # Screen changes, see transitions.py
+        self.transition = Transition(self)
+
+    @property
+    def run(self) -> bool:
+        """ True while the running event should keep going, setting it to False stops the event right away """
+        return not self.stop_event.is_set()
+
+    @run.setter
+    def run(self, value:bool) -> None:
+        if value:
+            self.stop_event.clear()
         else:
+            self.stop_event.set()
+
+    def use_canvas(self, canvas=None):
+        """
+        Draw through a canvas (see canvas.py), its content replaces the buffer every show().
+        Returns the canvas, call without a canvas to draw on the buffer directly again.
+        """
+        self.canvas = canvas
+        return canvas
+
+    def show(self, force:bool=False):
+        """ Display data stored in buffer, converted from the canvas if one is in use """
+        if self.canvas is not None:
+            self.canvas.render(self)
+        super().show(force)
+
+    def wait(self, wait_time: float) -> bool:
+        """ Stops the program for x-amount of seconds, returns False right away if the event is stopped """
+        return not self.stop_event.wait(int(wait_time * 1000))
+
+    def set_num(self, num:int, x:int, y:int, color, size:int=0, show:bool=True, target=None):
+        """ Shows selected number on LED matrix (only one digit 0-9), or draws it on target (a Layer) """
+        if not 0 <= num <= 9:
             print("ERR, first parameter (num) must be between 0-9")
             return "err"
 
+        masks = load_font(5 + size * 2).glyph(48 + num) # "0" is code point 48
+        (target or self).blit_mask(x, y, masks, 0, len(masks), color)
+
+        if show:
+            self.show()
+
     def set_symbol(self, symbol:str, x:int, y:int, color):
         """ Pushes the selected symbol to the fram buffer, requiers "self.show()" """
-        symbol = symbol.lower()
-
-        # If it is a digit
-        try:
-            number = int(symbol)
-            self.set_num(number,x,y,color,show=False)
-        except ValueError:
-            pass
-
-        if symbol == "a": set_a(self, x,y,color)
-        elif symbol == "b": set_b(self,x,y,color)
-        elif symbol == "c": set_c(self,x,y,color)
-        elif symbol == "d": set_d(self,x,y,color)
-        elif symbol == "e": set_e(self,x,y,color)
-        elif symbol == "f": set_f(self,x,y,color)
-        elif symbol == "g": set_g(self,x,y,color)
-        elif symbol == "h": set_h(self,x,y,color)
-        elif symbol == "i": set_i(self,x,y,color)
-        elif symbol == "j": set_j(self,x,y,color)
-        elif symbol == "k": set_k(self,x,y,color)
-        elif symbol == "l": set_l(self,x,y,color)
-        elif symbol == "m": set_m(self,x,y,color)
-        elif symbol == "n": set_n(self,x,y,color)
-        elif symbol == "o": set_o(self,x,y,color)
-        elif symbol == "p": set_p(self,x,y,color)
-        elif symbol == "q": set_q(self,x,y,color)
-        elif symbol == "r": set_r(self,x,y,color)
-        elif symbol == "s": set_s(self,x,y,color)
-        elif symbol == "t": set_t(self,x,y,color)
-        elif symbol == "u": set_u(self,x,y,color)
-        elif symbol == "v": set_v(self,x,y,color)
-        elif symbol == "w": set_w(self,x,y,color)
-        elif symbol == "x": set_x(self,x,y,color)
-        elif symbol == "y": set_y(self,x,y,color)
-        elif symbol == "z": set_z(self,x,y,color)
-        elif symbol == ".": set_dot(self,x,y,color)
-        elif symbol == ":": set_colon(self,x,y,color)
-        elif symbol == "!": set_exclamation_mark(self, x, y, color)
-        elif symbol == "?": set_question_mark(self, x, y, color)
-        elif symbol == "-": set_hyphen(self,x,y,color)
-        else:
+        masks = load_font().glyph(symbol.lower()) if len(symbol) == 1 else None
+        if masks is None:
             #print("ERR. Does not exist")
             return "ERR, symbol does not exist"
 
-    def show_text(self, text:str, color, y:int, delay:float=0.075, run_times:int=-1):
-        """ Shows a scrolling text, run_time = -1 -> infinite """
+        self.blit_mask(x, y, masks, 0, len(masks), color)
+
+    def show_text(self, text:str, color, y:int, delay:float=0.075, run_times:int=-1, proportional:bool=False):
+        """
+        Shows a scrolling text, run_time = -1 -> infinite
+        The text is rendered once to a Text_strip, every step only copies the visible columns.
+        delay is the time per pixel step, kept with ticks_us deadlines so drawing does not slow the text down.
+        proportional: place the letters by their width instead of every 5 columns
+        """
 
-        numbers = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]
-        text = text.lower()
+        strip = Text_strip(text.lower(), None if proportional else 5)
         x = self.MATRIX_WIDTH - 1
+        step_us = int(delay * 1_000_000)
+        next_step = time.ticks_us()
 
         try:
             while self.run == True or run_times > 0:
-                x_sep = 0
                 self.clear()
-                i = 1
-                for letter in text:
-                    x_sep += 5
-                    # Avoid error, if not space
-                    if letter != " ":
-                        # If it is a number
-                        if letter in numbers:
-                            self.set_num(int(letter), x+x_sep, y, color, show=False)
-                        # If it is not a number
-                        else:
-                            self.set_symbol(letter, x+x_sep, y, color)
-                    # If we have reatched the end
-                    if i == len(text) and (x+x_sep == 0):
-                        x = 15
-                        # If run times is selected
-                        if run_times != -1:
-                            run_times -= 1
-                    i += 1
+                strip.draw(self, x+5, y, color) # The first letter is one letter width right of x
+                # If we have reatched the end
+                if x + strip.width == 0:
+                    x = 15
+                    # If run times is selected
+                    if run_times != -1:
+                        run_times -= 1
                 self.show()
-                time.sleep(delay)
+
+                # Wait for the next step
+                next_step = time.ticks_add(next_step, step_us)
+                remaining = time.ticks_diff(next_step, time.ticks_us())
+                if remaining > 0 and run_times > 0:
+                    time.sleep_us(remaining) # Runs to the end, even when the event is stopped
+                elif remaining > 0:
+                    self.stop_event.wait_until(next_step)
+                else:
+                    next_step = time.ticks_us() # Behind, count from now instead of catching up
                 x -= 1
 
         except Exception as e:
             print("Thread Exception:", e)
 
-    def setClock_hour(self, color, x:int=0, y:int=5):
-        """ Function push hour to frame buffer """
+    def setClock_hour(self, color, x:int=0, y:int=5, hour:int=None, target=None):
+        """ Function push hour to frame buffer (or target), the current hour if hour is None """
         size = 0
-        hour = time.localtime()[3]
+        if hour is None:
+            hour = time_service.localtime()[3]
         if hour < 10: # If only one digit
-            self.set_num(hour, x+3, y, color, size, show=False)
+            self.set_num(hour, x+3, y, color, size, show=False, target=target)
         else:
             hour_1 = hour // 10
             hour_2 = hour % 10
-            self.set_num(hour_1, x, y, color, size, show=False)
-            self.set_num(hour_2, x+4, y, color, size, show=False)
+            self.set_num(hour_1, x, y, color, size, show=False, target=target)
+            self.set_num(hour_2, x+4, y, color, size, show=False, target=target)
 
-    def setClock_min(self, color, x:int=0, y:int=5):
-        """ Function push minutes to frame buffer """
+    def setClock_min(self, color, x:int=0, y:int=5, minute:int=None):
+        """ Function push minutes to frame buffer, the current minute if minute is None """
         size = 0
-        minute = time.localtime()[4]
+        if minute is None:
+            minute = time_service.localtime()[4]
         min_1 = minute // 10
         min_2 = minute % 10
 
         self.set_num(min_1, x+9, y, color, size, show=False) # The possition might need to change depending on the size of the matrix
         self.set_num(min_2, x+13, y, color, size, show=False)
 
-    def show_clock(self, color, x:int=0, y:int=5): #setClock
+    def update_clock(self, color, x:int, y:int, now, shown=None, target=None):
         """
-        This function displays the current time on the matrix
-        It use setClock_hour and setClock_min in adition to adding a dot as seperator
+        Draws the time now (a time_service.localtime() tuple) to the frame buffer, or to target (a Layer),
+        only the digits that differ from shown (the (hour, minute) drawn, None to draw everything) and the
+        blinking dot. Returns the new (hour, minute).
         """
+        target = target or self
+        hour, minute = now[3], now[4]
+        if shown is None or shown[0] != hour:
+            target.fill_rect(x, y, 7, 5, (0,0,0))
+            self.setClock_hour(color, x, y, hour, target)
+        if shown is None or shown[1] // 10 != minute // 10:
+            target.fill_rect(x+9, y, 3, 5, (0,0,0))
+            self.set_num(minute // 10, x+9, y, color, show=False, target=target)
+        if shown is None or shown[1] % 10 != minute % 10:
+            target.fill_rect(x+13, y, 3, 5, (0,0,0))
+            self.set_num(minute % 10, x+13, y, color, show=False, target=target)
+
+        # Make dot blink every second
+        if now[5] % 2 == 0:
+            dot = fixed.scale(int(color[0]), 128) # Half brightness
+            target.set_pixel_color(x+7,y,(dot,dot,dot)) # dot
+        else:
+            target.set_pixel_color(x+7,y,(0,0,0)) # dot
 
-        # First time initialization
-        self.minute = time.localtime()[4]
-        #self.strip.set_pixel(self.coordinates_to_number(x+7, y),color) # dot
-        self.set_pixel_color(x+7,y,(color[0]*0.5,color[0]*0.5,color[0]*0.5)) # dot
-        self.setClock_hour(color, x, y)
-        self.setClock_min(color, x, y)
+        self.minute = minute
+        return (hour, minute)
 
-        self.show()
-
-        while self.run == True:
-            # Make dot blink every second
-            if time.localtime()[5] % 2 == 0:
-                #self.strip.set_pixel(self.coordinates_to_number(x+7, y),(color[0]*0.5,color[0]*0.5,color[0]*0.5)) # dot
-                self.set_pixel_color(x+7,y,(color[0]*0.5,color[0]*0.5,color[0]*0.5)) # dot
-                self.show()
-            else:
-                #self.strip.set_pixel(self.coordinates_to_number(x+7, y),(0,0,0)) # dot
-                self.set_pixel_color(x+7,y,(0,0,0)) # dot
-                self.show()
+    def show_clock(self, color, x:int=0, y:int=5): #setClock
+        """
+        This function displays the current time on the matrix
+        It use setClock_hour and setClock_min in adition to adding a dot as seperator
 
-            # Checks if the minutes have changed
-            if self.minute != time.localtime()[4]:
-                self.clear() # Clear display
-                self.minute = time.localtime()[4]
+        Sleeps until the next second instead of polling the time, see self.clock_ticker for the CPU time it uses
+        """
+        ticker = Ticker()
+        self.clock_ticker = ticker
+        shown = None
 
-                self.setClock_hour(color, x, y)
-                self.setClock_min(color, x, y)
+        # Wakes up once per second, reads the time once and redraws what has changed
+        while True:
+            shown = self.update_clock(color, x, y, time_service.localtime(), shown)
+            self.show()
+            if not ticker.wait(self):
+                return
 
-                self.show()
+    def show_weather_clock(self, color, y:int=5, dim:int=80):
+        """
+        The clock on top of the weather icon, the icon dimmed to dim / 255 so the digits stand out.
+        Drawn with the Compositor (two layers), every second only the clock layer is drawn again.
+        """
+        icon = WEATHER_ICONS.get(wd.weather_data["symbol_code_id"])
+        image = self.get_figure(f"weather_icons/{icon}" if icon is not None else "exclamation_mark")
+
+        compositor = Compositor(self, max_layers=2)
+        background = compositor.add_layer(Layer(self.MATRIX_WIDTH, self.MATRIX_HEIGHT, alpha=dim, key=None))
+        if image is not None:
+            background.blit(0, 0, image.width, image.height, image.words)
+        clock = compositor.add_layer(Layer(self.MATRIX_WIDTH, 5, 0, y)) # Black is transparent
+
+        ticker = Ticker()
+        self.clock_ticker = ticker
+        shown = None
+        while True:
+            shown = self.update_clock(color, 0, 0, time_service.localtime(), shown, clock)
+            compositor.show()
+            if not ticker.wait(self):
+                return
 
     def show_rainbow_effects(self, time_between:float) -> None:
-        """ Show different rainbow effects """
-
-        number = 2
-        last_display_time = time.time()
-
-        # So we do not need to wait
-        rainbow_spiral(self,time_between//2)
-
-        while self.run:
-
-            # Calculate time passed
-            current_time = time.time()
-            elapsed_time = current_time - last_display_time
-
-            # Display different effects
-            if number == 1:
-                rainbow_spiral(self,time_between//2)
-            elif number == 2:
-                rainbow_wave(self,25*time_between)
-            elif number == 3:
-                randomRGB(self,time_between)
-            elif number == 4:
-                firework_animation(self)
-            elif number == 5:
-                balls_bouncing_animation(self,4,time_between)
-
-            # If enoughf time has passed
-            if elapsed_time > time_between:
-
-                if number > 5:
-                    number = 1
-                else:
-                    number += 1
-
-                self.clear()
-                last_display_time = current_time
+        """ Show different rainbow effects, each for time_between seconds """
+        Playlist([
+            (lambda: rainbow_spiral_effect(self), time_between, 60),
+            (lambda: rainbow_wave_effect(self), time_between, 30),
+            (lambda: random_rgb_effect(self), time_between, None),
+            (lambda: firework_effect(self), time_between, None),
+            (lambda: balls_effect(self, 4), time_between, None),
+            (lambda: rain_effect(self), time_between, 30),
+            (lambda: snow_effect(self), time_between, 20),
+        ]).play(self.animator)
 
     # Internet symbol
     def setFig_wifi(self, color, numer_show:int=4, show=True):
         """" Shows a wifi sybol by the selected color and number of lines """
         # Seperated by the dots
         if numer_show >= 1:
-            self.set_horr_seg(7, 0, color, 2, show)
-            self.set_horr_seg(7, 1, color, 2, show)
+            self.fill_rect(7, 0, 2, 2, color)
 
         if numer_show >= 2:
-            self.set_horr_seg(5, 2, color, 1, show)
-            self.set_horr_seg(10, 2, color, 1, show)
-            self.set_horr_seg(5, 3, color, 6, show)
-            self.set_horr_seg(6, 4, color, 4, show)
+            self.hline(5, 2, 1, color)
+            self.hline(10, 2, 1, color)
+            self.hline(5, 3, 6, color)
+            self.hline(6, 4, 4, color)
 
         if numer_show >= 3:
-            self.set_vert_seg(4, 5, color, 2, show)
-            self.set_vert_seg(5, 6, color, 2, show)
-            self.set_horr_seg(5, 7, color, 5, show)
-            self.set_horr_seg(6, 8, color, 4, show)
-            self.set_vert_seg(11, 5, color, 2, show)
-            self.set_vert_seg(10, 6, color, 2, show)
+            self.vline(4, 5, 2, color)
+            self.vline(5, 6, 2, color)
+            self.hline(5, 7, 5, color)
+            self.hline(6, 8, 4, color)
+            self.vline(11, 5, 2, color)
+            self.vline(10, 6, 2, color)
 
         if numer_show >= 4:
-            self.set_vert_seg(0, 8, color, 2, show)
-            self.set_vert_seg(1, 9, color, 2, show)
-            self.set_vert_seg(2, 10, color, 2, show)
+            self.vline(0, 8, 2, color)
+            self.vline(1, 9, 2, color)
+            self.vline(2, 10, 2, color)
+
+            self.fill_rect(3, 11, 10, 2, color)
 
-            self.set_horr_seg(3, 11, color, 10, show)
-            self.set_horr_seg(3, 12, color, 10, show)
+            self.vline(15, 8, 2, color)
+            self.vline(14, 9, 2, color)
+            self.vline(13, 10, 2, color)
 
-            self.set_vert_seg(15, 8, color, 2, show)
-            self.set_vert_seg(14, 9, color, 2, show)
-            self.set_vert_seg(13, 10, color, 2, show)
+        if show:
+            self.show()
 
     def show_smileys(self, time_between: float) -> None:
         """
         Display the emojis stored in emoji folder in random order
         """
-        self.cycle_images("figures/emojis", time_between, True)
+        self.cycle_figures("emojis", time_between, True)
 
-    def get_bitmap_data(self, bitmap_file: str) -> list:
-        """ Get PPM P3 file data and return it as a list """
-
-        # Epty list to store the image data
-        filedata_list = []
-
-        # Open selected file
+    def get_bitmap_data(self, bitmap_file: str, image=None):
+        """
+        Returns the image of a file (.lbi, or PPM P3) as an Image (see image_file.py), None on errors.
+        The image comes from the image cache (see image_cache.py), do not change it. Give image to load
+        the file into its buffer instead, without the cache.
+        """
         try:
-            with open(bitmap_file, "r") as file:
-                # Stores file data in a list with lists
-                for row in file:
-                    row = row.strip().split(" ", 3) # Remove trayling tags and split into sublist
-                    filedata_list.append(row)
+            if image is None:
+                return image_cache.cache.get(bitmap_file)
+            return load_image(bitmap_file, image)
         except OSError as e:
             print(f"ERR, could not find file: {e}")
-            return "ERR, could not find file"
-
-        # Check for correct file format
-        if filedata_list[0][0] != "P3":
+        except ValueError:
             print("File format is not suported")
-            return None
-        else:
-            return filedata_list
+        return None
+
+    def get_figure(self, name: str, image=None):
+        """
+        Returns a figure by name, its path in figures/ without the extension ("weather_icons/sun"), None on errors.
+        A frozen figure (see frozen_assets.py) is returned as it is. Else it is read from the asset bundle
+        (see asset_bundle.py), or from its .lbi file if the bundle does not have it. Like get_bitmap_data(),
+        the image is cached unless image is given.
+        """
+        frozen = frozen_assets.image(name)
+        if frozen is not None:
+            return frozen
+
+        bundle = asset_bundle.open_bundle()
+        if bundle is None or name not in bundle:
+            return self.get_bitmap_data(f"{asset_bundle.FIGURE_DIR}/{name}{EXTENSION}", image)
+        if image is not None:
+            return bundle.image(name, image)
+        return image_cache.cache.get(bundle.path, name)
+
+    def show_figure(self, name: str, x:int = 0, y:int = 0, show:bool = True) -> None:
+        """ Displays a figure by name (see get_figure()) like show_bitmap() """
+        self.show_bitmap(name, x, y, self.get_figure(name), show)
 
     def push_image(self, width: int, hight: int, data: list, x: int=0, y: int=0) -> None:
         """
@@ -715,13 +1165,21 @@ class Matrix_fun(Matrix):
         - y: y-coordinate to bottom leftmost corner
         - width: image width
         - hight: image hight
-        - data: list with tuples (r,g,b)
+        - data: list with tuples (r,g,b), or bytes with r, g, b per pixel
         """
 
-        for i in range(hight): # Columns
-            for j in range(width): # Rows
-                color = tuple(int(c) for c in data[i * width + j])
-                self.set_pixel_color(x + j, y + hight - i -1, color) # Set pixel
+        # Convert to buffer values, then copy the image row by row
+        count = width * hight
+        words = self._image_words
+        if len(words) < count:
+            words = self._image_words = array.array("I", bytes(count * 4))
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            kernels.pack_rgb(data, words, count)
+        else:
+            for i in range(count):
+                r, g, b = data[i][:3]
+                words[i] = (int(g) << 16) | (int(r) << 8) | int(b)
+        self.blit(x, y, width, hight, words)
 
     def push_image_reverse_lines(self, width: int, hight: int, data: list, x: int=0, y: int=0) -> None:
         """
@@ -734,45 +1192,48 @@ class Matrix_fun(Matrix):
         - data: list with tuples (r,g,b)
         """
 
+        xy = self._xy
         index = 0
         for i in range(self.MATRIX_HEIGHT):
+            y_coordinate = i + y
+            # Row is outside the matrix, skip its pixels
+            if y_coordinate < 0 or y_coordinate >= self.MATRIX_HEIGHT:
+                index += self.MATRIX_WIDTH
+                continue
+            row = y_coordinate * self.MATRIX_WIDTH
             for j in range(self.MATRIX_WIDTH):
 
                 if i % 2 == 0:
-                    self.set_pixel_color(j + x, i + y, data[index])
+                    x_coordinate = j + x
                 # Reverse
                 else:
-                    self.set_pixel_color(self.MATRIX_WIDTH - j - 1 - x, i + y, data[index])
+                    x_coordinate = self.MATRIX_WIDTH - j - 1 - x
 
+                if 0 <= x_coordinate < self.MATRIX_WIDTH:
+                    self.set_np(xy[row + x_coordinate], data[index])
 
                 index += 1
 
-    def show_bitmap(self, bitmap_file: str, x:int = 0, y:int = 0, filedata:list=[], show:bool = True) -> None:
+    def show_bitmap(self, bitmap_file: str, x:int = 0, y:int = 0, filedata=None, show:bool = True) -> None:
         """
-        Displays a PPM P3 image on the matrix.
+        Displays an image file (.lbi, or PPM P3) on the matrix.
         Parameters:
         - bitmap_file: filepath to image
         - x: bottom leftmost corner
         - y: bottom leftmost corner
+        - filedata: an image from get_bitmap_data, used instead of the file
         - show: show the image immediately, or just add to buffer
         """
 
         # If data was not given, get data
-        if not filedata:
-            filedata_list = self.get_bitmap_data(bitmap_file)
+        image = filedata if filedata else self.get_bitmap_data(bitmap_file)
 
-            # If there was a problem getting the data
-            if filedata_list is None:
-                raise ValueError("Error: Unable to load bitmap data.")
-        else:
-            filedata_list = filedata
-
-        # Get file with and hight
-        image_width = int(filedata_list[1][0])
-        image_hight = int(filedata_list[1][1])
+        # If there was a problem getting the data
+        if image is None:
+            raise ValueError("Error: Unable to load bitmap data.")
 
-        # Push data to frame buffer
-        self.push_image(image_width, image_hight, filedata_list[3:], x, y)
+        # Copy to frame buffer
+        self.blit(x, y, image.width, image.height, image.words)
 
         # Show image if set to True
         if show:
@@ -786,90 +1247,112 @@ class Matrix_fun(Matrix):
         if images is None:
             self.show_text("No images",(255,255,255),5)
 
-    def image_tansition_current_up(self, start_y: int=0) -> None:
-        """ Moves the current image up and out """
-
-        # Get image data from buffer
-        filedata = self.get_buffer_data()
+    def image_tansition_current_up(self, start_y: int=0, fps:int=60) -> None:
+        """ Moves the current image up and out, or in from below if start_y is -MATRIX_HEIGHT """
+        transition = self.transition
+        if start_y < 0:
+            transition.capture(transition.incoming)
+            transition.clear(transition.outgoing)
+        else:
+            transition.capture(transition.outgoing)
+            transition.clear(transition.incoming)
+        self.animator.play(transition.slide(UP), fps=fps)
 
-        # Animation
-        for i in range(self.MATRIX_HEIGHT+1):
-            self.clear()
-            self.push_image_reverse_lines(self.MATRIX_WIDTH, self.MATRIX_HEIGHT, filedata, y = i + start_y)
-            self.show()
+    def image_transition_up(self, filepath, start_y: int=0) -> None:
+        """ Moves the image up, out of the matrix or in from below if start_y is -MATRIX_HEIGHT """
+        self.clear()
+        self.show_bitmap(filepath, show=False)
+        self.image_tansition_current_up(start_y)
 
-            # Quicken escape
-            if self.run != True:
-                break
+    def change_screen(self, draw, kind:str="slide", direction:int=UP, fps:int=30) -> bool:
+        """
+        Draws a new screen with draw() and changes to it with a transition (see transitions.py):
+        kind is "slide", "wipe" or "fade". Returns False if the event was stopped during the transition.
+        """
+        transition = self.transition
+        transition.capture(transition.outgoing)
+        self.clear()
+        draw()
+        transition.capture(transition.incoming)
+        return self.animator.play(transition.play(kind, direction), fps=fps)
+
+    def image_cycle_effect(self, load, files: list, time_between: float, random_index: bool=False,
+                           kind:str="slide"):
+        """
+        Effect showing the images one after another, changing with a transition (slide, wipe or fade).
+        load(file) returns the image of an entry in files.
+        """
 
-    def image_transition_up(self, filepath, start_y: int=0) -> None:
-        """ Moves the image up"""
+        # Display first image
+        index = 0
+        self.clear()
+        self.show_bitmap(files[index], filedata=load(files[index]), show=False)
 
-        # Get image data
-        filedata = self.get_bitmap_data(filepath)
+        # Cycle through the images
+        transition = self.transition
+        while True:
+            yield int(time_between * 1000)
+
+            # Random index
+            if random_index:
+                index =  random.randint(0, len(files)-1)
+            # Sequential index
+            else:
+                if index < len(files)-1:
+                    index += 1
+                else:
+                    index = 0
 
-        # Animation
-        for i in range(self.MATRIX_HEIGHT+1):
+            # The new image pushes the old one out
+            transition.capture(transition.outgoing)
             self.clear()
-            self.show_bitmap("", filedata=filedata, y=i + start_y)
+            self.show_bitmap(files[index], filedata=load(files[index]), show=False)
+            transition.capture(transition.incoming)
+            yield from transition.play(kind, UP)
 
-            # Quicken escape
-            if self.run != True:
-                break
-
-    def cycle_images(self, folder_path: str, time_between: float, random_index: bool=False) -> None:
-        """ Cycle through images in selected folder """
+    def cycle_images(self, folder_path: str, time_between: float, random_index: bool=False, kind:str="slide"):
+        """ Cycle through images in selected folder, returns None if there are no images """
 
         # Get filenames
-        files = get_files(folder_path, "ppm")
+        files = list_images(folder_path)
 
         # If no files where found
         if not files:
             return None
 
-        # Display first image
-        index = 0
-        show = f"{folder_path}/{files[index]}"
-        self.show_bitmap(show)
-
-        last_display_time = time.time()
-
-        # Cycle through the images
-        while self.run:
-            current_time = time.time()
-            elapsed_time = current_time - last_display_time
-
-            # Avoid error
-            if elapsed_time < 0:
-                last_display_time = current_time - time_between
-
-            # If the spessified time has passed
-            if elapsed_time > time_between:
-                # Random index
-                if random_index:
-                    index =  random.randint(0, len(files)-1)
-                # Sequential index
-                else:
-                    if index < len(files)-1:
-                        index += 1
-                    else:
-                        index = 0
-
-                # Move image out
-                self.image_transition_up(show)
-
-                # Move new image in
-                show = f"{folder_path}/{files[index]}"
-                self.image_transition_up(show, start_y=-self.MATRIX_HEIGHT)
+        load = lambda file: self.get_bitmap_data(f"{folder_path}/{file}")
+        self.animator.play(self.image_cycle_effect(load, files, time_between, random_index, kind), fps=30)
+        return True
+
+    def cycle_figures(self, folder: str, time_between: float, random_index: bool=False, kind:str="slide"):
+        """ Cycle through the figures in a folder of figures/ ("emojis"), returns None if there are none """
+        # Frozen figures first, then the asset bundle, then the files
+        prefix = f"{folder}/"
+        names = sorted(name for name in frozen_assets.FIGURES if name.startswith(prefix))
+        bundle = asset_bundle.open_bundle()
+        if not names and bundle is not None:
+            names = bundle.names(prefix)
+        if not names:
+            names = [prefix + file[:-len(EXTENSION)] for file in list_images(f"{asset_bundle.FIGURE_DIR}/{folder}")
+                     if file.endswith(EXTENSION)]
+
+        if not names:
+            return None
 
-                # Clear buffer to save memory
-                self.clear()
+        self.animator.play(self.image_cycle_effect(self.get_figure, names, time_between, random_index, kind), fps=30)
+        return True
 
-                last_display_time = current_time
+    def show_frames(self, path:str, loop:bool=True) -> bool:
+        """ Plays a recorded effect (see frame_file.py) until the event is stopped, or once if loop is False """
+        frames = Frame_file(path)
+        try:
+            return self.animator.play(frames.effect(self, loop), fps=0)
+        finally:
+            frames.close()
 
     def show_date(self, show:bool=False):
-        self.show_bitmap("figures/calendar_template.ppm", show=False)
-        day = time.localtime()[2]
+        self.show_figure("calendar_template", show=False)
+        day = time_service.localtime()[2]
 
         if day < 10:
             self.set_num(day,6,2,(0,0,0),size=1,show=False)
@@ -886,36 +1369,12 @@ class Matrix_fun(Matrix):
 
         symbol_code = wd.weather_data["symbol_code_id"]
 
-        # Define icon code and corresponding icon
-        # Icons: https://openweathermap.org/weather-conditions#Weather-Condition-Codes-2
-        icons = {
-            "01d": "sun.ppm",
-            "02d": "sun_and_cloudy.ppm",
-            "03d": "cloud.ppm",
-            "04d": "broken_clouds.ppm",
-            "09d": "rain.ppm",
-            "10d": "sun_and_rain.ppm",
-            "11d": "thunder.ppm",
-            "13d": "snow.ppm",
-            "50d": "foggy.ppm",
-            "-00": "sun_red.ppm",
-
-            "01n": "sun.ppm",
-            "02n": "sun_and_cloudy.ppm",
-            "03n": "cloud.ppm",
-            "04n": "broken_clouds.ppm",
-            "09n": "rain.ppm",
-            "10n": "sun_and_rain.ppm",
-            "11n": "thunder.ppm",
-            "13n": "snow.ppm",
-            "50n": "foggy.ppm"
-        }
-
         # Display image
-        if symbol_code in icons.keys():
-            self.show_bitmap(f"/figures/weather_icons/{icons[symbol_code]}", show=show)
+        icon = WEATHER_ICONS.get(symbol_code)
+        if icon is not None:
+            self.show_figure(f"weather_icons/{icon}", show=show)
         else:
-            self.show_bitmap(f"/figures/exclamation_mark.ppm", show=show)
+            self.show_figure("exclamation_mark", show=show)
             print("Error, icon does not exist!")
 
     def show_temp(self, show:bool=False):
@@ -931,9 +1390,9 @@ class Matrix_fun(Matrix):
 
         # Display thermostat image
         if int(temp) > 0:
-            self.show_bitmap(f"/figures/thermostat.ppm", show=False)
+            self.show_figure("thermostat", show=False)
         else:
-            self.show_bitmap(f"/figures/thermostat_cold.ppm", show=False)
+            self.show_figure("thermostat_cold", show=False)
 
         start_x = 8-len(temp_str) # Calculate offset
 
@@ -952,46 +1411,44 @@ class Matrix_fun(Matrix):
             self.show()
 
     def show_info(self, time_between:float=10):
-        """ Circles through different information on the Matrix """
-        last_display_time = time.time()
+        """
+        Circles through different information on the Matrix
+        Sleeps between the seconds like show_clock, the clock card is kept up to date while it is shown
+        """
+        ticker = Ticker()
+        self.clock_ticker = ticker
+        last_display_time = time.ticks_ms()
 
         # So we do not need to wait
         self.show_weather_icon(True)
 
         number = 2
-        while self.run:
-            current_time = time.time()
-            elapsed_time = current_time - last_display_time
+        clock = None # (hour, minute) while the clock card is shown
+        while ticker.wait(self):
+            now = time_service.localtime()
 
             # Reset counter
             if number > 4:
                 number = 1
 
-            # Avoid error
-            if elapsed_time < 0:
-                last_display_time = current_time - time_between
-
             # If the spessified time has gone
-            if elapsed_time > time_between:
-                self.image_tansition_current_up()
-                self.clear()
+            if time.ticks_diff(time.ticks_ms(), last_display_time) >= time_between * 1000:
+                clock = None
                 if number == 1:
-                    self.show_weather_icon()
+                    self.change_screen(self.show_weather_icon)
                 elif number == 2:
-                    self.show_temp()
+                    self.change_screen(self.show_temp)
                 elif number == 3:
-                    self.show_date()
+                    self.change_screen(self.show_date)
                 else:
-                    #self.strip.set_pixel(self.coordinates_to_number(7, 5),(100,100,100)) # dot
-                    self.set_pixel_color(7,5,(100,100,100)) # dot
-                    self.setClock_hour((255,255,255))
-                    self.setClock_min((255,255,255))
-
-                self.image_tansition_current_up(start_y=-self.MATRIX_HEIGHT) # Move image in
+                    self.change_screen(lambda: self.update_clock((255,255,255), 0, 5, now))
+                    clock = (now[3], now[4])
 
                 number += 1
-                last_display_time = current_time
-            time.sleep_ms(1) # Avoid error
+                last_display_time = time.ticks_ms()
+            elif clock is not None:
+                clock = self.update_clock((255,255,255), 0, 5, now, clock)
+                self.show()
 
     def show_loading_bar(self, number:int,color,speed:float=0.3,animation:bool=False):
         """ Shows a loading bar. Number must be between 0 and 16 """
@@ -1000,13 +1457,9 @@ class Matrix_fun(Matrix):
         y = self.MATRIX_HEIGHT//2
         if animation:
             for i in range(number):
-                #self.strip.set_pixel(self.coordinates_to_number(i, y),color)
-                #self.strip.set_pixel(self.coordinates_to_number(i, y-1),color)
-                self.set_pixel_color(i,y,color)
-                self.set_pixel_color(i,y-1,color)
+                self.vline(i, y-1, 2, color)
                 self.show()
                 time.sleep(speed)
         else:
-            self.set_horr_seg(0,y,color,number,show_on_matrix=False)
-            self.set_horr_seg(0,y-1,color,number,show_on_matrix=False)
+            self.fill_rect(0, y-1, number, 2, color)
             self.show()
\ No newline at end of file
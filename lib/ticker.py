@@ -0,0 +1,60 @@
+"""
+Sleeping scheduler for screens that change once per second, like the clock.
+
+Instead of polling the time in a loop, Ticker.wait() computes the next deadline from ticks_ms and
+sleeps on the stop event of the matrix until then, so a button press still stops the screen right away.
+"""
+
+import utime as time
+import time_service
+
+class Ticker:
+    """
+    Wakes up when the second of the time service changes, or every period_ms if that is not 1000.
+
+    Atributes:
+    - period_ms: time between two wake ups.
+    - wakeups: number of wake ups.
+    - cpu_us_per_minute: time spent awake (between the wait() calls) per minute, measured over the
+      last full minute. None until a minute has passed.
+    """
+
+    def __init__(self, period_ms:int=1000) -> None:
+        self.period_ms = period_ms
+        self.wakeups = 0
+        self.cpu_us_per_minute = None
+        self._deadline = None
+
+        # CPU time measurement
+        self._awake_at = time.ticks_us()
+        self._busy_us = 0
+        self._minute_start = time.ticks_ms()
+
+    def sleep_until(self, deadline:int, owner) -> bool:
+        """ Sleeps until a ticks_ms deadline, returns False as soon as owner.stop_event is set """
+        remaining = time.ticks_diff(deadline, time.ticks_ms())
+        return not owner.stop_event.wait(max(remaining, 0))
+
+    def wait(self, owner) -> bool:
+        """ Sleeps until the next tick. Returns False if the owner was stopped (owner.run False), the screen should stop """
+        self._count_busy()
+
+        if self._deadline is None or self.period_ms == 1000:
+            # The time service counts seconds from ticks_ms, so the next second is known exactly
+            self._deadline = time.ticks_add(time.ticks_ms(), time_service.ms_to_next_second())
+        else:
+            self._deadline = time.ticks_add(self._deadline, self.period_ms)
+        running = self.sleep_until(self._deadline, owner)
+
+        self.wakeups += 1
+        self._awake_at = time.ticks_us()
+        return running
+
+    def _count_busy(self) -> None:
+        """ Adds the time since the last wake up to the busy time, updates cpu_us_per_minute every minute """
+        self._busy_us += time.ticks_diff(time.ticks_us(), self._awake_at)
+        elapsed = time.ticks_diff(time.ticks_ms(), self._minute_start)
+        if elapsed >= 60_000:
+            self.cpu_us_per_minute = self._busy_us * 60_000 // elapsed
+            self._busy_us = 0
+            self._minute_start = time.ticks_ms()
@@ -0,0 +1,101 @@
+"""
+Time of day for the whole Lightbox.
+
+The RTC keeps UTC (as set by ntptime) and is never changed here. At sync() the UTC time is stored
+together with a ticks_ms anchor taken when the RTC second changes, after that the time is counted
+from the ticks and the timezone offset is added arithmetically, so dates roll over correctly at month
+and year ends and negative offsets work.
+
+ticks_diff() is only correct up to about 6 days, so every read of the ticks moves the anchor forward
+by whole seconds once it is REANCHOR_MS old. If the ticks were not read for so long that they wrapped,
+the anchor is taken from the RTC again.
+
+localtime() returns a cached tuple that is converted once per second, however many screens ask for it.
+"""
+
+import utime as time
+
+REANCHOR_MS = 24 * 3600 * 1000 # Age at which the anchor is moved forward
+
+_utc_base = 0 # UTC seconds at the anchor
+_anchor_ms = 0 # ticks_ms at the anchor
+_offset = 0 # Timezone offset in seconds
+_synced = False
+_from_rtc = False # The anchor was taken from the RTC, it can be taken again
+
+_cached_second = None
+_cached_local = None
+
+def sync(utc_seconds:int=None) -> None:
+    """
+    Anchors the time to UTC seconds, the RTC time if None (after ntptime.settime() the RTC has UTC).
+    From the RTC it waits for the next second to start, up to one second.
+    """
+    global _utc_base, _anchor_ms, _synced, _from_rtc, _cached_second
+    if utc_seconds is None:
+        # The RTC only counts whole seconds, anchor at the start of one
+        second = time.time()
+        while time.time() == second:
+            time.sleep_ms(1)
+        _anchor_ms = time.ticks_ms()
+        _utc_base = time.time()
+    else:
+        _anchor_ms = time.ticks_ms()
+        _utc_base = utc_seconds
+    _synced = True
+    _from_rtc = utc_seconds is None
+    _cached_second = None
+
+def set_offset(seconds:int) -> None:
+    """ Sets the timezone offset in seconds (east of UTC is positive) """
+    global _offset, _cached_second
+    _offset = int(seconds)
+    _cached_second = None
+
+def get_offset() -> int:
+    return _offset
+
+def _elapsed_ms() -> int:
+    """ Milliseconds since the anchor, moves the anchor forward when it gets old """
+    global _utc_base, _anchor_ms
+    if not _synced:
+        sync()
+
+    elapsed = time.ticks_diff(time.ticks_ms(), _anchor_ms)
+    if elapsed < 0 and _from_rtc:
+        # The ticks wrapped since the last read, start again from the RTC
+        sync()
+        elapsed = time.ticks_diff(time.ticks_ms(), _anchor_ms)
+    if elapsed >= REANCHOR_MS:
+        seconds = elapsed // 1000
+        _utc_base += seconds
+        _anchor_ms = time.ticks_add(_anchor_ms, seconds * 1000)
+        elapsed -= seconds * 1000
+    return elapsed
+
+def now() -> int:
+    """ Returns the UTC time in seconds """
+    elapsed = _elapsed_ms()
+    return _utc_base + elapsed // 1000
+
+def ms_to_next_second() -> int:
+    """ Milliseconds until the time changes to the next second """
+    return 1000 - _elapsed_ms() % 1000
+
+def localtime() -> tuple:
+    """ Local time like time.localtime(): (year, month, day, hour, minute, second, weekday, yearday) """
+    global _cached_second, _cached_local
+    local = now() + _offset
+    if local != _cached_second:
+        _cached_local = time.gmtime(local)
+        _cached_second = local
+    return _cached_local
+
+def utctime() -> tuple:
+    """ UTC time like time.gmtime() """
+    return time.gmtime(now())
+
+def iso_utc() -> str:
+    """ UTC time in ISO 8601 format, for example 2024-05-17T12:00:00Z """
+    t = utctime()
+    return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(t[0], t[1], t[2], t[3], t[4], t[5])
@@ -0,0 +1,118 @@
+"""
+Transitions between two screens: slide, wipe and fade.
+
+The outgoing and incoming screens are captured from the matrix buffer into two frames, row by row
+from the bottom row (index y * width + x). Every step of a transition is put together from the two
+frames with slice copies of whole rows (or kernels.blend_words() for the fade) and written to the
+matrix buffer in one kernels.blit_row() call. A step costs about as much as copying the buffer, so
+the transitions run at a steady frame rate with the Animator.
+
+The steps are effect generators (see animation.py):
+    transition.capture(transition.outgoing)
+    ... draw the new screen ...
+    transition.capture(transition.incoming)
+    matrix.animator.play(transition.slide(UP), fps=30)
+"""
+
+import array
+import kernels
+
+UP = 0 # The new screen comes in from the bottom, the old one leaves at the top
+DOWN = 1
+LEFT = 2
+RIGHT = 3
+
+class Transition:
+    """
+    Two frames of a matrix and the steps between them.
+
+    Atributes:
+    - outgoing, incoming: array("I") with the screens, row by row from the bottom row.
+    """
+
+    def __init__(self, matrix) -> None:
+        self.matrix = matrix
+        self.width = matrix.MATRIX_WIDTH
+        self.height = matrix.MATRIX_HEIGHT
+        count = self.width * self.height
+        self.outgoing = array.array("I", bytes(count * 4))
+        self.incoming = array.array("I", bytes(count * 4))
+        self._work = array.array("I", bytes(count * 4))
+        self._params = array.array("i", [0, 0, count, -1])
+        self._blend_params = array.array("i", [0, count])
+
+    def capture(self, frame) -> None:
+        """ Copies the matrix buffer to a frame (outgoing or incoming) """
+        self._params[0] = self._params[1] = 0
+        kernels.gather_row(frame, self.matrix._xy, self.matrix.np, self._params)
+
+    def clear(self, frame) -> None:
+        """ Sets a frame to black """
+        kernels.fill_words(frame, 0, 0, len(frame))
+
+    def _draw(self, frame) -> None:
+        """ Writes a frame to the matrix buffer """
+        self._params[0] = self._params[1] = 0
+        kernels.blit_row(self.matrix.np, self.matrix._xy, frame, self._params)
+
+    def _steps(self, direction:int) -> int:
+        return self.height if direction in (UP, DOWN) else self.width
+
+    def slide(self, direction:int=UP):
+        """ The new screen pushes the old one out, one row or column per step """
+        width, height = self.width, self.height
+        old, new, work = memoryview(self.outgoing), memoryview(self.incoming), memoryview(self._work)
+        size = width * height
+        for step in range(1, self._steps(direction) + 1):
+            if direction == UP:
+                # Old rows move up by step, the top rows of the new screen come in at the bottom
+                work[step * width:] = old[:size - step * width]
+                work[:step * width] = new[size - step * width:]
+            elif direction == DOWN:
+                work[:size - step * width] = old[step * width:]
+                work[size - step * width:] = new[:step * width]
+            else:
+                for row in range(0, size, width):
+                    if direction == LEFT:
+                        work[row:row + width - step] = old[row + step:row + width]
+                        work[row + width - step:row + width] = new[row:row + step]
+                    else:
+                        work[row + step:row + width] = old[row:row + width - step]
+                        work[row:row + step] = new[row + width - step:row + width]
+            self._draw(self._work)
+            yield
+
+    def wipe(self, direction:int=UP):
+        """ The new screen is uncovered one row or column per step, the old one stays in place """
+        width, height = self.width, self.height
+        old, new, work = memoryview(self.outgoing), memoryview(self.incoming), memoryview(self._work)
+        size = width * height
+        work[:] = old
+        for step in range(1, self._steps(direction) + 1):
+            if direction == UP:
+                work[(step - 1) * width:step * width] = new[(step - 1) * width:step * width]
+            elif direction == DOWN:
+                work[size - step * width:size - (step - 1) * width] = new[size - step * width:size - (step - 1) * width]
+            else:
+                column = step - 1 if direction == RIGHT else width - step
+                for row in range(0, size, width):
+                    work[row + column] = new[row + column]
+            self._draw(self._work)
+            yield
+
+    def fade(self, steps:int=16):
+        """ Cross-fades from the old screen to the new one """
+        params = self._blend_params
+        for step in range(1, steps + 1):
+            params[0] = step * 256 // steps
+            kernels.blend_words(self._work, self.incoming, self.outgoing, params)
+            self._draw(self._work)
+            yield
+
+    def play(self, kind:str="slide", direction:int=UP):
+        """ The steps of a transition by name: "slide", "wipe" or "fade" """
+        if kind == "fade":
+            return self.fade()
+        if kind == "wipe":
+            return self.wipe(direction)
+        return self.slide(direction)
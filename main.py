@@ -16,7 +16,8 @@ from lib.internett import Server_functiones, Access_point, get_location_inf, get
 from lib.lightbox_functionality import my_lightbox
 from lib.encryption import Simple_Encryption
 import lib.NTPtime as ntp 
-from lib.pico_system import get_json_data, get_files, delete_file, save_json_data
+from lib.pico_system import get_json_data, delete_file, save_json_data
+from lib.image_file import list_images
 import events as ev
 
 # Hardware setup
@@ -42,7 +43,7 @@ def start_event_loop():
             loop = ev.event_loop()
             if loop == "button_count_error":
                 my_lightbox.button_count = 1 # Reset button count on error
-            time.sleep(1)
+            my_lightbox.wait(1) # Returns right away when the button count changes
             
         except Exception as e:
             print(f"ERR, an exception occurred: {e}")
@@ -153,7 +154,7 @@ def reset():
     print("default parameters set")
 
     # Delete all image files
-    files = get_files("images", "ppm")
+    files = list_images("images")
     for file in files:
         print(file)
         delete_file(f"images/{file}")
@@ -0,0 +1,741 @@
+"""
+Host benchmarks for the Lightbox drawing code.
+
+Runs lib/ under CPython with the stubbed machine/rp2 modules from host_stubs.py and prints the
+cost per frame of the hot paths. Absolute numbers are much lower than on the Pico, the ratio
+between the "before" and "after" rows is what matters. Some benchmarks also check that the new
+code gives the right results, the script exits with status 1 if a check fails.
+
+Usage:
+    python tools/benchmark.py            # Run all benchmarks
+    python tools/benchmark.py pixel_lut  # Run selected benchmarks
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import host_stubs
+host_stubs.install()
+
+from rgb_matrix import Matrix_fun, Layer, Compositor, wheel, WEATHER_ICONS
+from font_glyphs import SYMBOLS, DIGITS
+
+FRAMES = 200
+
+REPEATS = 5
+
+def _time_frames(function, frames:int=FRAMES) -> float:
+    """ Returns the time per call in microseconds, best average of a few runs to filter out noise """
+    function() # Warm up
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(frames):
+            function()
+        elapsed = (time.perf_counter() - start) * 1_000_000 / frames
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def _report(name:str, before:float, after:float) -> None:
+    print(f"  {name:<28} before {before:9.1f} us/frame   after {after:9.1f} us/frame   x{before / after:.2f}")
+
+_failures = [] # Names of the failed checks
+
+def _check(name:str, ok:bool) -> None:
+    """ Prints the result of a correctness check, main() exits with status 1 if any check failed """
+    print(f"  {name:<28} {'ok' if ok else 'FAILED'}")
+    if not ok:
+        _failures.append(name)
+
+def _heap(function) -> int:
+    """ Most bytes of heap allocated while function runs, after a first call has filled the caches """
+    import tracemalloc
+    function()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - before
+
+def _frame_source(start):
+    """ Returns a function that makes one frame of an effect, starting the generator again when it ends """
+    state = [start()]
+    def step():
+        try:
+            next(state[0])
+        except StopIteration:
+            state[0] = start()
+            next(state[0])
+    return step
+
+class _Legacy_matrix(Matrix_fun):
+    """ The write path before the lookup table and the brightness LUT """
+
+    def set_np(self, num, color):
+        if self.brightness == 100:
+            r, g, b = color
+            r, g, b = int(r), int(g), int(b)
+        else:
+            r, g, b = self.adjust_brightness(color, self.brightness / 100)
+        self.np[num] = (r << 8) | (g << 16) | b
+
+    def show(self):
+        self.output.sm.put(self.np, 8)
+
+    def clear(self):
+        for i in range(self.numpix):
+            self.np[i] = 0
+
+    def rotate_left(self, num_of_pixels=1):
+        self.np = self.np[num_of_pixels:] + self.np[:num_of_pixels]
+        self.show()
+
+    def coordinates_to_number(self, x, y):
+        if y % 2 == 0:
+            return y * self.MATRIX_WIDTH + x
+        else:
+            return y * self.MATRIX_WIDTH + (self.MATRIX_WIDTH-1 - x)
+
+    def set_pixel_color(self, x, y, color):
+        if x < self.MATRIX_WIDTH and x >= 0 and y < self.MATRIX_HEIGHT and y >= 0:
+            self.set_np(self.coordinates_to_number(x, y), color)
+
+    def set_horr_seg(self, x, y, color, length, show_on_matrix=True):
+        for i in range(length):
+            x_coordinate = x + i
+            if x_coordinate < self.MATRIX_WIDTH and y < self.MATRIX_HEIGHT and x_coordinate >= 0 and y >= 0:
+                self.set_pixel_color(x+i,y,color)
+
+    def set_vert_seg(self, x, y, color, length, show_on_matrix=True):
+        for i in range(length):
+            y_coordinate = y + 1
+            if y_coordinate < self.MATRIX_HEIGHT and x < self.MATRIX_WIDTH and y_coordinate >= 0 and x >= 0:
+                self.set_pixel_color(x,y+i,color)
+
+    # The font and the wifi symbol draw with these now, route them to the pixel by pixel helpers
+    def hline(self, x, y, length, color):
+        self.set_horr_seg(x, y, color, length, False)
+
+    def vline(self, x, y, length, color):
+        self.set_vert_seg(x, y, color, length, False)
+
+    def fill_rect(self, x, y, width, height, color):
+        for i in range(height):
+            self.set_horr_seg(x, y + i, color, width, False)
+
+    def set_num(self, num, x, y, color, size=0, show=True, target=None):
+        # setClock_hour of Matrix_fun passes target
+        DIGITS[num](target or self, x, y, color, size, show)
+
+    def set_symbol(self, symbol, x, y, color):
+        symbol = symbol.lower()
+        try:
+            self.set_num(int(symbol), x, y, color, show=False)
+        except ValueError:
+            pass
+        # The elif chain compared the symbol with every name until one matched
+        for name in SYMBOLS:
+            if symbol == name:
+                SYMBOLS[name](self, x, y, color)
+                return
+
+    def wait(self, wait_time):
+        last_display_time = time.time()
+        while self.run:
+            if time.time() - last_display_time > wait_time:
+                return
+
+    def show_clock(self, color, x=0, y=5):
+        self.minute = time.localtime()[4]
+        self.set_pixel_color(x+7,y,(color[0]*0.5,color[0]*0.5,color[0]*0.5))
+        self.setClock_hour(color, x, y)
+        self.setClock_min(color, x, y)
+        self.show()
+        while self.run == True:
+            if time.localtime()[5] % 2 == 0:
+                self.set_pixel_color(x+7,y,(color[0]*0.5,color[0]*0.5,color[0]*0.5))
+                self.show()
+            else:
+                self.set_pixel_color(x+7,y,(0,0,0))
+                self.show()
+            if self.minute != time.localtime()[4]:
+                self.clear()
+                self.minute = time.localtime()[4]
+                self.setClock_hour(color, x, y)
+                self.setClock_min(color, x, y)
+                self.show()
+
+    def push_image(self, width, hight, data, x=0, y=0):
+        for i in range(hight):
+            for j in range(width):
+                color = tuple(int(c) for c in data[i * width + j])
+                self.set_pixel_color(x + j, y + hight - i -1, color)
+
+def bench_pixel_lut():
+    """ Serpentine lookup table versus coordinates_to_number on every write """
+    before, after = _Legacy_matrix(16, 16, 1), Matrix_fun(16, 16, 1)
+    width, height = after.MATRIX_WIDTH, after.MATRIX_HEIGHT
+    colors = [wheel(x) for x in range(width)]
+    sun = after.get_figure("weather_icons/sun")
+    data = [((word >> 8) & 0xff, (word >> 16) & 0xff, word & 0xff) for word in sun.words]
+
+    # One rainbow_wave frame
+    def wave(matrix):
+        for x in range(width):
+            for y in range(height):
+                matrix.set_pixel_color(x, y, colors[x])
+
+    # Full screen image
+    def image(matrix):
+        matrix.push_image(width, height, data)
+
+    # Segment helpers, as used by the font
+    def segments(matrix):
+        for y in range(height):
+            matrix.set_horr_seg(0, y, (255, 255, 255), width, False)
+
+    for name, frame in (("rainbow_wave frame", wave), ("push_image 16x16", image), ("set_horr_seg full frame", segments)):
+        _report(name, _time_frames(lambda: frame(before)), _time_frames(lambda: frame(after)))
+
+    # The same image as RGB bytes, packed by kernels.pack_rgb
+    rgb = bytes(c for color in data for c in color)
+    _report("push_image tuples/bytes", _time_frames(lambda: image(after)),
+            _time_frames(lambda: after.push_image(width, height, rgb)))
+    expected = list(after.np)
+    after.clear()
+    after.push_image(width, height, rgb)
+    _check("bytes same as tuples", list(after.np) == expected)
+
+def bench_brightness():
+    """ Brightness applied per write in set_np versus one LUT pass in show() """
+    before, after = _Legacy_matrix(16, 16, 1), Matrix_fun(16, 16, 1)
+    width, height = after.MATRIX_WIDTH, after.MATRIX_HEIGHT
+    colors = [wheel(x) for x in range(width)]
+
+    def wave(matrix):
+        for x in range(width):
+            for y in range(height):
+                matrix.set_pixel_color(x, y, colors[x])
+        matrix.show()
+
+    for brightness in (100, 40):
+        before.set_brightness(brightness)
+        after.set_brightness(brightness)
+        _report(f"wave + show, {brightness}%", _time_frames(lambda: wave(before)), _time_frames(lambda: wave(after)))
+
+def bench_static_frames():
+    """ show() on a static screen, every frame sent versus identical frames skipped """
+    matrix = Matrix_fun(16, 16, 1)
+    matrix.show_figure("weather_icons/sun")
+
+    _report("show() unchanged frame", _time_frames(lambda: matrix.show(force=True)), _time_frames(matrix.show))
+    print(f"  pushed {matrix.frames_pushed} frames, skipped {matrix.frames_skipped}")
+
+def bench_raster():
+    """ Bulk raster primitives versus pixel by pixel drawing """
+    before, after = _Legacy_matrix(16, 16, 1), Matrix_fun(16, 16, 1)
+
+    _report("clear()", _time_frames(before.clear), _time_frames(after.clear))
+
+    def text(matrix):
+        for i, letter in enumerate("lightbox"):
+            matrix.set_symbol(letter, i * 5 - 12, 5, (255, 255, 255))
+
+    _report("set_symbol x8", _time_frames(lambda: text(before)), _time_frames(lambda: text(after)))
+    _report("set_num size 1", _time_frames(lambda: before.set_num(8, 2, 2, (255, 255, 255), 1, False)),
+            _time_frames(lambda: after.set_num(8, 2, 2, (255, 255, 255), 1, False)))
+    _report("wifi symbol", _time_frames(lambda: before.setFig_wifi((255, 0, 0), show=False)), _time_frames(lambda: after.setFig_wifi((255, 0, 0), show=False)))
+
+def bench_scroll():
+    """
+    In place rotation and scrolling versus slicing new arrays. CPython slices in C and has no
+    garbage collector pauses, so here the interesting result is that the buffer is kept
+    """
+    before, after = _Legacy_matrix(16, 16, 1), Matrix_fun(16, 16, 1)
+    for matrix in (before, after):
+        matrix.show_bitmap("", filedata=after.get_figure("weather_icons/sun"))
+
+    _report("rotate_left(1)", _time_frames(before.rotate_left), _time_frames(after.rotate_left))
+
+    # The slicing version creates three new arrays per step
+    for name, matrix in (("before", before), ("after", after)):
+        buffer = matrix.np
+        matrix.rotate_left()
+        print(f"  {name}: rotate_left keeps the buffer: {matrix.np is buffer}")
+    buffer = after.np
+    for _ in range(FRAMES):
+        after.scroll(1, 0, wrap=True)
+        after.scroll(0, -1, wrap=True)
+    print(f"  scroll(1, 0) {_time_frames(lambda: after.scroll(1, 0, wrap=True)):.1f} us/frame, "
+          f"scroll(0, 1) {_time_frames(lambda: after.scroll(0, 1, wrap=True)):.1f} us/frame, buffer kept: {after.np is buffer}")
+
+    # Heap per call. CPython allocates an object for every int above 256 (most buffer values), so
+    # these are upper bounds, small ints need no heap on the Pico
+    steps = (("scroll wrap", lambda: after.scroll(1, 0, wrap=True)), ("scroll", lambda: after.scroll(-1, 0)),
+             ("scroll up", lambda: after.scroll(0, 1)), ("fill_rect", lambda: after.fill_rect(1, 1, 10, 10, (255, 0, 0))),
+             ("vline", lambda: after.vline(3, 0, 16, (255, 0, 0))))
+    print("  heap bytes per call: " + ", ".join(f"{name} {_heap(step)}" for name, step in steps))
+
+def bench_canvas():
+    """
+    Cost of converting a framebuf canvas to the matrix buffer in show(). The drawing itself runs
+    in C on the Pico, here it runs in framebuf_shim.py so only the conversion is measured
+    """
+    from canvas import Canvas, GS8
+    matrix = Matrix_fun(16, 16, 1)
+    for name, canvas in (("RGB565", Canvas(16, 16)), ("GS8 + palette", Canvas(16, 16, GS8))):
+        canvas.fb.fill_rect(2, 2, 12, 12, 1)
+        print(f"  render() {name:<14} {_time_frames(lambda: canvas.render(matrix)):9.1f} us/frame")
+
+def bench_compositor():
+    """ Updating a clock overlay on a picture, redrawing everything versus the compositor """
+    matrix = Matrix_fun(16, 16, 1)
+    data = matrix.get_figure("weather_icons/sun")
+
+    def redraw():
+        matrix.show_bitmap("", filedata=data, show=False)
+        matrix.set_num(2, 4, 5, (255, 255, 255), show=False)
+
+    compositor = Compositor(matrix)
+    background = compositor.add_layer(Layer(16, 16, key=None))
+    background.blit(0, 0, data.width, data.height, data.words)
+    overlay = compositor.add_layer(Layer(4, 6, 4, 5))
+    compositor.compose()
+
+    def update():
+        overlay.clear()
+        matrix.set_num(2, 0, 0, (255, 255, 255), show=False, target=overlay)
+        compositor.compose()
+
+    _report("overlay update", _time_frames(redraw), _time_frames(update))
+    update()
+    expected = Matrix_fun(16, 16, 1)
+    expected.show_bitmap("", filedata=data, show=False)
+    expected.set_num(2, 4, 5, (255, 255, 255), show=False)
+    _check("layers same as drawing", list(matrix.np) == list(expected.np))
+
+def bench_kernels():
+    """ Kernel functions against their Python versions, on the Pico with: import kernels; kernels.benchmark() """
+    import kernels
+    if not kernels.FAST:
+        # Both sides would be the Python versions, comparing them proves nothing
+        print(f"  {'same results':<28} skipped, the compiled kernels only build on MicroPython")
+        return
+    try:
+        kernels.benchmark()
+        _check("same results", True)
+    except AssertionError as e:
+        print(f"  {e}")
+        _check("same results", False)
+
+def bench_text():
+    """ One show_text scroll step, laying out the whole text versus copying the visible columns of a strip """
+    from bitmap_font import Text_strip
+    before, after = _Legacy_matrix(16, 16, 1), Matrix_fun(16, 16, 1)
+    color = (255, 255, 255)
+
+    def layout(matrix, text):
+        matrix.clear()
+        x_sep = 0
+        for letter in text:
+            x_sep += 5
+            if letter != " ":
+                matrix.set_symbol(letter, 2 + x_sep, 5, color)
+
+    def strip_step(strip):
+        after.clear()
+        strip.draw(after, 7, 5, color)
+
+    for text in ("ip: 192.168.4.1", "ip: 192.168.4.1 " * 4):
+        strip = Text_strip(text)
+        _report(f"{len(text)} letters", _time_frames(lambda: layout(before, text)), _time_frames(lambda: strip_step(strip)))
+
+def bench_clock():
+    """ CPU time of show_clock, polling the time versus sleeping until the next second """
+    import threading
+
+    def cpu_per_minute(matrix, seconds=3):
+        matrix.run = True
+        threading.Timer(seconds, lambda: setattr(matrix, "run", False)).start()
+        start = time.process_time()
+        matrix.show_clock((255, 255, 255))
+        return (time.process_time() - start) * 60 / seconds * 1000
+
+    before, after = cpu_per_minute(_Legacy_matrix(16, 16, 1)), cpu_per_minute(Matrix_fun(16, 16, 1))
+    print(f"  CPU time per minute            before {before:9.1f} ms          after {after:9.1f} ms          x{before / after:.0f}")
+
+def bench_effects():
+    """ Rainbow effects from the effect tables versus wheel() and float cos/sin tables per pixel """
+    from math import cos, sin, radians
+    from rgb_matrix import rainbow_spiral, rainbow_spiral_effect, rainbow_wave
+    before, after = _Legacy_matrix(16, 16, 1), Matrix_fun(16, 16, 1)
+    before.run = after.run = True
+
+    def legacy_wave_frame():
+        for x in range(16):
+            before.set_vert_seg(x, 0, wheel(x % 256), 16)
+        before.show()
+
+    def legacy_spiral(runs:int=None):
+        # The old spiral: 360 steps of 11 pixels per run, every step shown, 10 degrees further every run
+        cos_table = [int(1000 * cos(radians(angle))) for angle in range(360)]
+        sin_table = [int(1000 * sin(radians(angle))) for angle in range(360)]
+        angle_offset = 0
+        run = 0
+        while runs is None or run < runs:
+            for angle in range(360):
+                for radius in range(11):
+                    x = 8 + (radius * cos_table[(angle + angle_offset) % 360]) // 1000
+                    y = 8 + (radius * sin_table[(angle + angle_offset) % 360]) // 1000
+                    before.set_pixel_color(x, y, wheel((angle + radius * 10) % 256))
+                yield
+            angle_offset += 10
+            run += 1
+
+    _report("rainbow_wave frame", _time_frames(legacy_wave_frame), _time_frames(lambda: rainbow_wave(after, 1)))
+    # Drawing one spiral step (11 pixels) on both sides, without show()
+    _report("rainbow_spiral step", _time_frames(_frame_source(legacy_spiral)),
+            _time_frames(_frame_source(lambda: rainbow_spiral_effect(after))))
+
+    before.clear()
+    after.clear()
+    for _ in legacy_spiral(2):
+        pass
+    rainbow_spiral(after, 1)
+    _check("spiral same as before", list(before.np) == list(after.np))
+
+def bench_wait():
+    """ Matrix_fun.wait() stopped by a button press, spinning on run versus sleeping on the stop event """
+    import threading
+
+    def measure(matrix, seconds=1.0):
+        # Returns the CPU time per second of waiting and the time from run = False until wait() returns
+        pressed = []
+        def press():
+            pressed.append(time.perf_counter())
+            matrix.run = False
+        matrix.run = True
+        threading.Timer(seconds, press).start()
+        start = time.process_time()
+        matrix.wait(10)
+        returned = time.perf_counter()
+        return (time.process_time() - start) / seconds * 1000, (returned - pressed[0]) * 1000
+
+    before, after = measure(_Legacy_matrix(16, 16, 1)), measure(Matrix_fun(16, 16, 1))
+    print(f"  CPU time per second waiting  before {before[0]:9.1f} ms          after {after[0]:9.1f} ms          x{before[0] / max(after[0], 0.1):.0f}")
+    print(f"  stop latency                 before {before[1]:9.2f} ms          after {after[1]:9.2f} ms")
+
+def bench_frames():
+    """ Computing an effect frame versus playing it from a recorded frame file """
+    import random
+    import rgb_matrix
+    from frame_file import record, Frame_file
+
+    matrix = Matrix_fun(16, 16, 1)
+    matrix.run = True
+    folder = tempfile.mkdtemp()
+    for name in ("rainbow_spiral", "firework", "balls"):
+        effect = getattr(rgb_matrix, f"{name}_effect")
+        path = os.path.join(folder, f"{name}.lfr")
+        random.seed(0)
+        count = record(matrix, effect(matrix), path, 300)
+        frames = Frame_file(path)
+        random.seed(0)
+        computed = _time_frames(_frame_source(lambda: effect(matrix)))
+        played = _time_frames(_frame_source(lambda: frames.effect(matrix)))
+        _report(f"{name} ({os.path.getsize(path) // count} B/frame)", computed, played)
+        frames.close()
+        os.remove(path)
+    os.rmdir(folder)
+
+def _legacy_balls_effect(matrix, num_balls):
+    # Balls as tuples in a list, rebuilt every step, collisions with sqrt
+    import random
+    from math import sqrt
+    balls = [(random.randint(0, 15), random.randint(0, 15), random.choice([-1, 1]), random.choice([-1, 1]), (255, 0, 0))
+             for _ in range(num_balls)]
+    while True:
+        for i in range(len(balls)):
+            ball_x, ball_y, velocity_x, velocity_y, ball_color = balls[i]
+            ball_x += velocity_x
+            ball_y += velocity_y
+            if ball_x >= 16:
+                ball_x, velocity_x = 15, -velocity_x
+            elif ball_x < 0:
+                ball_x, velocity_x = 0, -velocity_x
+            if ball_y >= 16:
+                ball_y, velocity_y = 15, -velocity_y
+            elif ball_y < 0:
+                ball_y, velocity_y = 0, -velocity_y
+            for j in range(len(balls)):
+                if i != j and sqrt((ball_x - balls[j][0]) ** 2 + (ball_y - balls[j][1]) ** 2) <= 1:
+                    velocity_x, velocity_y = -velocity_x, -velocity_y
+                    break
+            balls[i] = (ball_x, ball_y, velocity_x, velocity_y, ball_color)
+        matrix.clear()
+        for ball_x, ball_y, _, _, ball_color in balls:
+            matrix.set_pixel_color(ball_x, ball_y, ball_color)
+        yield 100
+
+def bench_particles():
+    """ Fireworks and balls on the array based particle system versus lists of tuples and float math """
+    import random
+    from rgb_matrix import balls_effect
+    matrix = Matrix_fun(16, 16, 1)
+    random.seed(0)
+    # One explosion step per spark: the old code placed 12 sparks with float math, the new one moves 16
+    from math import cos, sin, radians
+    from particles import Particles, DIRECTIONS_X, DIRECTIONS_Y
+
+    def legacy_sparks():
+        for angle in range(0, 360, 30):
+            rad = radians(angle)
+            x = int(8 + 3 * random.uniform(0.8, 1.2) * cos(rad))
+            y = int(8 + 3 * random.uniform(0.8, 1.2) * sin(rad))
+            matrix.set_pixel_color(x, y, (255, 0, 0))
+
+    sparks = Particles(matrix, 16, gravity=-3, bounce=256)
+    for direction in range(16):
+        sparks.spawn(2048, 2048, DIRECTIONS_X[direction] >> 1, DIRECTIONS_Y[direction] >> 1, 0xff00)
+    print(f"  firework spark               before {_time_frames(legacy_sparks) / 12:9.2f} us/spark   "
+          f"after {_time_frames(sparks.step) / 16:9.2f} us/spark")
+    for balls in (4, 16):
+        _report(f"balls step, {balls} balls", _time_frames(_frame_source(lambda: _legacy_balls_effect(matrix, balls))),
+                _time_frames(_frame_source(lambda: balls_effect(matrix, balls))))
+
+def bench_fixed():
+    """ Integer math of fixed.py versus the float math it replaces, accuracy and speed """
+    import math
+    import fixed
+
+    # Largest errors against math, the checks fail if one is over its bound
+    sin_error = max(abs(fixed.sin(a) / 256 - math.sin(a * math.pi / 128)) for a in range(256))
+    cos_error = max(abs(fixed.cos(a) / 256 - math.cos(a * math.pi / 128)) for a in range(256))
+    scale_error = max(abs(fixed.scale(v, f) - v * f / 256) for v in range(0, 256, 5) for f in range(0, 257, 8))
+    print(f"  accuracy: sin {sin_error:.4f}, cos {cos_error:.4f}, scale {scale_error:.2f}")
+    _check("sin, cos error < 1/256", sin_error < 1 / 256 and cos_error < 1 / 256)
+    _check("scale error < 1", scale_error < 1)
+
+    angles = range(0, 256, 4)
+    _report("sin, 64 angles", _time_frames(lambda: [math.sin(math.radians(a * 360 / 256)) for a in angles]),
+            _time_frames(lambda: [fixed.sin(a) for a in angles]))
+    colors = [(i, 255 - i, i // 2) for i in range(64)]
+    _report("scale 64 colors", _time_frames(lambda: [(int(r * 0.4), int(g * 0.4), int(b * 0.4)) for r, g, b in colors]),
+            _time_frames(lambda: [fixed.scale_rgb(color, 102) for color in colors]))
+    print("  on the host floats are done in hardware, on the Pico they are emulated and every float is allocated on the heap")
+
+def bench_images():
+    """ Loading and drawing an image, PPM P3 text versus the binary .lbi format """
+    from image_file import load_image
+
+    path = os.path.join(host_stubs.ROOT, "figures", "emojis", "heart.lbi")
+    image = load_image(path)
+    ppm = os.path.join(tempfile.mkdtemp(), "heart.ppm")
+    with open(ppm, "w") as file:
+        file.write(f"P3\n{image.width} {image.height}\n255\n")
+        for word in image.words:
+            file.write(f"{(word >> 8) & 0xff} {(word >> 16) & 0xff} {word & 0xff}\n")
+
+    def legacy_load(path):
+        # The old get_bitmap_data: the text split into a list of string lists
+        with open(path, "r") as file:
+            return [row.strip().split(" ", 3) for row in file]
+
+    def legacy_draw(rows):
+        # The old show_bitmap: int() three times and a tuple per pixel on every draw
+        width, height = int(rows[1][0]), int(rows[1][1])
+        data = rows[3:]
+        for y in range(height):
+            for x in range(width):
+                r, g, b = data[y * width + x][:3]
+                matrix.set_pixel_color(x, height - 1 - y, (int(r), int(g), int(b)))
+
+    matrix = Matrix_fun(16, 16, 1)
+    rows = legacy_load(ppm)
+    _report("load", _time_frames(lambda: legacy_load(ppm)), _time_frames(lambda: load_image(path, image)))
+    _report("draw", _time_frames(lambda: legacy_draw(rows)), _time_frames(lambda: matrix.blit(0, 0, image.width, image.height, image.words)))
+    print(f"  file size                    before {os.path.getsize(ppm):9d} bytes      after {os.path.getsize(path):9d} bytes")
+    os.remove(ppm)
+
+def bench_image_cache():
+    """ Showing the same icons again, reading the files every time versus the image cache """
+    from image_file import load_image
+    from image_cache import Image_cache
+
+    folder = os.path.join(host_stubs.ROOT, "figures", "emojis")
+    paths = [os.path.join(folder, name) for name in sorted(os.listdir(folder))][:8]
+    cache = Image_cache()
+    _report("8 emojis", _time_frames(lambda: [load_image(path) for path in paths]),
+            _time_frames(lambda: [cache.get(path) for path in paths]))
+    stats = cache.stats()
+    print(f"  cache: {stats['hits']} hits, {stats['misses']} misses, {stats['bytes']} of {stats['budget']} bytes")
+
+def bench_transitions():
+    """ One step of a screen transition, replaying the buffer as a list versus the transition frames """
+    from transitions import UP, LEFT
+
+    matrix = Matrix_fun(16, 16, 1)
+    matrix.show_bitmap(os.path.join(host_stubs.ROOT, "figures", "emojis", "heart.lbi"), show=False)
+    data = matrix.get_buffer_data()
+
+    def legacy_step():
+        # The old image_tansition_current_up: the buffer as 256 lists, pushed pixel by pixel every frame
+        matrix.clear()
+        matrix.push_image_reverse_lines(16, 16, data, y=5)
+
+    transition = matrix.transition
+    transition.capture(transition.outgoing)
+    transition.capture(transition.incoming)
+
+    def steps(kind, direction):
+        # Returns a function that makes one step, starting the transition again when it ends
+        return _frame_source(lambda: transition.play(kind, direction))
+
+    legacy = _time_frames(legacy_step)
+    for kind, direction in (("slide", UP), ("slide", LEFT), ("wipe", UP), ("fade", UP)):
+        _report(f"{kind} {'up' if direction == UP else 'left'} step", legacy, _time_frames(steps(kind, direction)))
+
+def bench_bundle():
+    """ Showing figures, opening every .lbi file versus reading them from the open asset bundle """
+    import asset_bundle
+    from image_file import load_image
+
+    matrix = Matrix_fun(16, 16, 1)
+    names = [f"weather_icons/{name}" for name in sorted(set(WEATHER_ICONS.values()))] + ["thermostat", "exclamation_mark"]
+    paths = [f"{asset_bundle.FIGURE_DIR}/{name}.lbi" for name in names]
+    image = load_image(paths[0])
+
+    # Opening the bundle and reading its index, once at startup
+    def open_bundle():
+        asset_bundle.close_bundles()
+        return asset_bundle.open_bundle()
+
+    bundle = open_bundle()
+    _report(f"{len(names)} icons, no cache", _time_frames(lambda: [load_image(path, image) for path in paths]),
+            _time_frames(lambda: [bundle.image(name, image) for name in names]))
+    print(f"  open bundle {_time_frames(open_bundle):9.1f} us, {bundle.count} figures in {os.path.getsize(bundle.path)} bytes")
+    bundle = asset_bundle.open_bundle()
+
+    # show_weather_icon, building the icon dict on every call versus the WEATHER_ICONS constant
+    def legacy_icon():
+        icons = {code: f"{name}.lbi" for code, name in WEATHER_ICONS.items()}
+        load_image(f"{asset_bundle.FIGURE_DIR}/weather_icons/{icons['10d']}", image)
+
+    _report("weather icon", _time_frames(legacy_icon),
+            _time_frames(lambda: matrix.get_figure(f"weather_icons/{WEATHER_ICONS['10d']}", image)))
+
+    # Every figure must be the same as its file
+    same = all(list(bundle.image(name).words) == list(load_image(f"{asset_bundle.FIGURE_DIR}/{name}.lbi").words)
+               for name in bundle.names())
+    print(f"  bundle matches the .lbi files: {same}")
+
+def bench_frozen():
+    """ Showing icons and opening fonts, read from files versus frozen modules from tools/make_frozen.py """
+    import asset_bundle
+    import bitmap_font
+    import frozen_assets
+    import make_frozen
+    from image_file import load_image
+
+    folder = tempfile.mkdtemp()
+    make_frozen.main(folder)
+    sys.path.insert(0, folder)
+    import frozen_figures, frozen_fonts
+
+    matrix = Matrix_fun(16, 16, 1)
+    names = [f"weather_icons/{name}" for name in sorted(set(WEATHER_ICONS.values()))]
+
+    # Every icon read from its file (an image cache miss) versus drawn from the frozen bytes
+    def from_files():
+        for name in names:
+            matrix.show_bitmap("", filedata=load_image(f"{asset_bundle.FIGURE_DIR}/{name}.lbi"), show=False)
+
+    def from_frozen():
+        for name in names:
+            matrix.show_figure(name, show=False)
+
+    def open_font(data):
+        bitmap_font._fonts.clear()
+        frozen_assets.FONTS = data
+        return bitmap_font.load_font(15).glyph("8")
+
+    before_time, before_heap = _time_frames(from_files), _heap(from_files)
+    before_font = _heap(lambda: open_font({}))
+    frozen_assets.FIGURES = frozen_figures.FIGURES
+    after_time, after_heap = _time_frames(from_frozen), _heap(from_frozen)
+    after_font = _heap(lambda: open_font(frozen_fonts.FONTS))
+    _report(f"{len(names)} weather icons", before_time, after_time)
+    print(f"  {f'heap, {len(names)} icons':<28} before {before_heap:9d} bytes      after {after_heap:9d} bytes")
+    print(f"  {'heap, opening font_15':<28} before {before_font:9d} bytes      after {after_font:9d} bytes")
+
+    # Back to the files for the other benchmarks
+    frozen_assets.FIGURES = {}
+    frozen_assets._images.clear()
+    open_font({})
+    sys.path.remove(folder)
+
+def bench_output():
+    """ Double buffered output, swap() alternates the two buffers and counts the frames """
+    from led_output import Ws2812_output, Stub_output
+
+    output = Stub_output(256)
+    first = output.back_buffer()
+    first[0:4] = bytes([0, 1, 2, 3]) # 0, blue, red, green
+    output.swap()
+    second = output.back_buffer()
+    _check("swap() changes buffer", second is not first)
+    _check("front is the sent frame", output.front_buffer()[0] == 0x03020100 and output.sent[0] == 0x03020100)
+    output.swap() # The first transfer is still running
+    _check("swap() changes back", output.back_buffer() is first)
+    _check("frames and waits counted", output.frames == 2 and output.waits == 1)
+
+    try:
+        Ws2812_output(256)
+        _check("base class refused", False)
+    except TypeError:
+        _check("base class refused", True)
+
+    def swap():
+        output.swap()
+        output.complete()
+
+    print(f"  swap() {_time_frames(swap):9.1f} us/frame")
+
+BENCHMARKS = {
+    "output": bench_output,
+    "pixel_lut": bench_pixel_lut,
+    "brightness": bench_brightness,
+    "static_frames": bench_static_frames,
+    "raster": bench_raster,
+    "scroll": bench_scroll,
+    "canvas": bench_canvas,
+    "compositor": bench_compositor,
+    "kernels": bench_kernels,
+    "text": bench_text,
+    "clock": bench_clock,
+    "effects": bench_effects,
+    "wait": bench_wait,
+    "frames": bench_frames,
+    "particles": bench_particles,
+    "fixed": bench_fixed,
+    "images": bench_images,
+    "image_cache": bench_image_cache,
+    "transitions": bench_transitions,
+    "bundle": bench_bundle,
+    "frozen": bench_frozen,
+}
+
+def main(names:list) -> None:
+    for name in names or BENCHMARKS:
+        print(f"{name}: {BENCHMARKS[name].__doc__.strip().splitlines()[0]}")
+        BENCHMARKS[name]()
+    if _failures:
+        print(f"{len(_failures)} checks failed: {', '.join(_failures)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
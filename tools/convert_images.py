@@ -0,0 +1,38 @@
+"""
+Converts PPM P3 images to binary images (.lbi, format described in lib/image_file.py).
+
+Every .ppm file in the folders (and their subfolders) gets a .lbi file with the same name next to it.
+The Lightbox converts uploaded images itself, this is for the images that are shipped in figures/.
+The .ppm files are the sources of the figures and are kept, run this again after changing one
+(and tools/make_bundle.py after that). Only the .lbi files (or the bundle) need to be on the Pico.
+
+Usage:
+    python tools/convert_images.py            # Convert figures/
+    python tools/convert_images.py <folder>   # Convert other folders
+"""
+
+import os
+import sys
+
+import host_stubs
+host_stubs.install()
+
+from image_file import convert_ppm
+
+def main(folders:list) -> None:
+    for folder in folders:
+        for path, _, names in os.walk(folder):
+            for name in sorted(names):
+                if not name.endswith(".ppm"):
+                    continue
+                source = os.path.join(path, name)
+                size = os.path.getsize(source)
+                try:
+                    converted = convert_ppm(source, remove=False)
+                except ValueError as e:
+                    print(f"{source}: skipped, {e}")
+                    continue
+                print(f"{converted}: {size} -> {os.path.getsize(converted)} bytes")
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or [os.path.join(host_stubs.ROOT, "figures")])
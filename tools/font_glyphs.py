@@ -0,0 +1,297 @@
+"""
+The drawing functions the Lightbox font was made of, the source of the glyphs in fonts/ (see make_font.py).
+The Pico draws text with bitmap_font.py, these are only used on the computer.
+"""
+
+# Defining functiones for showing numbers 0 to 9. (x,y = position most left bottom corner, color = color of number, size = x times original size)...
+def set_8(matrix_obj: object, x, y, color, size,show:bool=True):
+
+    # Fra nederst til øverst
+    matrix_obj.hline(x, y, 3+size, color) # Horisontal nede
+    matrix_obj.hline(x, y+2+size, 3+size, color) # Horisontal mitt
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til høyre
+    matrix_obj.vline(x, y, 3+size, color) # vertikal, venstre, nede
+    matrix_obj.vline(x, y+2+size, 3+size, color) # vertikal, venstre, oppe
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+    matrix_obj.vline(x+2+size, y+2+size, 3+size, color) # vertikal, høyre, oppe
+
+def set_0(matrix_obj: object, x, y, color, size, show:bool=True):
+    # Fra nederst til øverst
+    matrix_obj.hline(x, y, 3+size, color) # Horisontal nede
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til høyre
+    matrix_obj.vline(x, y, 3+size, color) # vertikal, venstre, nede
+    matrix_obj.vline(x, y+2+size, 3+size, color) # vertikal, venstre, oppe
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+    matrix_obj.vline(x+2+size, y+2+size, 3+size, color) # vertikal, høyre, oppe
+
+def set_1(matrix_obj: object, x, y, color, size,show:bool=True):
+    matrix_obj.vline(x+2+size, y, 5+size, color) # vertikal, høyre, nede
+    matrix_obj.set_pixel_color(x+1+size,y+3,color)
+
+def set_2(matrix_obj: object, x, y, color, size,show:bool=True):
+        # Fra nederst til øverst
+    matrix_obj.hline(x, y, 3+size, color) # Horisontal nede
+    matrix_obj.hline(x, y+2+size, 3+size, color) # Horisontal mitt
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til høyre
+    matrix_obj.vline(x, y, 3+size, color) # vertikal, venstre, nede
+
+    # Til venstre
+    matrix_obj.vline(x+2+size, y+2+size, 3+size, color) # vertikal, høyre, oppe
+
+def set_3(matrix_obj: object, x, y, color, size,show:bool=True):
+    # Fra nederst til øverst
+    matrix_obj.hline(x, y, 3+size, color) # Horisontal nede
+    matrix_obj.hline(x, y+2+size, 3+size, color) # Horisontal mitt
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+    matrix_obj.vline(x+2+size, y+2+size, 3+size, color) # vertikal, høyre, oppe
+
+def set_4(matrix_obj: object, x, y, color, size,show:bool=True):
+    # Fra nederst til øverst
+    matrix_obj.hline(x, y+2+size, 3+size, color) # Horisontal mitt
+
+    # Til høyre
+    matrix_obj.vline(x, y+2+size, 3+size, color) # vertikal, venstre, oppe
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+    matrix_obj.vline(x+2+size, y+2+size, 3+size, color) # vertikal, høyre, oppe
+
+def set_5(matrix_obj: object, x, y, color, size,show:bool=True):
+    # Fra nederst til øverst
+    matrix_obj.hline(x, y, 3+size, color) # Horisontal nede
+    matrix_obj.hline(x, y+2+size, 3+size, color) # Horisontal mitt
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til høyre
+    matrix_obj.vline(x, y+2+size, 3+size, color) # vertikal, venstre, oppe
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+
+def set_6(matrix_obj: object, x, y, color, size,show:bool=True):
+    # Fra nederst til øverst
+    matrix_obj.hline(x, y, 3+size, color) # Horisontal nede
+    matrix_obj.hline(x, y+2+size, 3+size, color) # Horisontal mitt
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til høyre
+    matrix_obj.vline(x, y, 3+size, color) # vertikal, venstre, nede
+    matrix_obj.vline(x, y+2+size, 3+size, color) # vertikal, venstre, oppe
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+
+def set_7(matrix_obj: object, x, y, color, size,show:bool=True):
+    # Fra nederst til øverst
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+    matrix_obj.vline(x+2+size, y+2+size, 3+size, color) # vertikal, høyre, oppe
+
+def set_9(matrix_obj: object, x, y, color, size,show:bool=True):
+        # Fra nederst til øverst
+    matrix_obj.hline(x, y+2+size, 3+size, color) # Horisontal mitt
+    matrix_obj.hline(x, y+4+size*2, 3+size, color) # Horisontal oppe
+
+    # Til høyre
+    matrix_obj.vline(x, y+2+size, 3+size, color) # vertikal, venstre, oppe
+    # Til venstre
+    matrix_obj.vline(x+2+size, y, 3+size, color) # vertikal, høyre, nede
+    matrix_obj.vline(x+2+size, y+2+size, 3+size, color) # vertikal, høyre, oppe
+
+
+### For displaying numbers
+def set_a(matrix_obj, x, y, color, size=0):
+    # set_vert_seg(x, y, color, 4+size, False)
+    # set_vert_seg(x+3+size, y, color, 4+size, False)
+
+    # set_horr_seg(x+1, y+2+size, color, 2+size, False)
+    # set_horr_seg(x+1, y+4+size, color, 2+size, False)
+
+    matrix_obj.vline(x, y, 4, color)
+    matrix_obj.vline(x+3, y, 4, color)
+
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+
+def set_b(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 2, color)
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+
+    matrix_obj.vline(x+3, y+1, 1, color)
+    matrix_obj.vline(x+3, y+3, 1, color)
+
+    matrix_obj.vline(x, y, 5, color)
+def set_c(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 2, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+
+    matrix_obj.vline(x, y+1, 3, color)
+
+    matrix_obj.vline(x+3, y+1, 1, color)
+    matrix_obj.vline(x+3, y+3, 1, color)
+def set_d(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 2, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+
+    matrix_obj.vline(x, y, 5, color)
+    matrix_obj.vline(x+3, y+1, 3, color)
+def set_e(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 3, color)
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.hline(x+1, y+4, 3, color)
+
+    matrix_obj.vline(x, y, 5, color)
+def set_f(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.hline(x+1, y+4, 3, color)
+
+    matrix_obj.vline(x, y, 5, color)
+def set_g(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 2, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+
+    matrix_obj.vline(x, y+1, 3, color)
+
+    matrix_obj.vline(x+3, y+1, 1, color)
+    matrix_obj.hline(x+2, y+2, 2, color)
+def set_h(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+    matrix_obj.vline(x+3, y, 5, color)
+
+    matrix_obj.hline(x+1, y+2, 2, color)
+def set_i(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+def set_j(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y+1, 1, color)
+    matrix_obj.vline(x+3, y+1, 4, color)
+
+    matrix_obj.hline(x+1, y, 2, color)
+def set_k(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+
+    matrix_obj.vline(x+3, y, 1, color)
+    matrix_obj.vline(x+2, y+1, 1, color)
+    matrix_obj.vline(x+1, y+2, 1, color)
+    matrix_obj.vline(x+2, y+3, 1, color)
+    matrix_obj.vline(x+3, y+4, 1, color)
+def set_l(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+    matrix_obj.hline(x+1, y, 3, color)
+def set_m(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+    matrix_obj.vline(x+3, y, 5, color)
+
+    matrix_obj.hline(x+1, y+3, 2, color)
+def set_n(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+    matrix_obj.vline(x+3, y, 5, color)
+
+    matrix_obj.hline(x+1, y+3, 1, color)
+    matrix_obj.hline(x+2, y+2, 1, color)
+def set_o(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 2, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+
+    matrix_obj.vline(x, y+1, 3, color)
+    matrix_obj.vline(x+3, y+1, 3, color)
+def set_p(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+
+    matrix_obj.hline(x+1, y+4, 2, color)
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.hline(x+2, y+3, 1, color)
+def set_q(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 2, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+
+    matrix_obj.vline(x, y+1, 3, color)
+    matrix_obj.vline(x+3, y+1, 3, color)
+
+    matrix_obj.vline(x+3, y, 1, color)
+    matrix_obj.vline(x+2, y+1, 1, color)
+def set_r(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+
+    matrix_obj.vline(x+2, y, 1, color)
+    matrix_obj.vline(x+1, y+1, 1, color)
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.vline(x+3, y+2, 3, color)
+    matrix_obj.hline(x+1, y+4, 2, color)
+def set_s(matrix_obj, x, y, color):
+    matrix_obj.hline(x, y, 3, color)
+    matrix_obj.hline(x+3, y+1, 1, color)
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.hline(x, y+3, 1, color)
+    matrix_obj.hline(x+1, y+4, 3, color)
+def set_t(matrix_obj, x, y, color):
+    matrix_obj.vline(x+1, y, 4, color)
+    matrix_obj.hline(x, y+4, 3, color)
+def set_u(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 2, color)
+
+    matrix_obj.vline(x, y+1, 4, color)
+    matrix_obj.vline(x+3, y+1, 4, color)
+def set_v(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y, 1, color)
+
+    matrix_obj.vline(x, y+1, 4, color)
+    matrix_obj.vline(x+2, y+1, 4, color)
+def set_w(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 5, color)
+    matrix_obj.vline(x+3, y, 5, color)
+
+    matrix_obj.hline(x+1, y+1, 2, color)
+def set_x(matrix_obj, x, y, color):
+    matrix_obj.vline(x, y, 2, color)
+    matrix_obj.vline(x+3, y, 2, color)
+
+    matrix_obj.hline(x+1, y+2, 2, color)
+
+    matrix_obj.vline(x, y+3, 2, color)
+    matrix_obj.vline(x+3, y+3, 2, color)
+def set_y(matrix_obj, x, y, color):
+    matrix_obj.vline(x+1, y, 3, color)
+    matrix_obj.vline(x, y+3, 2, color)
+    matrix_obj.vline(x+2, y+3, 2, color)
+def set_z(matrix_obj, x, y, color):
+    matrix_obj.hline(x, y, 4, color)
+    matrix_obj.hline(x, y+1, 1, color)
+    matrix_obj.hline(x+1, y+2, 2, color)
+    matrix_obj.hline(x+3, y+3, 1, color)
+    matrix_obj.hline(x, y+4, 4, color)
+def set_dot(matrix_obj, x, y, color):
+    matrix_obj.hline(x, y, 1, color)
+def set_colon(matrix_obj, x, y, color):
+    matrix_obj.set_pixel_color(x,y,color)
+    matrix_obj.set_pixel_color(x,y+4,color)
+def set_exclamation_mark(matrix_obj, x, y, color):
+    matrix_obj.set_pixel_color(x+1,y,color)
+    matrix_obj.vline(x+1, y+2, 3, color)
+def set_question_mark(matrix_obj, x, y, color):
+    matrix_obj.set_pixel_color(x+1,y,color)
+    matrix_obj.set_pixel_color(x+1,y+2,color)
+    matrix_obj.set_pixel_color(x+2,y+3,color)
+    matrix_obj.hline(x, y+4, 3, color)
+def set_hyphen(matrix_obj, x, y, color):
+    matrix_obj.hline(x+1, y+2, 2, color)
+
+# Glyph functions, tools/make_font.py draws them into the font files in /fonts
+SYMBOLS = {
+    "a": set_a, "b": set_b, "c": set_c, "d": set_d, "e": set_e, "f": set_f, "g": set_g,
+    "h": set_h, "i": set_i, "j": set_j, "k": set_k, "l": set_l, "m": set_m, "n": set_n,
+    "o": set_o, "p": set_p, "q": set_q, "r": set_r, "s": set_s, "t": set_t, "u": set_u,
+    "v": set_v, "w": set_w, "x": set_x, "y": set_y, "z": set_z,
+    ".": set_dot, ":": set_colon, "!": set_exclamation_mark, "?": set_question_mark, "-": set_hyphen,
+}
+DIGITS = (set_0, set_1, set_2, set_3, set_4, set_5, set_6, set_7, set_8, set_9)
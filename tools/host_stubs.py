@@ -0,0 +1,155 @@
+"""
+Minimal stand-ins for the MicroPython modules used by the Lightbox, so the code in lib/ can be
+imported and exercised with CPython on a normal computer (benchmarks, asset tools, recording).
+
+Usage:
+    import host_stubs
+    host_stubs.install()
+    from rgb_matrix import Matrix_fun
+"""
+
+import gc
+import os
+import sys
+import time
+import types
+import json
+
+# Path to the repository root (one level above this folder)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_installed = False
+
+class _Pin:
+    """ Stand-in for machine.Pin """
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self, pin, *args, **kwargs):
+        self.pin = pin
+        self._value = 0
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+
+    def irq(self, *args, **kwargs):
+        pass
+
+class _StateMachine:
+    """ Stand-in for rp2.StateMachine, counts the words pushed to the TX FIFO """
+
+    def __init__(self, *args, **kwargs):
+        self.words_put = 0
+        self.puts = 0
+
+    def active(self, value=None):
+        return 1
+
+    def put(self, value, shift=0):
+        self.puts += 1
+        try:
+            self.words_put += len(value)
+        except TypeError:
+            self.words_put += 1
+
+def _asm_pio(*args, **kwargs):
+    """ Stand-in for the rp2.asm_pio decorator, the PIO program is never assembled on the host """
+    def decorator(function):
+        return function
+    return decorator
+
+def _ticks_ms():
+    return int(time.perf_counter() * 1000)
+
+def _ticks_us():
+    return int(time.perf_counter() * 1_000_000)
+
+def _ticks_diff(a, b):
+    return a - b
+
+def _ticks_add(ticks, delta):
+    return ticks + delta
+
+def install() -> None:
+    """ Register the stub modules in sys.modules and put the repository on the import path """
+    global _installed
+    if _installed:
+        return
+
+    # machine
+    machine = types.ModuleType("machine")
+    machine.Pin = _Pin
+    machine.disable_irq = lambda: 0
+    machine.enable_irq = lambda state: None
+    machine.reset = lambda: None
+    machine.freq = lambda *args: 125_000_000
+
+    class RTC:
+        def datetime(self, value=None):
+            if value is None:
+                t = time.gmtime()
+                return (t[0], t[1], t[2], t[6], t[3], t[4], t[5], 0)
+    machine.RTC = RTC
+
+    class Timer:
+        PERIODIC = 1
+        ONE_SHOT = 0
+        def __init__(self, *args, **kwargs):
+            pass
+        def init(self, *args, **kwargs):
+            pass
+        def deinit(self):
+            pass
+    machine.Timer = Timer
+
+    # rp2
+    rp2 = types.ModuleType("rp2")
+    rp2.asm_pio = _asm_pio
+    rp2.StateMachine = _StateMachine
+    class PIO:
+        OUT_LOW = 0
+        OUT_HIGH = 1
+        SHIFT_LEFT = 0
+        SHIFT_RIGHT = 1
+    rp2.PIO = PIO
+
+    # utime, MicroPython's time module with the ticks functions
+    utime = types.ModuleType("utime")
+    for name in ("time", "sleep", "localtime", "gmtime", "mktime"):
+        setattr(utime, name, getattr(time, name))
+    utime.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    utime.sleep_us = lambda us: time.sleep(us / 1_000_000)
+    utime.ticks_ms = _ticks_ms
+    utime.ticks_us = _ticks_us
+    utime.ticks_diff = _ticks_diff
+    utime.ticks_add = _ticks_add
+
+    # gc.mem_free() only exists on MicroPython
+    if not hasattr(gc, "mem_free"):
+        gc.mem_free = lambda: 200_000
+
+    sys.modules.setdefault("machine", machine)
+    sys.modules.setdefault("rp2", rp2)
+    sys.modules.setdefault("utime", utime)
+    sys.modules.setdefault("uos", os)
+    sys.modules.setdefault("ujson", json)
+
+    # The firmware puts both the root folder and lib/ on the import path
+    for path in (os.path.join(ROOT, "lib"), ROOT):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    # Data folders are at the root of the Pico file system, here they are in the repository
+    import bitmap_font
+    bitmap_font.FONT_DIR = os.path.join(ROOT, "fonts")
+    import asset_bundle
+    asset_bundle.FIGURE_DIR = os.path.join(ROOT, "figures")
+    asset_bundle.BUNDLE_PATH = os.path.join(ROOT, "figures", "figures.lbb")
+
+    _installed = True
@@ -0,0 +1,61 @@
+"""
+Packs the figures into one asset bundle (format described in lib/asset_bundle.py).
+
+Every .lbi and PPM P3 file in figures/ and its subfolders becomes an asset named by its path without
+the extension ("weather_icons/sun"). Run it again after adding or changing a figure. With the bundle on
+the Pico, the separate files in figures/ are only needed for figures that are not in it.
+
+Usage:
+    python tools/make_bundle.py                    # Pack figures/ into figures/figures.lbb
+    python tools/make_bundle.py <folder> <bundle>  # Pack another folder
+"""
+
+import os
+import struct
+import sys
+
+import host_stubs
+host_stubs.install()
+
+from image_file import load_image, EXTENSION
+from asset_bundle import HEADER, HEADER_SIZE, ENTRY, ENTRY_SIZE
+
+def find_images(folder:str) -> dict:
+    """ Asset name: path of the image files under a folder, a .lbi file wins over a PPM file of the same name """
+    images = {}
+    for root, _, files in os.walk(folder):
+        for file in sorted(files, key=lambda file: file.endswith(EXTENSION)):
+            base, extension = os.path.splitext(file)
+            if extension not in (EXTENSION, ".ppm"):
+                continue
+            name = os.path.relpath(os.path.join(root, base), folder).replace(os.sep, "/")
+            images[name] = os.path.join(root, file)
+    return images
+
+def build(images:dict) -> bytes:
+    names = sorted(images)
+    loaded = [load_image(images[name]) for name in names]
+
+    index_size = sum(ENTRY_SIZE + len(name.encode()) for name in names)
+    offset = HEADER_SIZE + index_size
+    index = bytearray()
+    data = bytearray()
+    for name, image in zip(names, loaded):
+        encoded = name.encode()
+        index += struct.pack(ENTRY, offset + len(data), image.width, image.height, len(encoded)) + encoded
+        data += memoryview(image.words)[:image.width * image.height].cast("B")
+
+    return struct.pack(HEADER, b"LBB1", len(names), 0) + bytes(index) + bytes(data)
+
+def main(folder:str, path:str) -> None:
+    images = find_images(folder)
+    content = build(images)
+    with open(path, "wb") as file:
+        file.write(content)
+    print(f"{path}: {len(images)} figures, {len(content)} bytes")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        main(sys.argv[1], sys.argv[2])
+    else:
+        main(os.path.join(host_stubs.ROOT, "figures"), os.path.join(host_stubs.ROOT, "figures", "figures.lbb"))
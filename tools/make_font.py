@@ -0,0 +1,159 @@
+"""
+Generates the binary font files in fonts/ (format described in lib/bitmap_font.py).
+
+The glyphs are taken from the drawing functions in tools/font_glyphs.py, plus the extra characters below.
+font_5.lbf has every character, font_7.lbf to font_15.lbf have the digits at set_num() size 1 to 5.
+
+Usage:
+    python tools/make_font.py            # Write the files to fonts/
+    python tools/make_font.py <folder>   # Write the files to another folder
+"""
+
+import os
+import struct
+import sys
+
+import host_stubs
+host_stubs.install()
+
+from font_glyphs import SYMBOLS, DIGITS
+from bitmap_font import HEADER, ENTRY, WIDE
+
+# Characters that have no drawing function, rows from the top, "#" is a lit pixel.
+# Rows above the 5 row letters are accents, they are drawn above the line.
+EXTRA_GLYPHS = {
+    "æ": [".####",
+          "#.#..",
+          "#####",
+          "#.#..",
+          "#.###"],
+    "ø": [".###",
+          "#.##",
+          "#..#",
+          "##.#",
+          "###."],
+    "å": [".##.",
+          "....",
+          ".##.",
+          "#..#",
+          "####",
+          "#..#",
+          "#..#"],
+    "ä": ["#..#",
+          "....",
+          ".##.",
+          "#..#",
+          "####",
+          "#..#",
+          "#..#"],
+    "ö": ["#..#",
+          "....",
+          ".##.",
+          "#..#",
+          "#..#",
+          "#..#",
+          ".##."],
+    "ü": ["#..#",
+          "....",
+          "#..#",
+          "#..#",
+          "#..#",
+          "#..#",
+          ".##."],
+    ",": ["#",
+          "#"],
+    "'": ["#",
+          "#",
+          ".",
+          ".",
+          "."],
+    "/": ["...#",
+          "..#.",
+          ".##.",
+          ".#..",
+          "#..."],
+    "+": ["...",
+          ".#.",
+          "###",
+          ".#.",
+          "..."],
+}
+
+class _Mask_recorder:
+    """ Stands in for the matrix while a glyph function runs, records the pixels as column masks """
+
+    def __init__(self) -> None:
+        self.columns = {}
+
+    def set_pixel_color(self, x, y, color):
+        self.columns[x] = self.columns.get(x, 0) | (1 << y)
+
+    def hline(self, x, y, length, color):
+        for i in range(length):
+            self.set_pixel_color(x + i, y, color)
+
+    def vline(self, x, y, length, color):
+        for i in range(length):
+            self.set_pixel_color(x, y + i, color)
+
+    def masks(self) -> list:
+        return [self.columns.get(x, 0) for x in range(max(self.columns) + 1)]
+
+def record(function, *args) -> list:
+    """ Column masks of what a glyph function draws at (0, 0) """
+    recorder = _Mask_recorder()
+    function(recorder, 0, 0, (255, 255, 255), *args)
+    return recorder.masks()
+
+def parse(rows:list) -> list:
+    """ Column masks of a glyph drawn as text, the last row is the bottom row """
+    masks = [0] * max(len(row) for row in rows)
+    for y, row in enumerate(reversed(rows)):
+        for x, pixel in enumerate(row):
+            if pixel == "#":
+                masks[x] |= 1 << y
+    return masks
+
+def build(height:int, glyphs:dict) -> bytes:
+    """ Font file with glyphs {character: column masks}, upper case letters share the lower case data """
+    wide = any(mask > 0xff for masks in glyphs.values() for mask in masks)
+    column_size = 2 if wide else 1
+
+    entries = {}
+    data = bytearray()
+    for char, masks in glyphs.items():
+        entry = (len(data), len(masks))
+        for mask in masks:
+            data += mask.to_bytes(column_size, "little")
+        entries[ord(char)] = entry
+        if char.upper() != char and len(char.upper()) == 1:
+            entries.setdefault(ord(char.upper()), entry)
+
+    header = struct.pack(HEADER, b"LBF1", height, len(entries), WIDE if wide else 0)
+    index = b"".join(struct.pack(ENTRY, code, *entries[code]) for code in sorted(entries))
+    return header + index + bytes(data)
+
+def main(folder:str) -> None:
+    os.makedirs(folder, exist_ok=True)
+
+    # All characters at the normal size
+    glyphs = {char: record(SYMBOLS[char]) for char in SYMBOLS}
+    for num in range(10):
+        glyphs[str(num)] = record(DIGITS[num], 0, False)
+    for char in EXTRA_GLYPHS:
+        glyphs[char] = parse(EXTRA_GLYPHS[char])
+    files = {5: glyphs}
+
+    # Larger digits, size n is 5 + 2n rows
+    for size in range(1, 6):
+        files[5 + 2 * size] = {str(num): record(DIGITS[num], size, False) for num in range(10)}
+
+    for height in files:
+        path = os.path.join(folder, f"font_{height}.lbf")
+        content = build(height, files[height])
+        with open(path, "wb") as file:
+            file.write(content)
+        print(f"{path}: {len(files[height])} glyphs, {len(content)} bytes")
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else os.path.join(host_stubs.ROOT, "fonts"))
@@ -0,0 +1,70 @@
+"""
+Compiles the figures and fonts into Python modules of bytes constants (used by lib/frozen_assets.py).
+
+Writes frozen_figures.py (every figure in figures/, see make_bundle.py), frozen_fonts.py (every
+fonts/font_*.lbf) and manifest.py to the output folder. Frozen into the firmware the constants stay in
+flash and are drawn from there, build MicroPython for the Pico W with:
+
+    make -C ports/rp2 BOARD=RPI_PICO_W FROZEN_MANIFEST=<output folder>/manifest.py
+
+The modules can also be compiled with mpy-cross and copied to lib/, that saves parsing them on the
+Pico, but a .mpy file on the file system is loaded into RAM like any other module.
+
+Usage:
+    python tools/make_frozen.py            # Write the modules to build/frozen/
+    python tools/make_frozen.py <folder>   # Write the modules to another folder
+"""
+
+import glob
+import os
+import re
+import sys
+
+import host_stubs
+host_stubs.install()
+
+from image_file import load_image
+from make_bundle import find_images
+
+HEADER = "# Generated by tools/make_frozen.py, do not edit\n\n"
+
+MANIFEST = """# Freezes the Lightbox figures and fonts, generated by tools/make_frozen.py
+include("$(BOARD_DIR)/manifest.py")
+module("frozen_figures.py")
+module("frozen_fonts.py")
+"""
+
+def figures_module(folder:str) -> str:
+    images = find_images(folder)
+    lines = [HEADER, "# name: (width, height, pixels)\n", "FIGURES = {\n"]
+    for name in sorted(images):
+        image = load_image(images[name])
+        pixels = bytes(memoryview(image.words)[:image.width * image.height].cast("B"))
+        lines.append(f"    {name!r}: ({image.width}, {image.height}, {pixels!r}),\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+def fonts_module(folder:str) -> str:
+    lines = [HEADER, "# height: .lbf file\n", "FONTS = {\n"]
+    paths = {int(re.findall(r"\d+", os.path.basename(path))[0]): path for path in glob.glob(os.path.join(folder, "font_*.lbf"))}
+    for height in sorted(paths):
+        with open(paths[height], "rb") as file:
+            lines.append(f"    {height}: {file.read()!r},\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+def main(folder:str) -> None:
+    os.makedirs(folder, exist_ok=True)
+    modules = {
+        "frozen_figures.py": figures_module(os.path.join(host_stubs.ROOT, "figures")),
+        "frozen_fonts.py": fonts_module(os.path.join(host_stubs.ROOT, "fonts")),
+        "manifest.py": MANIFEST,
+    }
+    for name in modules:
+        path = os.path.join(folder, name)
+        with open(path, "w") as file:
+            file.write(modules[name])
+        print(f"{path}: {len(modules[name])} bytes")
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else os.path.join(host_stubs.ROOT, "build", "frozen"))
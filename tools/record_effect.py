@@ -0,0 +1,46 @@
+"""
+Records an effect of lib/rgb_matrix.py to a frame file (format described in lib/frame_file.py), so it
+can be played on the Lightbox with Matrix_fun.show_frames() instead of being computed there.
+
+Any function named <name>_effect(matrix, ...) can be recorded, random effects use a fixed seed so a
+recording can be made again.
+
+Usage:
+    python tools/record_effect.py <name> <file> [frames] [fps]
+    python tools/record_effect.py firework animations/firework.lfr 600 20
+"""
+
+import os
+import random
+import sys
+
+import host_stubs
+host_stubs.install()
+
+import rgb_matrix
+from rgb_matrix import Matrix_fun
+from frame_file import record, Frame_file
+
+def main(name:str, path:str, frames:int=None, fps:int=30) -> None:
+    effect = getattr(rgb_matrix, f"{name}_effect", None)
+    if effect is None:
+        names = sorted(key[:-7] for key in dir(rgb_matrix) if key.endswith("_effect"))
+        sys.exit(f"no effect {name}, recordable effects: {', '.join(names)}")
+
+    random.seed(0)
+    matrix = Matrix_fun(16, 16, 1)
+    matrix.run = True
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    count = record(matrix, effect(matrix), path, frames, fps)
+    recorded = Frame_file(path)
+    print(f"{path}: {count} frames, {recorded.duration_ms / 1000:.1f} s, {os.path.getsize(path)} bytes "
+          f"({os.path.getsize(path) // max(count, 1)} bytes per frame, {matrix.numpix * 3} uncompressed)")
+    recorded.close()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        sys.exit(__doc__)
+    main(sys.argv[1], sys.argv[2], *(int(arg) for arg in sys.argv[3:5]))